@@ -1,24 +1,44 @@
-from flask import Flask, render_template, request, send_file, jsonify
+from flask import Flask, Request, Response, render_template, request, send_file, jsonify
 from werkzeug.utils import secure_filename
+import io
 import os
+import shutil
 import tempfile
+import uuid
 import logging
 import pandas as pd
 from datetime import datetime
 import docx
 import re
 import socket
+import threading
 import PyPDF2
 import pdfplumber
 import phonenumbers
 from validate_email import validate_email
-import magic
 import json
+import zipfile
+from contextlib import nullcontext
+import time
+from exporters import EXPORT_FORMATS, write_contacts
+from job_queue import DONE, FAILED, JobQueue, JobStore
+from progress import ProgressReporter, read_progress
+
+class SpooledRequest(Request):
+    """בקשה ששומרת קבצים מועלים בזיכרון עד SPOOL_MAX_SIZE; רק קובץ גדול יותר עובר לקובץ זמני פרטי"""
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(max_size=app.config['SPOOL_MAX_SIZE'], mode='rb+')
 
 app = Flask(__name__)
+app.request_class = SpooledRequest
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max-limit
+app.config['SPOOL_MAX_SIZE'] = int(os.environ.get('SPOOL_MAX_SIZE', 16 * 1024 * 1024))
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['DOWNLOAD_FOLDER'] = 'downloads'
+app.config['JOBS_FOLDER'] = 'jobs'
+app.config['JOB_WORKERS'] = int(os.environ.get('JOB_WORKERS', 2))
+app.config['MAX_CONCURRENT_UPLOADS'] = int(os.environ.get('MAX_CONCURRENT_UPLOADS', 4))
 
 # הגדרת לוגר
 logging.basicConfig(
@@ -37,6 +57,14 @@ os.makedirs(app.config['DOWNLOAD_FOLDER'], exist_ok=True)
 
 ALLOWED_EXTENSIONS = {'xlsx', 'xls', 'doc', 'docx', 'pdf', 'csv'}
 
+# חתימות בתחילת הקובץ: PDF, ZIP (קבצי Office חדשים) ו-OLE2 (קבצי Office ישנים)
+PDF_SIGNATURE = b'%PDF'
+ZIP_SIGNATURE = b'PK\x03\x04'
+OLE_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+# ערכים שנחשבים כתא ריק
+EMPTY_VALUES = ['nan', 'none', 'null', '', 'חסר', '-']
+
 # תבניות חיפוש
 PATTERNS = {
     'email': r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}',
@@ -59,6 +87,25 @@ PATTERNS = {
     ]
 }
 
+# מגביל את מספר ההעלאות שתהליך שרת אחד מעבד בו-זמנית; כל תהליך מקבל עותק משלו אחרי fork
+upload_slots = threading.BoundedSemaphore(app.config['MAX_CONCURRENT_UPLOADS'])
+
+def warm_up():
+    """טוען מראש את מפענחי הקבצים ומהדר את התבניות, לפני שתהליכי השרת מתפצלים (fork)"""
+    # חילוץ קטן מכל סוג מהדר את תבניות הטקסט והטלפון, וטוען את המודולים שנטענים רק בשימוש הראשון
+    # (מנועי ה-Excel של pandas, תבנית ה-Word של python-docx)
+    extract_contacts_from_text('משה כהן 050-1234567 moshe@example.com רחוב הרצל 5', 'warm-up')
+    clean_phone('050-1234567')
+    
+    buffer = io.BytesIO()
+    pd.DataFrame({'שם': ['משה כהן'], 'טלפון': ['050-1234567']}).to_excel(buffer, index=False)
+    extract_from_excel(buffer, 'warm-up')
+    
+    buffer = io.BytesIO()
+    docx.Document().save(buffer)
+    extract_from_word(buffer, 'warm-up')
+    logger.info("המפענחים והתבניות נטענו מראש")
+
 def allowed_file(filename):
     """בודק אם הקובץ מורשה"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -75,78 +122,267 @@ def index():
 
 @app.route('/extract', methods=['POST'])
 def extract_contacts():
-    """חילוץ אנשי קשר מקבצים"""
-    if 'files' not in request.files:
-        return jsonify({'success': False, 'error': 'לא נבחרו קבצים'})
-    
-    files = request.files.getlist('files')
-    all_contacts = []
-    
+    """חילוץ אנשי קשר מקבצים - מחזיר מיד מזהה עבודה, או את התוצאה עצמה עם sync=1"""
+    # בקשה גדולה מהמותר נדחית לפי הכותרת, לפני שקוראים ממנה בית אחד
+    if request.content_length is not None and request.content_length > app.config['MAX_CONTENT_LENGTH']:
+        return jsonify({'success': False, 'error': 'הקבצים גדולים מדי'}), 413
+    
+    # המקום נתפס לפני הגישה ל-request.files או ל-request.values: הגישה הראשונה קוראת את כל גוף
+    # הבקשה ושומרת אותו, ולכן רק כך המגבלה חלה גם על קבלת ההעלאות ולא רק על עיבודן.
+    # תהליך שכבר מקבל את מספר ההעלאות המרבי מחזיר 503, והלקוח מנסה שוב מאוחר יותר
+    if not upload_slots.acquire(blocking=False):
+        logger.warning("יותר מדי העלאות במקביל, הבקשה נדחתה")
+        response = jsonify({'success': False, 'error': 'השרת עמוס, נסה שוב בעוד מספר שניות'})
+        response.headers['Retry-After'] = '5'
+        return response, 503
     try:
+        if 'files' not in request.files:
+            return jsonify({'success': False, 'error': 'לא נבחרו קבצים'})
+        
+        files = request.files.getlist('files')
+        
+        # פורמט קובץ התוצאה: xlsx (ברירת המחדל), csv, jsonl או parquet
+        export_format = request.values.get('format', 'xlsx').lower()
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({'success': False, 'error': f'פורמט לא נתמך: {export_format}'}), 400
+        
+        if request.args.get('sync') == '1':
+            return extract_contacts_sync(files, export_format)
+        return submit_extraction_job(files, export_format)
+    finally:
+        upload_slots.release()
+
+def submit_extraction_job(files, export_format='xlsx'):
+    """שומר את הקבצים לתיקיית העבודה ומוסיף עבודה לתור"""
+    try:
+        # כל עבודה שומרת את הקבצים בתיקייה משלה עד שהעבודה מסתיימת
+        job_id = uuid.uuid4().hex
+        job_dir = os.path.join(app.config['UPLOAD_FOLDER'], job_id)
+        os.makedirs(job_dir, exist_ok=True)
+        entries = []
         for file in files:
             if file and allowed_file(file.filename):
                 filename = secure_filename(file.filename)
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+                filepath = os.path.join(job_dir, filename)
                 file.save(filepath)
-                
-                logger.info(f"מעבד קובץ: {filename}")
-                
-                # זיהוי סוג הקובץ
-                file_type = magic.from_file(filepath, mime=True)
-                contacts = []
-                
-                if 'pdf' in file_type:
-                    contacts = extract_from_pdf(filepath, filename)
-                elif 'word' in file_type or 'officedocument' in file_type:
-                    contacts = extract_from_word(filepath, filename)
-                elif 'excel' in file_type or 'spreadsheet' in file_type:
-                    contacts = extract_from_excel(filepath, filename)
-                
-                all_contacts.extend(contacts)
-                os.remove(filepath)
-                logger.info(f"קובץ נמחק: {filename}")
+                entries.append({'path': filepath, 'name': filename})
         
-        if not all_contacts:
-            return jsonify({'success': False, 'error': 'לא נמצאו אנשי קשר בקבצים'})
-        
-        unique_contacts = remove_duplicates(all_contacts)
-        output_file = create_excel_output(unique_contacts)
+        if not entries:
+            os.rmdir(job_dir)
+            return jsonify({'success': False, 'error': 'לא נבחרו קבצים'})
         
+        job = job_queue.submit(entries, job_id, options={'format': export_format})
         return jsonify({
             'success': True,
-            'contacts': unique_contacts[:5],
-            'total': len(unique_contacts),
-            'download_url': f'/download/{os.path.basename(output_file)}'
-        })
+            'job_id': job['id'],
+            'status': job['status'],
+            'status_url': f"/jobs/{job['id']}"
+        }), 202
+        
+    except Exception as e:
+        logger.error(f"שגיאה ביצירת עבודה: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)})
+
+def extract_contacts_sync(files, export_format='xlsx'):
+    """חילוץ אנשי קשר בתוך הבקשה עצמה, ישירות מהקבצים שהועלו (בזיכרון, או בקובץ זמני פרטי אם הם גדולים)"""
+    try:
+        entries = []
+        for file in files:
+            if file and allowed_file(file.filename):
+                entries.append((file.stream, secure_filename(file.filename)))
+        
+        return jsonify(process_files(entries, export_format=export_format))
         
     except Exception as e:
         logger.error(f"שגיאה בעיבוד הקבצים: {str(e)}")
         return jsonify({'success': False, 'error': str(e)})
 
-def extract_text_from_pdf(filepath):
+def detect_file_type(source, filename):
+    """זיהוי סוג הקובץ מהבתים הראשונים שלו: 'pdf', 'word', 'excel' או None.
+    source הוא נתיב או קובץ פתוח; המיקום בקובץ הפתוח נשמר"""
+    if isinstance(source, str):
+        with open(source, 'rb') as stream:
+            return _sniff_file_type(stream, filename)
+    position = source.tell()
+    try:
+        source.seek(0)
+        return _sniff_file_type(source, filename)
+    finally:
+        source.seek(position)
+
+def _sniff_file_type(stream, filename):
+    head = stream.read(len(OLE_SIGNATURE))
+    if head.startswith(PDF_SIGNATURE):
+        return 'pdf'
+    if head.startswith(ZIP_SIGNATURE):
+        # Word ו-Excel הם שניהם ZIP - מבחינים לפי החלק הראשי בתוכן הארכיון
+        stream.seek(0)
+        try:
+            names = set(zipfile.ZipFile(stream).namelist())
+        except zipfile.BadZipFile:
+            return None
+        if 'word/document.xml' in names:
+            return 'word'
+        if 'xl/workbook.xml' in names:
+            return 'excel'
+        return None
+    if head == OLE_SIGNATURE:
+        # קבצי doc ו-xls ישנים חולקים את אותה חתימה
+        return {'doc': 'word', 'xls': 'excel'}.get(filename.rsplit('.', 1)[-1].lower())
+    return None
+
+def process_files(entries, output_filename=None, progress=None, export_format='xlsx'):
+    """מחלץ אנשי קשר מרשימת (נתיב או קובץ פתוח, שם קובץ), מסיר כפילויות ויוצר את קובץ התוצאה"""
+    all_contacts = []
+    for source, filename in entries:
+        logger.info(f"מעבד קובץ: {filename}")
+        if progress:
+            progress.start_file(filename)
+        
+        # זיהוי סוג הקובץ
+        file_type = detect_file_type(source, filename)
+        contacts = []
+        
+        if file_type == 'pdf':
+            contacts = extract_from_pdf(source, filename, progress)
+        elif file_type == 'word':
+            contacts = extract_from_word(source, filename)
+        elif file_type == 'excel':
+            contacts = extract_from_excel(source, filename, progress)
+        else:
+            logger.warning(f"סוג הקובץ {filename} לא זוהה")
+        
+        all_contacts.extend(contacts)
+        if progress:
+            progress.finish_file(len(contacts))
+    
+    if not all_contacts:
+        return {'success': False, 'error': 'לא נמצאו אנשי קשר בקבצים'}
+    
+    unique_contacts = remove_duplicates(all_contacts)
+    output_file = create_output(unique_contacts, output_filename, export_format)
+    
+    return {
+        'success': True,
+        'contacts': unique_contacts[:5],
+        'total': len(unique_contacts),
+        'download_url': f'/download/{os.path.basename(output_file)}'
+    }
+
+def run_extraction_job(job):
+    """מטפל העבודות (רץ בתהליך עבודה): מחלץ את קבצי העבודה ומוחק אותם בסוף"""
+    entries = [(entry['path'], entry['name']) for entry in job['files']]
+    export_format = job.get('options', {}).get('format', 'xlsx')
+    progress = ProgressReporter(job_store.progress_path(job['id']), len(entries))
+    try:
+        return process_files(entries, f"contacts_{job['id']}.{export_format}", progress, export_format)
+    finally:
+        # בקריסה של התהליך לא מגיעים לכאן, והקבצים נשארים לניסיון הבא
+        shutil.rmtree(os.path.join(app.config['UPLOAD_FOLDER'], job['id']), ignore_errors=True)
+        logger.info(f"קבצי העבודה {job['id']} נמחקו")
+
+# תור עבודות החילוץ - המצב נשמר בתיקיית העבודות ושורד קריסה
+job_store = JobStore(app.config['JOBS_FOLDER'])
+job_queue = JobQueue(job_store, run_extraction_job, workers=app.config['JOB_WORKERS'])
+JOB_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+# זרם ההתקדמות: בדיקת קובץ ההתקדמות כל חצי שנייה, והודעת שמירת חיבור כל 15 שניות
+SSE_POLL_INTERVAL = 0.5
+SSE_KEEPALIVE = 15
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    """מצב עבודת חילוץ, ותוצאת החילוץ כשהיא מסתיימת"""
+    if not JOB_ID_PATTERN.fullmatch(job_id):
+        return jsonify({'success': False, 'error': 'מזהה עבודה לא תקין'}), 404
+    
+    job_queue.start()
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'העבודה לא נמצאה'}), 404
+    
+    response = {'success': True, 'job_id': job_id, 'status': job['status'], 'attempts': job['attempts']}
+    if job['status'] == DONE:
+        response.update(job['result'])
+    elif job['status'] == FAILED:
+        response.update(success=False, error=job.get('error'))
+    return jsonify(response)
+
+@app.route('/jobs/<job_id>/events')
+def job_events(job_id):
+    """זרם אירועים (Server-Sent Events) עם התקדמות העבודה עד לסיומה"""
+    if not JOB_ID_PATTERN.fullmatch(job_id):
+        return jsonify({'success': False, 'error': 'מזהה עבודה לא תקין'}), 404
+    
+    job_queue.start()
+    if job_store.get(job_id) is None:
+        return jsonify({'success': False, 'error': 'העבודה לא נמצאה'}), 404
+    
+    def stream():
+        last = None
+        last_sent = time.time()
+        while True:
+            job = job_store.get(job_id)
+            if job is None:
+                return
+            
+            # אירוע נשלח רק כשהמצב או ההתקדמות השתנו
+            progress = read_progress(job_store.progress_path(job_id)) or {}
+            current = (job['status'], progress.get('seq'))
+            if current != last:
+                last = current
+                last_sent = time.time()
+                yield sse_event('progress', dict(progress, status=job['status']))
+            
+            if job['status'] == DONE:
+                yield sse_event('done', job['result'])
+                return
+            if job['status'] == FAILED:
+                yield sse_event('failed', {'success': False, 'error': job.get('error')})
+                return
+            
+            # הערה ריקה מדי פעם שומרת את החיבור פתוח דרך פרוקסים
+            if time.time() - last_sent > SSE_KEEPALIVE:
+                last_sent = time.time()
+                yield ': keepalive\n\n'
+            time.sleep(SSE_POLL_INTERVAL)
+    
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+def sse_event(event, data):
+    """אירוע SSE בודד"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def extract_text_from_pdf(filepath, progress=None):
     """חילוץ טקסט מקובץ PDF"""
     text = ""
     try:
         # ניסיון ראשון עם pdfplumber
         with pdfplumber.open(filepath) as pdf:
-            for page in pdf.pages:
+            for number, page in enumerate(pdf.pages):
+                if progress:
+                    progress.step('page', str(number + 1), number, len(pdf.pages))
                 text += page.extract_text() or ""
     except Exception as e:
         logger.warning(f"שגיאה בחילוץ טקסט עם pdfplumber: {str(e)}")
         try:
             # ניסיון שני עם PyPDF2
-            with open(filepath, 'rb') as file:
+            with open(filepath, 'rb') if isinstance(filepath, str) else nullcontext(filepath) as file:
+                file.seek(0)
                 reader = PyPDF2.PdfReader(file)
-                for page in reader.pages:
+                for number, page in enumerate(reader.pages):
+                    if progress:
+                        progress.step('page', str(number + 1), number, len(reader.pages))
                     text += page.extract_text() or ""
         except Exception as e:
             logger.error(f"שגיאה בחילוץ טקסט עם PyPDF2: {str(e)}")
     
     return text
 
-def extract_from_pdf(filepath, source_filename):
+def extract_from_pdf(filepath, source_filename, progress=None):
     """חילוץ אנשי קשר מקובץ PDF"""
-    text = extract_text_from_pdf(filepath)
+    text = extract_text_from_pdf(filepath, progress)
     return extract_contacts_from_text(text, source_filename)
 
 def extract_from_word(filepath, source_filename):
@@ -165,77 +401,47 @@ def extract_from_word(filepath, source_filename):
         logger.error(f"שגיאה בחילוץ מקובץ Word: {str(e)}")
         return []
 
-def extract_from_excel(filepath, source_filename):
+def extract_from_excel(filepath, source_filename, progress=None):
     """חילוץ אנשי קשר מקובץ Excel"""
     contacts = []
     try:
-        # קריאת שמות הגליונות
-        xlsx = pd.ExcelFile(filepath)
-        sheet_names = xlsx.sheet_names
-        
-        for sheet_name in sheet_names:
-            logger.info(f"מעבד גליון: {sheet_name} מתוך הקובץ {source_filename}")
-            
-            try:
-                # קריאת הגליון
-                df = pd.read_excel(filepath, sheet_name=sheet_name)
-                
-                # דילוג על גליונות ריקים
-                if df.empty:
-                    logger.info(f"גליון ריק: {sheet_name}")
-                    continue
+        # פתיחת הקובץ פעם אחת - כל הגליונות מפוענחים מאותו אובייקט
+        with pd.ExcelFile(filepath) as xlsx:
+            for index, sheet_name in enumerate(xlsx.sheet_names):
+                logger.info(f"מעבד גליון: {sheet_name} מתוך הקובץ {source_filename}")
+                if progress:
+                    progress.step('sheet', sheet_name, index, len(xlsx.sheet_names), len(contacts))
                 
-                # המרת כל העמודות למחרוזות
-                df = df.astype(str)
-                
-                # מיפוי עמודות ידני לפי שמות מוכרים
-                column_mapping = {}
-                for col in df.columns:
-                    col_lower = str(col).lower().strip()
-                    if col in ['פרטי', 'שם', 'שם מלא', 'שם פרטי']:
-                        column_mapping['name'] = col
-                    elif col in ['טלפון', 'נייד', 'טלפון נייד']:
-                        column_mapping['phone'] = col
-                    elif col in ['אי-מייל', 'מייל', 'אימייל', 'דואר אלקטרוני']:
-                        column_mapping['email'] = col
-                    elif col in ['עיר', 'כתובת', 'רחוב', 'מען']:
-                        column_mapping['address'] = col
-                
-                logger.info(f"נמצאו העמודות הבאות בגליון {sheet_name}: {column_mapping}")
-                
-                # עיבוד כל שורה
-                for idx, row in df.iterrows():
-                    try:
-                        # חילוץ נתונים
-                        name = str(row[column_mapping.get('name', '')]).strip() if 'name' in column_mapping else ''
-                        phone = str(row[column_mapping.get('phone', '')]).strip() if 'phone' in column_mapping else ''
-                        email = str(row[column_mapping.get('email', '')]).strip() if 'email' in column_mapping else ''
-                        address = str(row[column_mapping.get('address', '')]).strip() if 'address' in column_mapping else ''
-                        
-                        # ניקוי הטלפון
-                        phone = clean_phone(phone)
-                        
-                        # יצירת איש קשר
-                        contact = {
-                            'name': name,
-                            'phone': phone,
-                            'email': email,
-                            'address': address,
-                            'source': f"{source_filename} - {sheet_name}"
-                        }
-                        
-                        if is_valid_contact(contact):
-                            contacts.append(contact)
-                            if len(contacts) % 100 == 0:
-                                logger.info(f"נמצאו {len(contacts)} אנשי קשר עד כה בקובץ {source_filename}")
+                try:
+                    # קריאת הגליון
+                    df = xlsx.parse(sheet_name)
                     
-                    except Exception as row_error:
-                        logger.warning(f"שגיאה בעיבוד שורה {idx} בגליון {sheet_name}: {str(row_error)}")
+                    # דילוג על גליונות ריקים
+                    if df.empty:
+                        logger.info(f"גליון ריק: {sheet_name}")
                         continue
-            
-            except Exception as sheet_error:
-                logger.error(f"שגיאה בעיבוד גליון {sheet_name}: {str(sheet_error)}")
-                continue
+                    
+                    # מיפוי עמודות ידני לפי שמות מוכרים
+                    column_mapping = {}
+                    for col in df.columns:
+                        if col in ['פרטי', 'שם', 'שם מלא', 'שם פרטי']:
+                            column_mapping['name'] = col
+                        elif col in ['טלפון', 'נייד', 'טלפון נייד']:
+                            column_mapping['phone'] = col
+                        elif col in ['אי-מייל', 'מייל', 'אימייל', 'דואר אלקטרוני']:
+                            column_mapping['email'] = col
+                        elif col in ['עיר', 'כתובת', 'רחוב', 'מען']:
+                            column_mapping['address'] = col
+                    
+                    logger.info(f"נמצאו העמודות הבאות בגליון {sheet_name}: {column_mapping}")
+                    
+                    sheet_contacts = extract_contacts_from_frame(df, column_mapping, f"{source_filename} - {sheet_name}")
+                    contacts.extend(sheet_contacts)
+                    logger.info(f"נמצאו {len(sheet_contacts)} אנשי קשר בגליון {sheet_name}")
+                
+                except Exception as sheet_error:
+                    logger.error(f"שגיאה בעיבוד גליון {sheet_name}: {str(sheet_error)}")
+                    continue
     
     except Exception as e:
         logger.error(f"שגיאה בחילוץ מקובץ Excel {source_filename}: {str(e)}")
@@ -244,6 +450,24 @@ def extract_from_excel(filepath, source_filename):
     logger.info(f"נמצאו {len(contacts)} אנשי קשר בקובץ {source_filename}")
     return contacts
 
+def extract_contacts_from_frame(df, column_mapping, source):
+    """בניית אנשי קשר מגליון שלם בפעולות על עמודות, בלי מעבר שורה אחר שורה"""
+    fields = {}
+    for field in ['name', 'phone', 'email', 'address']:
+        if field in column_mapping:
+            fields[field] = df[column_mapping[field]].astype(str).str.strip()
+        else:
+            fields[field] = pd.Series('', index=df.index, dtype=object)
+    
+    # ניקוי הטלפונים בעמודה אחת
+    fields['phone'] = clean_phone_column(fields['phone'])
+    
+    frame = pd.DataFrame(fields)
+    frame['source'] = source
+    
+    # סינון אנשי קשר לא תקינים במסכה בוליאנית אחת
+    return frame[valid_contacts_mask(frame)].to_dict('records')
+
 def extract_contacts_from_text(text, source_filename):
     """חילוץ אנשי קשר מטקסט"""
     contacts = []
@@ -324,7 +548,7 @@ def extract_contacts_from_text(text, source_filename):
 
 def clean_phone(phone):
     """ניקוי מספר טלפון"""
-    if not phone or str(phone).lower() in ['nan', 'none', 'null', '', 'חסר', '-']:
+    if not phone or str(phone).lower() in EMPTY_VALUES:
         return ''
     
     # הסרת רווחים מיותרים
@@ -359,6 +583,35 @@ def clean_phone(phone):
     else:  # קווי
         return f"{phone[:2]}-{phone[2:]}"
 
+def clean_phone_column(phones):
+    """ניקוי עמודת טלפונים שלמה - אותה תוצאה כמו clean_phone לכל תא"""
+    phones = phones.astype(str).str.strip()
+    empty = phones.str.lower().isin(EMPTY_VALUES)
+    
+    # מספרים שכבר בפורמט תקין (XXX-XXXXXXX) נשארים כמו שהם
+    formatted = phones.str.fullmatch(r'\d{3}-\d{7}|\d{2}-\d{7}')
+    
+    # הסרת כל התווים שאינם ספרות וטיפול בקידומת בינלאומית
+    digits = phones.str.replace(r'[^\d]', '', regex=True)
+    international = digits.str.startswith('972')
+    digits = digits.where(~international, '0' + digits.str.slice(3))
+    digits = digits.where(digits.str.startswith('0'), '0' + digits)
+    
+    # בדיקה שזה מספר טלפון ישראלי תקין (גם בדיקת האורך)
+    valid = digits.str.fullmatch(r'0(([23489]\d{7})|([57]\d{8}))')
+    
+    # החזרת המספר בפורמט עם מקף - נייד אחרי 3 ספרות, קווי אחרי 2
+    mobile = digits.str.len() == 10
+    dashed = (digits.str.slice(0, 3) + '-' + digits.str.slice(3)).where(
+        mobile, digits.str.slice(0, 2) + '-' + digits.str.slice(2)
+    )
+    
+    cleaned = pd.Series('', index=phones.index, dtype=object)
+    cleaned[valid] = dashed[valid]
+    cleaned[formatted] = phones[formatted]
+    cleaned[empty] = ''
+    return cleaned
+
 def is_valid_phone(phone):
     """בדיקת תקינות מספר טלפון"""
     if not phone:
@@ -381,7 +634,7 @@ def is_valid_contact(contact):
     name = contact['name'].strip()
     
     # בדיקות שם
-    if not name or name.lower() in ['nan', 'none', 'null', '', 'חסר', '-']:
+    if not name or name.lower() in EMPTY_VALUES:
         return False
     
     # בדיקת אורך מינימלי לשם
@@ -398,12 +651,34 @@ def is_valid_contact(contact):
         email and 
         '@' in email and 
         '.' in email.split('@')[1] and 
-        email not in ['nan', 'none', 'null', '', 'חסר', '-']
+        email not in EMPTY_VALUES
     )
     
     # מספיק שיש או טלפון או אימייל תקין
     return has_valid_phone or has_valid_email
 
+def valid_contacts_mask(frame):
+    """מסכה בוליאנית של אנשי הקשר התקינים - אותה בדיקה כמו is_valid_contact לכל שורה"""
+    # בדיקות שם
+    name = frame['name'].str.strip()
+    valid_name = ~name.str.lower().isin(EMPTY_VALUES) & (name.str.len() >= 2)
+    
+    # בדיקת טלפון
+    phone = frame['phone']
+    has_valid_phone = (phone != '-') & (phone.str.len() >= 9)
+    
+    # בדיקת אימייל - חייבת להיות נקודה אחרי ה-@
+    email = frame['email'].str.strip().str.lower()
+    domain = email.str.split('@').str.get(1).fillna('')
+    has_valid_email = (
+        email.str.contains('@', regex=False) &
+        domain.str.contains('.', regex=False) &
+        ~email.isin(EMPTY_VALUES)
+    )
+    
+    # מספיק שיש או טלפון או אימייל תקין
+    return valid_name & (has_valid_phone | has_valid_email)
+
 def remove_duplicates(contacts):
     """הסרת כפילויות מרשימת אנשי הקשר"""
     unique_contacts = []
@@ -424,49 +699,11 @@ def remove_duplicates(contacts):
     
     return unique_contacts
 
-def create_excel_output(contacts):
-    """יצירת קובץ Excel מעוצב עם אנשי הקשר"""
-    filename = f'contacts_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+def create_output(contacts, filename=None, export_format='xlsx'):
+    """יצירת קובץ התוצאה עם אנשי הקשר - Excel מעוצב, CSV, JSON Lines או Parquet, נכתב ישירות מהרשימה"""
+    filename = filename or f'contacts_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{export_format}'
     output_path = os.path.join(app.config['DOWNLOAD_FOLDER'], filename)
-    
-    df = pd.DataFrame(contacts)
-    df = df.rename(columns={
-        'name': 'שם',
-        'phone': 'טלפון',
-        'email': 'אימייל',
-        'address': 'כתובת',
-        'source': 'מקור'
-    })
-    
-    writer = pd.ExcelWriter(output_path, engine='xlsxwriter')
-    df.to_excel(writer, index=False, sheet_name='אנשי קשר')
-    
-    # עיצוב הקובץ
-    workbook = writer.book
-    worksheet = writer.sheets['אנשי קשר']
-    
-    header_format = workbook.add_format({
-        'bold': True,
-        'align': 'center',
-        'valign': 'vcenter',
-        'bg_color': '#4F81BD',
-        'font_color': 'white',
-        'border': 1
-    })
-    
-    cell_format = workbook.add_format({
-        'align': 'right',
-        'valign': 'vcenter',
-        'border': 1
-    })
-    
-    # הגדרת רוחב עמודות ועיצוב
-    for col_num, value in enumerate(df.columns.values):
-        worksheet.write(0, col_num, value, header_format)
-        max_length = max(df[value].astype(str).apply(len).max(), len(value))
-        worksheet.set_column(col_num, col_num, max_length + 2, cell_format)
-    
-    writer.close()
+    write_contacts(contacts, output_path, export_format)
     return output_path
 
 @app.route('/download/<filename>')
@@ -476,7 +713,7 @@ def download_file(filename):
         return send_file(
             os.path.join(app.config['DOWNLOAD_FOLDER'], filename),
             as_attachment=True,
-            download_name=f'אנשי_קשר_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+            download_name=f'אנשי_קשר_{datetime.now().strftime("%Y%m%d_%H%M%S")}{os.path.splitext(filename)[1]}'
         )
     except Exception as e:
         logger.error(f"שגיאה בהורדת הקובץ: {str(e)}")
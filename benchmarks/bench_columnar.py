@@ -0,0 +1,71 @@
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contact_extractor import ContactExtractor
+from corpus import random_email, random_phone
+
+
+def generate_columns(count, seed=7):
+    """עמודות טלפון ומייל כמו בגיליון רשימת משתתפים, כולל תאים ריקים וטקסט חופשי"""
+    rng = random.Random(seed)
+    phones, emails = [], []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.8:
+            phones.append(random_phone(rng))
+        elif roll < 0.9:
+            phones.append(f"נייד: {random_phone(rng)}, בבית: {random_phone(rng)}")
+        else:
+            phones.append("")
+        emails.append(random_email(rng) if rng.random() < 0.7 else "")
+    return phones, emails
+
+
+def per_cell(extractor, phones, emails):
+    """החילוץ הקודם: כל תא בנפרד דרך _extract_phones / _extract_emails"""
+    extractor.analyzer.reset()
+    found_phones = [extractor._extract_phones(cell) if cell else [] for cell in phones]
+    found_emails = [extractor._extract_emails(cell) if cell else [] for cell in emails]
+    return found_phones, found_emails
+
+
+def columnar(extractor, phones, emails):
+    """החילוץ העמודתי: כל עמודה בבת אחת"""
+    extractor.analyzer.reset()
+    found_phones = extractor.columnar.phone_column(phones)
+    found_emails = extractor.columnar.email_column(emails)
+    return found_phones, found_emails
+
+
+def measure(func, extractor, phones, emails, repeat=3):
+    """מחזיר את התוצאה ואת הזמן הטוב ביותר לשורה במיקרו-שניות"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(extractor, phones, emails)
+        best = min(best, time.perf_counter() - start)
+    return result, best / len(phones) * 1e6
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    phones, emails = generate_columns(count)
+    extractor = ContactExtractor()
+
+    legacy_result, legacy_time = measure(per_cell, extractor, phones, emails)
+    new_result, new_time = measure(columnar, extractor, phones, emails)
+
+    print(f"{count:,} שורות (עמודת טלפון ועמודת מייל)")
+    print(f"תא אחר תא: {legacy_time:.2f} מיקרו-שניות לשורה")
+    print(f"עמודתי:     {new_time:.2f} מיקרו-שניות לשורה (x{legacy_time / new_time:.1f})")
+    print(f"תוצאות זהות: {legacy_result == new_result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import gc
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contact_extractor import Contact
+from corpus import FIRST_NAMES, LAST_NAMES, random_email, random_phone
+
+
+class LegacyContact:
+    """מבנה איש הקשר לפני __slots__, לצורך השוואה (אותם שדות, בלי הלוגיקה)"""
+
+    def __init__(self, name=None, phone=None, email=None, address=None, source_file=None):
+        self.name = name
+        self.phones = {phone} if phone else set()
+        self.emails = {email} if email else set()
+        self.addresses = {address} if address else set()
+        self.source_file = source_file
+        self.role = None
+        self.logger = logging.getLogger(__name__)
+
+    def add_phone(self, phone):
+        self.phones.add(phone)
+
+    def add_email(self, email):
+        self.emails.add(email)
+
+
+def build(contact_class, count, seed=1):
+    """יוצר אנשי קשר כמו בחילוץ מגיליון: מחרוזת מקור חדשה לכל שורה"""
+    rng = random.Random(seed)
+    contacts = []
+    for row in range(count):
+        contact = contact_class(name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                                source_file=f"דוגמאות/רשימת משתתפים.xlsx - גיליון{row % 3}")
+        contact.add_phone(random_phone(rng).replace('(', '').replace(')', ''))
+        if rng.random() < 0.5:
+            contact.add_email(random_email(rng))
+        contacts.append(contact)
+    return contacts
+
+
+def measure(contact_class, count):
+    """מחזיר (זיכרון בשימוש ב-MB, זמן יצירה בשניות)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    contacts = build(contact_class, count)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del contacts
+    return current / 1024 / 1024, elapsed
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [20000, 1000000]
+    for count in counts:
+        legacy_mb, legacy_time = measure(LegacyContact, count)
+        slim_mb, slim_time = measure(Contact, count)
+        print(f"{count:,} אנשי קשר:")
+        print(f"  מבנה קודם: {legacy_mb:.1f} MB ({legacy_mb * 1024 * 1024 / count:.0f} בתים לאיש קשר), {legacy_time:.2f} שניות")
+        print(f"  Contact עם __slots__: {slim_mb:.1f} MB ({slim_mb * 1024 * 1024 / count:.0f} בתים לאיש קשר), {slim_time:.2f} שניות")
+        print(f"  חיסכון: {(1 - slim_mb / legacy_mb) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
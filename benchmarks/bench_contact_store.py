@@ -0,0 +1,68 @@
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contact_extractor import Contact, ContactExtractor
+from contact_store import ContactStore
+from corpus import FIRST_NAMES, LAST_NAMES, ROLES, random_email, random_phone
+
+
+def generate_contacts(count, seed):
+    """אנשי קשר תקינים עם טלפון ומייל"""
+    rng = random.Random(seed)
+    contacts = []
+    for _ in range(count):
+        contact = Contact(name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", source_file=f"קובץ{seed}.docx")
+        contact.add_phone(random_phone(rng))
+        contact.add_email(random_email(rng))
+        contact.add_role(rng.choice(ROLES))
+        contacts.append(contact)
+    return contacts
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    master_size = int(sys.argv[1]) if len(sys.argv) > 1 else 17782
+    file_size = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    extractor = ContactExtractor()
+    master = generate_contacts(master_size, seed=1)
+    new_file = generate_contacts(file_size, seed=2) + master[:file_size // 4]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        master_path = os.path.join(tmp, 'אנשי קשר.xlsx')
+        extractor.save_contacts_to_excel(master, master_path)
+
+        # הדרך הקיימת: טעינת כל הקובץ הראשי, הוספה ושמירה מחדש של כל השורות
+        start = time.perf_counter()
+        contacts = extractor.load_contacts_from_excel(master_path) + new_file
+        extractor.save_contacts_to_excel(contacts, master_path)
+        round_trip = time.perf_counter() - start
+        print(f"קובץ ראשי ({master_size:,} אנשי קשר) - טעינה ושמירה: {round_trip:.2f} שניות")
+
+        with ContactStore(os.path.join(tmp, 'contacts.db')) as store:
+            start = time.perf_counter()
+            store.import_excel(master_path, extractor)
+            print(f"ייבוא חד-פעמי למאגר: {time.perf_counter() - start:.2f} שניות ({len(store):,} אנשי קשר)")
+
+            start = time.perf_counter()
+            counts = store.upsert(generate_contacts(file_size, seed=3) + master[file_size // 4:file_size // 2])
+            upsert = time.perf_counter() - start
+            print(f"הוספת קובץ של {file_size + file_size // 4} אנשי קשר למאגר: {upsert * 1000:.1f} מ\"ש "
+                  f"(נוספו {counts['inserted']}, עודכנו {counts['updated']}) (x{round_trip / upsert:.0f})")
+
+            start = time.perf_counter()
+            found = sum(store.find_by_phone(next(iter(contact.phones))) is not None for contact in master[:1000])
+            print(f"1,000 חיפושים לפי טלפון: {(time.perf_counter() - start) * 1000:.1f} מ\"ש ({found} נמצאו)")
+
+            start = time.perf_counter()
+            exported = store.export_to_excel(os.path.join(tmp, 'ייצוא.xlsx'), extractor)
+            print(f"ייצוא ל-Excel: {time.perf_counter() - start:.2f} שניות ({exported:,} אנשי קשר)")
+
+
+if __name__ == "__main__":
+    main()
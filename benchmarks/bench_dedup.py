@@ -0,0 +1,77 @@
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contact_extractor import Contact
+from dedup_engine import DedupEngine
+from corpus import FIRST_NAMES, LAST_NAMES, random_email, random_phone
+
+
+def legacy_remove_duplicates(contacts):
+    """remove_duplicates לפני מנוע האיחוד - מפתח משם, טלפון ראשון ומייל ראשון בקבוצה"""
+    unique_contacts = {}
+    for contact in contacts:
+        name_key = contact.name.lower().strip() if contact.name else ""
+        phone_key = list(contact.phones)[0] if contact.phones else ""
+        email_key = list(contact.emails)[0] if contact.emails else ""
+        key = f"{name_key}_{phone_key}_{email_key}"
+        if key in unique_contacts:
+            unique_contacts[key].merge(contact)
+        else:
+            unique_contacts[key] = contact
+    return list(unique_contacts.values())
+
+
+def generate(count, people, seed=1):
+    """count הופעות של people אנשים, כל הופעה עם חלק אחר מהטלפונים והמייל של האדם"""
+    rng = random.Random(seed)
+    details = [
+        (f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", random_phone(rng), random_phone(rng),
+         f"p{person}.{random_email(rng)}")
+        for person in range(people)
+    ]
+    contacts = []
+    for _ in range(count):
+        name, mobile, office, email = details[rng.randrange(people)]
+        contact = Contact(name=name)
+        for value in rng.sample([mobile, office, email], rng.randint(1, 3)):
+            if '@' in value:
+                contact.add_email(value)
+            else:
+                contact.add_phone(value)
+        contacts.append(contact)
+    return contacts
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    people = count // 4
+
+    contacts = generate(count, people)
+    start = time.perf_counter()
+    legacy = legacy_remove_duplicates(contacts)
+    legacy_time = time.perf_counter() - start
+    print(f"מפתח שם+טלפון ראשון+מייל ראשון: {legacy_time:.2f} שניות, {len(legacy):,} אנשי קשר "
+          f"(מתוך {people:,} אנשים)")
+
+    contacts = generate(count, people)
+    start = time.perf_counter()
+    groups = DedupEngine().groups(contacts)
+    grouping = time.perf_counter() - start
+    merged = DedupEngine().deduplicate(contacts)
+    total = time.perf_counter() - start - grouping
+    print(f"איחוד לפי כל מזהה: {grouping:.2f} שניות לקיבוץ, {total:.2f} שניות כולל מיזוג, "
+          f"{len(merged):,} אנשי קשר ({count / grouping:,.0f} אנשי קשר בשנייה)")
+
+    # דטרמיניזם: אותו קלט נותן את אותן קבוצות
+    again = DedupEngine().groups(generate(count, people))
+    print(f"אותן קבוצות בריצה חוזרת: {'כן' if again == groups else 'לא'}")
+
+
+if __name__ == "__main__":
+    main()
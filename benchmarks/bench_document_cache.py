@@ -0,0 +1,67 @@
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+from contact_extractor import ContactExtractor
+from bench_xlsx_streaming import write_workbook
+from corpus import generate_rows
+
+
+def write_document(path, rows):
+    """מסמך Word עם טבלת אנשי קשר ופסקאות חופשיות"""
+    doc = Document()
+    table = doc.add_table(rows=1, cols=3)
+    for cell, title in zip(table.rows[0].cells, ['שם', 'טלפון', 'מייל']):
+        cell.text = title
+    for line in generate_rows(rows, seed=5):
+        parts = line.split(',')
+        for cell, value in zip(table.add_row().cells, parts[:3]):
+            cell.text = value
+    for line in generate_rows(rows, seed=6):
+        doc.add_paragraph(line)
+        doc.add_paragraph('')
+    doc.save(path)
+
+
+def run(extractor, files):
+    """מחלץ את כל הקבצים ומחזיר זמן ומספר אנשי קשר"""
+    start = time.perf_counter()
+    count = 0
+    for path in files:
+        extract = extractor.extract_from_xlsx if path.endswith('.xlsx') else extractor.extract_from_doc
+        count += len(extract(path))
+    return time.perf_counter() - start, count
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [os.path.join(tmp, 'רשימה.docx'), os.path.join(tmp, 'משתתפים.xlsx')]
+        write_document(files[0], rows)
+        write_workbook(files[1], rows * 10)
+        cache_dir = os.path.join(tmp, 'cache')
+
+        baseline, count = run(ContactExtractor(), files)
+        print(f"בלי מטמון: {baseline:.2f} שניות ({count:,} אנשי קשר)")
+
+        first, _ = run(ContactExtractor(cache_dir), files)
+        print(f"ריצה ראשונה עם מטמון (פירוק ושמירה): {first:.2f} שניות")
+
+        warm, _ = run(ContactExtractor(cache_dir), files)
+        print(f"ללא שינוי (אנשי קשר מהמטמון): {warm:.2f} שניות (x{baseline / warm:.0f})")
+
+        # שינוי במילות התפקיד משנה את גרסת הכללים - רק שלב הכללים רץ שוב
+        extractor = ContactExtractor(cache_dir)
+        extractor.role_words = extractor.role_words | {'מתאם'}
+        changed, _ = run(extractor, files)
+        print(f"אחרי שינוי כללים (מסמכים מפורקים מהמטמון): {changed:.2f} שניות (x{baseline / changed:.1f})")
+
+
+if __name__ == "__main__":
+    main()
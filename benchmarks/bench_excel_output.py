@@ -0,0 +1,78 @@
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from corpus import CITIES, FIRST_NAMES, LAST_NAMES, STREETS, random_email, random_phone
+from exporters import write_contacts_excel
+
+
+def generate_contacts(count, seed=5):
+    """אנשי קשר במבנה של app.py, נוצרים אחד אחד"""
+    rng = random.Random(seed)
+    for row in range(count):
+        yield {
+            'name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            'phone': random_phone(rng),
+            'email': random_email(rng) if rng.random() < 0.6 else '',
+            'address': f"{rng.choice(STREETS)} {rng.randint(1, 120)}, {rng.choice(CITIES)}",
+            'source': f"רשימה{row % 7}.xlsx",
+        }
+
+
+def legacy_excel_output(contacts, path):
+    """create_excel_output הקודם: DataFrame, העתקה של כל עמודה לחישוב הרוחב וכתיבה דרך pandas"""
+    df = pd.DataFrame(contacts).rename(columns={
+        'name': 'שם', 'phone': 'טלפון', 'email': 'אימייל', 'address': 'כתובת', 'source': 'מקור'})
+    writer = pd.ExcelWriter(path, engine='xlsxwriter')
+    df.to_excel(writer, index=False, sheet_name='אנשי קשר')
+    workbook = writer.book
+    worksheet = writer.sheets['אנשי קשר']
+    header_format = workbook.add_format({'bold': True, 'align': 'center', 'valign': 'vcenter',
+                                         'bg_color': '#4F81BD', 'font_color': 'white', 'border': 1})
+    cell_format = workbook.add_format({'align': 'right', 'valign': 'vcenter', 'border': 1})
+    for col_num, value in enumerate(df.columns.values):
+        worksheet.write(0, col_num, value, header_format)
+        max_length = max(df[value].astype(str).apply(len).max(), len(value))
+        worksheet.set_column(col_num, col_num, max_length + 2, cell_format)
+    writer.close()
+
+
+def measure(write, make_input, path):
+    """מחזיר (שיא זיכרון מעבר לקלט ב-MB, זמן בשניות). הזמן נמדד בריצה נפרדת, בלי tracemalloc שמאט אותה"""
+    contacts = make_input()
+    start = time.perf_counter()
+    write(contacts, path)
+    elapsed = time.perf_counter() - start
+
+    contacts = make_input()
+    gc.collect()
+    tracemalloc.start()
+    write(contacts, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024, elapsed
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 100000]
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'out.xlsx')
+        for count in sizes:
+            print(f"{count:,} אנשי קשר")
+            memory, elapsed = measure(legacy_excel_output, lambda: list(generate_contacts(count)), path)
+            print(f"  DataFrame ו-pandas: {elapsed:.2f} שניות, שיא זיכרון {memory:.1f}MB")
+
+            # הכותב החדש מקבל איטרטור, כך שגם הקלט לא נשמר כולו בזיכרון
+            memory, elapsed = measure(write_contacts_excel, lambda: generate_contacts(count), path)
+            print(f"  כתיבה זורמת: {elapsed:.2f} שניות, שיא זיכרון {memory:.1f}MB (כולל יצירת הקלט)")
+
+
+if __name__ == "__main__":
+    main()
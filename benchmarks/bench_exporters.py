@@ -0,0 +1,47 @@
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from bench_excel_output import generate_contacts
+from exporters import EXPORT_FORMATS, write_contacts
+
+# טעינת הקובץ בצד הצורך (ייבוא ל-CRM או ניתוח), כמו שהיא נעשית בדרך כלל עם pandas
+LOADERS = {
+    'xlsx': pd.read_excel,
+    'csv': lambda path: pd.read_csv(path, encoding='utf-8-sig'),
+    'jsonl': lambda path: pd.read_json(path, lines=True),
+    'parquet': pd.read_parquet,
+}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{count:,} אנשי קשר")
+    with tempfile.TemporaryDirectory() as folder:
+        for export_format in EXPORT_FORMATS:
+            path = os.path.join(folder, f"contacts.{export_format}")
+            start = time.perf_counter()
+            write_contacts(generate_contacts(count), path, export_format)
+            written = time.perf_counter() - start
+
+            gc.collect()
+            tracemalloc.start()
+            write_contacts(generate_contacts(count), path, export_format)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            rows = len(LOADERS[export_format](path))
+            loaded = time.perf_counter() - start
+            print(f"  {export_format:8} כתיבה {written:6.2f} שנ', שיא זיכרון {peak / 1024 / 1024:5.1f}MB, "
+                  f"גודל {os.path.getsize(path) / 1024 / 1024:5.1f}MB, טעינה ב-pandas {loaded:6.2f} שנ' ({rows:,} שורות)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+from contact_extractor import ContactExtractor
+from bench_scan_directory import write_mixed, write_workbooks
+
+
+def run(directory, manifest_path, commit=True):
+    """סריקה אחת עם רשימת קבצים: אנשי הקשר נשמרים, ורק אחר כך הרשימה. commit=False מדמה
+    קריסה אחרי הסריקה ולפני שאנשי הקשר נשמרו. מחזירה את הסיכום של הסריקה"""
+    extractor = ContactExtractor()
+    contacts = extractor.scan_directory(directory, manifest_path=manifest_path)
+    if commit:
+        extractor.save_contacts(contacts, os.path.join(os.path.dirname(manifest_path), 'contacts.jsonl'))
+        extractor.commit_scan()
+    return extractor.scan_stats
+
+
+def report(title, stats, baseline=None):
+    speedup = f" (x{baseline / stats['seconds']:.0f})" if baseline else ""
+    print(f"{title}: {stats['seconds']:.2f} שניות{speedup} - דולגו {stats['skipped']}, "
+          f"חולצו {stats['extracted']}, נכשלו {stats['failed']}, אנשי קשר {stats['contacts']:,}")
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    paragraphs = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = os.path.join(tmp, 'docs')
+        os.makedirs(directory)
+        write_mixed(directory, files, paragraphs)
+        manifest_path = os.path.join(tmp, 'manifest.json')
+
+        report("סריקה ראשונה שלא נשמרה (קריסה לפני commit_scan)", run(directory, manifest_path, commit=False))
+        full = run(directory, manifest_path)
+        report("סריקה ראשונה", full)
+        report("סריקה חוזרת בלי שינויים", run(directory, manifest_path), full['seconds'])
+
+        # העתקה מחדש של כל הקבצים: זמן השינוי משתנה אבל התוכן לא
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            shutil.copy(path, path + '.tmp')
+            os.replace(path + '.tmp', path)
+        report("אחרי העתקה מחדש (גיבוב זהה)", run(directory, manifest_path), full['seconds'])
+
+        # שינוי קובץ אחד מכל סוג והוספת קובץ חדש
+        names = sorted(os.listdir(directory))
+        first = next(name for name in names if name.endswith('.docx'))
+        doc = Document(os.path.join(directory, first))
+        doc.add_paragraph('')
+        doc.add_paragraph('דנה לוי - מנהלת מכירות\nנייד: 052-7654321')
+        doc.save(os.path.join(directory, first))
+        with tempfile.TemporaryDirectory() as fresh:
+            write_workbooks(fresh, 1, 50, seed=11)
+            shutil.copy(os.path.join(fresh, os.listdir(fresh)[0]),
+                        os.path.join(directory, next(name for name in names if name.endswith('.xlsx'))))
+        with open(os.path.join(directory, next(name for name in names if name.endswith('.txt'))), 'a',
+                  encoding='utf-8') as file:
+            file.write('\n\nדנה לוי - מנהלת מכירות\nנייד: 052-7654321')
+        pdf = next((name for name in names if name.endswith('.pdf')), None)
+        if pdf:
+            from bench_pdf_pages import make_pdf
+            make_pdf(os.path.join(directory, pdf), 2, seed=99)
+        shutil.copy(os.path.join(directory, first), os.path.join(directory, 'חדש.docx'))
+        report("קובץ אחד שונה מכל סוג ואחד חדש", run(directory, manifest_path), full['seconds'])
+
+        # קובץ פגום לא נרשם ברשימה, ולכן נכשל שוב בכל סריקה ולא מדולג
+        with open(os.path.join(directory, 'פגום.xlsx'), 'wb') as file:
+            file.write(b'not a workbook')
+        report("קובץ פגום", run(directory, manifest_path), full['seconds'])
+        report("קובץ פגום, סריקה נוספת", run(directory, manifest_path), full['seconds'])
+
+if __name__ == "__main__":
+    main()
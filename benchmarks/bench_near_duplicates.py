@@ -0,0 +1,99 @@
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dedup_engine import NearDuplicateEngine
+from corpus import FIRST_NAMES, LAST_NAMES, random_email, random_phone
+
+TITLES = ['עו"ד', 'ד"ר', 'רו"ח', 'גב\'', 'מר']
+
+
+def variant(rng, name, phone, email):
+    """אותו אדם ברשומה אחרת: תואר, סדר מילים הפוך או כתיב אחר, ואותו פרט קשר בכתיב אחר (או בלי פרטי קשר)"""
+    first, last = name.split(' ', 1)
+    name = rng.choice([f"{rng.choice(TITLES)} {name}", f"{last} {first}", name.replace('ו', '') or name])
+    kind = rng.random()
+    if kind < 0.4:
+        # אותו מספר בפורמט אחר: עם או בלי קידומת בינלאומית, עם מקף
+        local = '0' + phone[3:] if phone.startswith('972') else phone
+        return name, [rng.choice([f"+972-{local[1:3]}-{local[3:]}", f"{local[:3]}-{local[3:]}"])], []
+    if kind < 0.8:
+        # אותו מייל באותיות גדולות
+        return name, [], [email.upper()]
+    return name, [], []
+
+
+# אנשים שונים עם אותו שם: אותה סיומת טלפון בקידומת אחרת, ואותו שם משתמש במייל אצל ספק אחר
+DIFFERENT_PEOPLE = [
+    [('משה כהן', ['050-1234567'], []), ('משה כהן', ['052-1234567'], []), ('משה כהן', ['03-1234567'], [])],
+    [('דנה לוי', [], ['info@a.com']), ('דנה לוי', [], ['info@b.com'])],
+]
+
+
+def regression_checks(engine):
+    """כל רשומה ב-DIFFERENT_PEOPLE היא אדם אחר, ולכן חייבת להישאר בקבוצה משלה"""
+    for records in DIFFERENT_PEOPLE:
+        groups = engine.groups(records)
+        status = 'תקין' if len(groups) == len(records) else 'מוזגו בטעות'
+        print(f"  {records[0][0]}, {len(records)} אנשים: {len(groups)} קבוצות - {status}")
+
+
+def generate(people, seed=1):
+    """רשומות של people אנשים, לחלקם רשומה נוספת בכתיב אחר. מחזיר גם את מספר הכפילויות שהוזרקו
+    ואת האדם של כל רשומה - אנשים שונים עם אותו שם לא אמורים להתמזג"""
+    rng = random.Random(seed)
+    records = []
+    injected = 0
+    for person in range(people):
+        # שם משפחה ייחודי יותר, כדי שבלוקי השמות לא יהיו כולם ענקיים
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}{rng.choice(['', 'י', 'סקי', 'וביץ'])}"
+        phone = ''.join(c for c in random_phone(rng) if c.isdigit())
+        email = f"u{person}{random_email(rng)}"
+        records.append(((name, [phone], [email]), person))
+        if rng.random() < 0.3:
+            records.append((variant(rng, name, phone, email), person))
+            injected += 1
+    rng.shuffle(records)
+    return [record for record, _ in records], injected, [person for _, person in records]
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    people = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    records, injected, owners = generate(people)
+    engine = NearDuplicateEngine()
+
+    start = time.perf_counter()
+    groups = engine.groups(records)
+    elapsed = time.perf_counter() - start
+    stats = engine.stats
+    all_pairs = len(records) * (len(records) - 1) // 2
+    # מיזוג שגוי: קבוצה עם רשומות של שני אנשים שלכל אחד מהם טלפון או מייל. רשומות בלי
+    # טלפון ומייל עם אותו שם בדיוק לא ניתנות להבחנה, ולכן לא נספרות
+    wrong = sum(1 for group in groups
+                if len({owners[index] for index in group if records[index][1] or records[index][2]}) > 1)
+
+    tracemalloc.start()
+    engine.groups(records)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{len(records):,} רשומות, {injected:,} כפילויות בכתיב שונה הוזרקו")
+    print(f"זמן: {elapsed:.2f} שניות ({stats['records_per_second']:,.0f} רשומות בשנייה)")
+    print(f"זוגות שנבדקו: {stats['pairs_compared']:,} מתוך {all_pairs:,} "
+          f"({stats['pairs_per_second']:,.0f} זוגות בשנייה)")
+    print(f"בלוקים: {stats['blocks']:,}, בלוקים גדולים שדולגו: {stats['oversized_blocks']:,}")
+    print(f"קבוצות: {len(groups):,} ({len(records) - len(groups):,} רשומות מוזגו), "
+          f"קבוצות שמיזגו אנשים שונים עם טלפון או מייל: {wrong:,}")
+    print(f"שיא זיכרון: {peak / 1024 / 1024:.1f}MB")
+    print("אנשים שונים עם אותו שם:")
+    regression_checks(NearDuplicateEngine())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_engine import TextNormalizer
+from corpus import generate_rows
+
+
+def legacy_clean_text(text):
+    """_clean_text כפי שהייתה לפני טבלת ההמרה - עשרה מעברי re.sub"""
+    if not text:
+        return ""
+    text = str(text)
+    text = re.sub(r'[""״\'׳]', '"', text)
+    text = re.sub(r'[-–—]', '-', text)
+    text = re.sub(r'[,،]', ',', text)
+    text = re.sub(r'[\.٫]', '.', text)
+    text = re.sub(r'[:׃]', ':', text)
+    text = re.sub(r'[\(\)]', '(', text)
+    text = re.sub(r'[\[\]]', '[', text)
+    text = re.sub(r'[\{\}]', '{', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def measure(func, rows, calls_per_row, repeat=3):
+    """זמן לשורה במיקרו-שניות, כשכל שורה מנוקה calls_per_row פעמים כמו בחילוץ"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            for _ in range(calls_per_row):
+                func(row)
+        best = min(best, time.perf_counter() - start)
+    return best / len(rows) * 1e6
+
+
+def main():
+    rows = generate_rows(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
+    normalizer = TextNormalizer()
+
+    mismatches = sum(1 for row in rows if legacy_clean_text(row) != normalizer.normalize(row))
+
+    def cold(row):
+        normalizer.reset()
+        return normalizer.normalize(row)
+
+    # טלפון, מייל וכתובת מנקים כל אחד את טקסט השורה
+    legacy = measure(legacy_clean_text, rows, 3)
+    translate_only = measure(cold, rows, 1)
+    normalizer.reset()
+    memo = measure(normalizer.normalize, rows, 3, repeat=1)
+
+    print(f"שורות: {len(rows)}")
+    print(f"גרסה קודמת (3 ניקויים לשורה): {legacy:.2f} מיקרו-שניות לשורה")
+    print(f"טבלת translate, ניקוי יחיד: {translate_only:.2f} מיקרו-שניות לשורה")
+    print(f"טבלת translate + זיכרון מסמך (3 ניקויים לשורה): {memo:.2f} מיקרו-שניות לשורה")
+    print(f"האצה: x{legacy / memo:.1f}")
+    print(f"שורות עם תוצאה שונה: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pdfplumber
+from corpus import FIRST_NAMES, LAST_NAMES, generate_rows, random_email, random_phone
+from pdf_engine import PdfPageEngine
+
+# גופן עם אותיות עבריות, ליצירת קובץ הבדיקה (דורש reportlab)
+FONT_PATH = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+
+
+def make_pdf(path, pages, seed=4):
+    """רשימת משתתפים: בכל עמוד פסקאות חופשיות, ובכל עמוד שני טבלה עם קווים"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    pdfmetrics.registerFont(TTFont('Hebrew', FONT_PATH))
+    style = getSampleStyleSheet()['Normal']
+    style.fontName = 'Hebrew'
+    rng = random.Random(seed)
+    story = []
+    for page in range(pages):
+        for row in generate_rows(6, seed=page):
+            story.append(Paragraph(row, style))
+            story.append(Spacer(1, 6))
+        if page % 2 == 0:
+            data = [['שם', 'טלפון', 'מייל']] + [
+                [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", random_phone(rng), random_email(rng)]
+                for _ in range(15)]
+            table = Table(data)
+            table.setStyle(TableStyle([('FONTNAME', (0, 0), (-1, -1), 'Hebrew'),
+                                       ('GRID', (0, 0), (-1, -1), 0.5, (0, 0, 0))]))
+            story.append(table)
+        story.append(PageBreak())
+    SimpleDocTemplate(path, pagesize=A4).build(story)
+
+
+def legacy_parse(path):
+    """הפירוק הקודם: לכל עמוד extract_text ואחריו extract_tables, כל אחד עם ניתוח פריסה משלו"""
+    pages = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            pages.append({'text': page.extract_text(), 'tables': page.extract_tables()})
+    return {'pages': pages}
+
+
+def timed(parse, path):
+    start = time.perf_counter()
+    result = parse(path)
+    return result, time.perf_counter() - start
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'participants.pdf')
+        make_pdf(path, pages)
+
+        legacy, legacy_time = timed(legacy_parse, path)
+        single, single_time = timed(PdfPageEngine(1).parse, path)
+        parallel, parallel_time = timed(PdfPageEngine(workers, min_parallel_pages=1).parse, path)
+
+    table_chars = sum(len(cell or '') for page in legacy['pages'] for table in page['tables']
+                      for row in table for cell in row)
+    text_before = sum(len(page['text'] or '') for page in legacy['pages'])
+    text_after = sum(len(page['text'] or '') for page in single['pages'])
+    print(f"{pages} עמודים, {os.cpu_count()} ליבות")
+    print(f"extract_text ואז extract_tables: {legacy_time:.2f} שניות ({pages / legacy_time:.1f} עמודים בשנייה)")
+    print(f"ניתוח פריסה אחד לעמוד: {single_time:.2f} שניות ({pages / single_time:.1f} עמודים בשנייה, "
+          f"x{legacy_time / single_time:.2f})")
+    print(f"ניתוח פריסה אחד לעמוד, {workers} תהליכים: {parallel_time:.2f} שניות "
+          f"({pages / parallel_time:.1f} עמודים בשנייה, x{legacy_time / parallel_time:.2f})")
+    print(f"טקסט לנתיב הטקסט: {text_before:,} תווים לפני, {text_after:,} אחרי "
+          f"(תוכן הטבלאות, {table_chars:,} תווים, עובר רק בנתיב הטבלאות)")
+    print(f"אותן טבלאות: {'כן' if [p['tables'] for p in legacy['pages']] == [p['tables'] for p in single['pages']] else 'לא'}, "
+          f"פירוק מקבילי זהה לרציף: {'כן' if parallel == single else 'לא'}")
+
+
+if __name__ == "__main__":
+    main()
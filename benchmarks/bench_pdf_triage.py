@@ -0,0 +1,111 @@
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pdf_pages import FONT_PATH
+from corpus import CITIES, FIRST_NAMES, LAST_NAMES, ROLES, generate_rows, random_email, random_phone
+from contact_extractor import ContactExtractor
+from pdf_engine import PdfPageEngine, triage_summary
+
+ENGLISH_NAMES = ['John Smith', 'Mary Jones', 'David Brown', 'Sarah Miller', 'Daniel Green', 'Anna White']
+
+# פסקה בלי ספרות ובלי @ - כמו עמוד שער, תנאים או הסבר בחוברת
+PROSE = ('חוברת זו מרכזת את פרטי המשתתפים בכנס השנתי של הארגון. '
+         'יש לעדכן את הרכזת בכל שינוי בפרטים ולשמור על סודיות המידע. ') * 3
+
+
+def make_pdf(path, pages, folder, seed=5):
+    """חוברת מעורבת, בסבב של שישה סוגי עמודים: שער, אנשי קשר בעברית, טבלה עם קווים,
+    אנשי קשר באנגלית, עמוד סרוק (תמונה בלבד) ועמוד הסבר בלי פרטי קשר"""
+    from PIL import Image as PilImage
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.platypus import Image, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    pdfmetrics.registerFont(TTFont('Hebrew', FONT_PATH))
+    style = getSampleStyleSheet()['Normal']
+    style.fontName = 'Hebrew'
+    rng = random.Random(seed)
+    scan = os.path.join(folder, 'scan.png')
+    PilImage.effect_noise((400, 560), 40).convert('RGB').save(scan)
+
+    story = []
+    for page in range(pages):
+        kind = page % 6
+        if kind == 0:
+            story.append(Paragraph('רשימת משתתפים - כנס שנתי', style))
+            story.append(Paragraph(PROSE, style))
+        elif kind == 1:
+            for row in generate_rows(8, seed=page):
+                story.append(Paragraph(row, style))
+                story.append(Spacer(1, 6))
+        elif kind == 2:
+            data = [['שם', 'טלפון', 'מייל']] + [
+                [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", random_phone(rng), random_email(rng)]
+                for _ in range(20)]
+            table = Table(data)
+            table.setStyle(TableStyle([('FONTNAME', (0, 0), (-1, -1), 'Hebrew'),
+                                       ('GRID', (0, 0), (-1, -1), 0.5, (0, 0, 0))]))
+            story.append(table)
+        elif kind == 3:
+            for _ in range(8):
+                name = rng.choice(ENGLISH_NAMES)
+                email = f"{name.lower().replace(' ', '.')}{rng.randint(1, 99)}@company.com"
+                story.append(Paragraph(name, style))
+                story.append(Paragraph(f"Tel: {random_phone(rng)}", style))
+                story.append(Paragraph(f"Email: {email}", style))
+                story.append(Spacer(1, 12))
+        elif kind == 4:
+            story.append(Image(scan, width=400, height=560))
+        else:
+            for _ in range(4):
+                story.append(Paragraph(f"{rng.choice(ROLES)}, {rng.choice(CITIES)}: {PROSE}", style))
+        story.append(PageBreak())
+    SimpleDocTemplate(path, pagesize=A4).build(story)
+
+
+def contacts_of(extractor, parsed, path):
+    extractor.analyzer.reset()
+    return sorted((contact.name or '', tuple(sorted(contact.phones)), tuple(sorted(contact.emails)))
+                  for contact in extractor._evaluate_pdf(parsed, path))
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'booklet.pdf')
+        make_pdf(path, pages, folder)
+
+        start = time.perf_counter()
+        full = PdfPageEngine(triage=False).parse(path)
+        full_time = time.perf_counter() - start
+        start = time.perf_counter()
+        triaged = PdfPageEngine().parse(path)
+        triaged_time = time.perf_counter() - start
+
+        extractor = ContactExtractor()
+        full_contacts = contacts_of(extractor, full, path)
+        triaged_contacts = contacts_of(extractor, triaged, path)
+
+    print(f"{pages} עמודים")
+    print(f"זיהוי טבלאות בכל עמוד: {full_time:.2f} שניות ({pages / full_time:.1f} עמודים בשנייה)")
+    print(f"מיון זול ואז הנתיב המתאים: {triaged_time:.2f} שניות ({pages / triaged_time:.1f} עמודים בשנייה, "
+          f"x{full_time / triaged_time:.2f})")
+    for triage_path, stats in triage_summary(triaged['pages']).items():
+        print(f"  {triage_path:8} {stats['pages']:4} עמודים, {stats['seconds']:6.2f} שניות")
+    same_tables = [page['tables'] for page in full['pages']] == [page['tables'] for page in triaged['pages']]
+    print(f"אותן טבלאות: {'כן' if same_tables else 'לא'}, אנשי קשר: {len(full_contacts)} לפני, "
+          f"{len(triaged_contacts)} אחרי, זהים: {'כן' if full_contacts == triaged_contacts else 'לא'}")
+
+
+if __name__ == "__main__":
+    main()
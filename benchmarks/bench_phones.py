@@ -0,0 +1,91 @@
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contact_extractor import ContactExtractor
+from corpus import generate_rows
+from bench_normalizer import legacy_clean_text
+
+# הגרסה הקודמת של _extract_phones - 16 תבניות לא מקומפלות, לצורך השוואה
+LEGACY_PATTERNS = [
+    r'0[23489]-\d{7}',
+    r'05[0-9]-\d{7}',
+    r'07[0-9]-\d{7}',
+    r'\+972[23489]\d{8}',
+    r'\+972-?5[0-9]-?\d{7}',
+    r'0[23489]\d{7}',
+    r'05[0-9]\d{7}',
+    r'07[0-9]\d{7}',
+    r'972[23489]\d{8}',
+    r'9725[0-9]\d{7}',
+    r'0[23489]\s*\d{3}\s*\d{4}',
+    r'05[0-9]\s*\d{3}\s*\d{4}',
+    r'07[0-9]\s*\d{3}\s*\d{4}',
+    r'0[23489]\(\d{3}\)\d{4}',
+    r'05[0-9]\(\d{3}\)\d{4}',
+    r'07[0-9]\(\d{3}\)\d{4}'
+]
+
+
+def legacy_extract_phones(text):
+    """_extract_phones כפי שהייתה לפני הסורק המקומפל"""
+    return legacy_scan(legacy_clean_text(text))
+
+
+def legacy_scan(text):
+    """הסריקה עצמה בגרסה הקודמת, על טקסט נקי"""
+    phones = set()
+    for pattern in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, text):
+            phone = re.sub(r'[\s\-\(\)]', '', match.group())
+            if phone.startswith('972'):
+                phone = '+' + phone
+            elif phone.startswith('0'):
+                phone = '+972' + phone[1:]
+            if len(phone) >= 10:
+                phones.add(phone)
+    return sorted(phones)
+
+
+def measure(func, rows, repeat=3):
+    """מחזיר את הזמן הטוב ביותר לשורה במיקרו-שניות"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            func(row)
+        best = min(best, time.perf_counter() - start)
+    return best / len(rows) * 1e6
+
+
+def main():
+    rows = generate_rows(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
+    extractor = ContactExtractor()
+
+    mismatches = sum(
+        1 for row in rows
+        if legacy_extract_phones(row) != extractor._extract_phones(row)
+    )
+
+    legacy = measure(legacy_extract_phones, rows)
+    scanner = measure(extractor._extract_phones, rows)
+
+    # סריקה בלבד, על טקסט שכבר נוקה
+    cleaned = [extractor._clean_text(row) for row in rows]
+    legacy_scan_only = measure(legacy_scan, cleaned)
+    scanner_scan_only = measure(extractor.phone_scanner.scan, cleaned)
+
+    print(f"שורות: {len(rows)}")
+    print(f"גרסה קודמת: {legacy:.2f} מיקרו-שניות לשורה")
+    print(f"סורק מקומפל: {scanner:.2f} מיקרו-שניות לשורה")
+    print(f"האצה: x{legacy / scanner:.1f}")
+    print(f"סריקה בלבד: {legacy_scan_only:.2f} -> {scanner_scan_only:.2f} מיקרו-שניות לשורה (x{legacy_scan_only / scanner_scan_only:.1f})")
+    # ההבדלים הצפויים הם מספרים בסוגריים, שהגרסה הקודמת לא זיהתה אחרי _clean_text
+    print(f"שורות עם תוצאה שונה: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
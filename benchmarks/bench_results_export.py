@@ -0,0 +1,125 @@
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
+from corpus import CITIES, FIRST_NAMES, LAST_NAMES, STREETS, random_email, random_phone
+from read_docs import RESULT_COLUMN_WIDTHS, RESULT_COLUMNS, write_results
+
+
+def build(count, seed=8):
+    """טבלת תוצאות כמו ב-read_docs.main אחרי האיחוד"""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        rows.append({
+            'שם': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            'טלפון': ';'.join(random_phone(rng) for _ in range(rng.randint(1, 2))),
+            'מייל': random_email(rng) if rng.random() < 0.6 else '',
+            'כתובת': f"{rng.choice(STREETS)} {rng.randint(1, 120)}, {rng.choice(CITIES)}" if rng.random() < 0.4 else '',
+        })
+    return pd.DataFrame(rows, columns=RESULT_COLUMNS)
+
+
+def legacy_export(df, filename):
+    """הדרך הקודמת: to_excel, טעינה מחדש, קריאת כל השורות, מחיקה וכתיבה מחדש, עיצוב תא אחר תא ושמירה שנייה"""
+    df.to_excel(filename, index=False)
+    wb = load_workbook(filename)
+    ws = wb.active
+    current_columns = [cell.value for cell in ws[1]]
+    data = []
+    for row in ws.iter_rows(min_row=2):
+        row_data = {}
+        for cell in row:
+            col_name = ws.cell(row=1, column=cell.column).value
+            if col_name in RESULT_COLUMNS:
+                row_data[col_name] = cell.value
+        data.append(row_data)
+    ws.delete_rows(2, ws.max_row)
+    for row_idx, row_data in enumerate(data, 2):
+        for col_idx, col_name in enumerate(RESULT_COLUMNS, 1):
+            ws.cell(row=row_idx, column=col_idx, value=row_data.get(col_name, ''))
+
+    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    for col in range(1, len(current_columns) + 1):
+        cell = ws.cell(row=1, column=col)
+        cell.font = Font(name='Arial', bold=True, size=12, color="FFFFFF")
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+    data_font = Font(name='Arial', size=11)
+    data_alignment = Alignment(horizontal="right", vertical="center", wrap_text=True)
+    alternate_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+    for row in range(2, ws.max_row + 1):
+        for col in range(1, ws.max_column + 1):
+            cell = ws.cell(row=row, column=col)
+            cell.font = data_font
+            cell.alignment = data_alignment
+            if row % 2 == 0:
+                cell.fill = alternate_fill
+    for col_idx, width in enumerate(RESULT_COLUMN_WIDTHS, 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
+    side = Side(style='thin', color="BFBFBF")
+    thin_border = Border(left=side, right=side, top=side, bottom=side)
+    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
+        for cell in row:
+            cell.border = thin_border
+    ws.freeze_panes = 'A2'
+    wb.save(filename)
+
+
+def measure(export, df, path):
+    """מחזיר (זמן בשניות, שיא זיכרון ב-MB); הזמן נמדד בריצה נפרדת, בלי tracemalloc"""
+    start = time.perf_counter()
+    export(df, path)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    export(df, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def compare(legacy_path, single_path):
+    old_rows = list(load_workbook(legacy_path, read_only=True).active.iter_rows(values_only=True))
+    new_rows = list(load_workbook(single_path, read_only=True).active.iter_rows(values_only=True))
+    return [[value or None for value in row] for row in old_rows] == \
+           [[value or None for value in row] for row in new_rows]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    # הדרך הקודמת ריבועית (מחיקת השורות בגליון שנטען מחדש), ולכן נמדדת על מדגם קטן יותר
+    legacy_count = min(count, int(sys.argv[2]) if len(sys.argv) > 2 else 10000)
+    with tempfile.TemporaryDirectory() as folder:
+        legacy_path = os.path.join(folder, 'legacy.xlsx')
+        single_path = os.path.join(folder, 'single.xlsx')
+
+        sample = build(legacy_count)
+        legacy, legacy_memory = measure(legacy_export, sample, legacy_path)
+        sample_single, sample_memory = measure(write_results, sample, single_path)
+        same = compare(legacy_path, single_path)
+        print(f"{legacy_count:,} שורות")
+        print(f"  כתיבה, טעינה מחדש ועיצוב תא אחר תא: {legacy:.2f} שניות, שיא זיכרון {legacy_memory:.1f}MB")
+        print(f"  כתיבה מעוצבת במעבר אחד: {sample_single:.2f} שניות, שיא זיכרון {sample_memory:.1f}MB "
+              f"(x{legacy / sample_single:.1f})")
+        print(f"  אותם ערכים: {'כן' if same else 'לא'}")
+
+        if count > legacy_count:
+            single, single_memory = measure(write_results, build(count), single_path)
+            print(f"{count:,} שורות")
+            print(f"  כתיבה מעוצבת במעבר אחד: {single:.2f} שניות, שיא זיכרון {single_memory:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import gc
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from contact_extractor import Contact, ContactExtractor
+from corpus import CITIES, FIRST_NAMES, LAST_NAMES, ROLES, STREETS, random_email, random_phone
+
+
+def build(count, seed=3):
+    rng = random.Random(seed)
+    contacts = []
+    for row in range(count):
+        contact = Contact(name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                          phone=random_phone(rng), source_file=f"רשימה{row % 9}.xlsx")
+        if rng.random() < 0.3:
+            contact.add_phone(random_phone(rng))
+        if rng.random() < 0.6:
+            contact.add_email(random_email(rng))
+        if rng.random() < 0.4:
+            contact.add_address(f"{rng.choice(STREETS)} {rng.randint(1, 120)}, {rng.choice(CITIES)}")
+        contact.role = rng.choice(ROLES)
+        contacts.append(contact)
+    return contacts
+
+
+def legacy_save(contacts, output_path):
+    """save_contacts_to_excel הקודם: חוברת openpyxl רגילה, סגנון לכל תא ומעבר נוסף לרוחב העמודות"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'אנשי קשר'
+    header_font = Font(bold=True)
+    header_fill = PatternFill(start_color='D7E4BC', end_color='D7E4BC', fill_type='solid')
+    side = Side(style='thin')
+    cell_border = Border(left=side, right=side, top=side, bottom=side)
+    cell_alignment = Alignment(wrap_text=True, vertical='top')
+    for col, header in enumerate(['שם', 'תפקיד', 'טלפון', 'אימייל', 'כתובת', 'קובץ מקור'], 1):
+        cell = ws.cell(row=1, column=col, value=header)
+        cell.font, cell.fill, cell.border, cell.alignment = header_font, header_fill, cell_border, cell_alignment
+    for row, contact in enumerate(contacts, 2):
+        ws.cell(row=row, column=1, value=contact.name)
+        ws.cell(row=row, column=2, value=contact.role)
+        ws.cell(row=row, column=3, value='; '.join(contact.phones))
+        ws.cell(row=row, column=4, value='; '.join(contact.emails))
+        ws.cell(row=row, column=5, value='; '.join(contact.addresses))
+        ws.cell(row=row, column=6, value=contact.source_file)
+        for col in range(1, 7):
+            cell = ws.cell(row=row, column=col)
+            cell.border = cell_border
+            cell.alignment = cell_alignment
+    for col in ws.columns:
+        max_length = max(len(str(cell.value)) for cell in col)
+        ws.column_dimensions[col[0].column_letter].width = min(max_length + 2, 100)
+    ws.freeze_panes = 'A2'
+    wb.save(output_path)
+
+
+def measure(save, contacts, path):
+    """מחזיר (זמן בשניות, שיא זיכרון ב-MB); הזמן נמדד בריצה נפרדת, בלי tracemalloc"""
+    start = time.perf_counter()
+    save(contacts, path)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    save(contacts, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 17782
+    contacts = build(count)
+    extractor = ContactExtractor()
+
+    with tempfile.TemporaryDirectory() as folder:
+        legacy_path = os.path.join(folder, 'legacy.xlsx')
+        stream_path = os.path.join(folder, 'stream.xlsx')
+        legacy, legacy_memory = measure(legacy_save, contacts, legacy_path)
+        streamed, stream_memory = measure(extractor.save_contacts_to_excel, contacts, stream_path)
+
+        old_rows = list(load_workbook(legacy_path, read_only=True).active.iter_rows(values_only=True))
+        new_rows = list(load_workbook(stream_path, read_only=True).active.iter_rows(values_only=True))
+        same = [[value or None for value in row] for row in old_rows] == \
+               [[value or None for value in row] for row in new_rows]
+
+    print(f"{count:,} אנשי קשר")
+    print(f"openpyxl עם סגנון לכל תא: {legacy:.2f} שניות, שיא זיכרון {legacy_memory:.1f}MB")
+    print(f"כתיבה זורמת: {streamed:.2f} שניות, שיא זיכרון {stream_memory:.1f}MB (x{legacy / streamed:.1f})")
+    print(f"אותם ערכים: {'כן' if same else 'לא'}")
+
+
+if __name__ == "__main__":
+    main()
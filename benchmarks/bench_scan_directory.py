@@ -0,0 +1,120 @@
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import xlsxwriter
+from docx import Document
+from contact_extractor import ContactExtractor
+from corpus import CITIES, FIRST_NAMES, LAST_NAMES, NOTES, ROLES, STREETS, random_email, random_phone
+
+
+def contact_block(rng):
+    """בלוק קשר בכמה שורות - שם ותפקיד, טלפון ומייל - כמו בחוברות ובהערות"""
+    return (f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} - {rng.choice(ROLES)}\n"
+            f"נייד: {random_phone(rng)}\nמייל: {random_email(rng)}")
+
+
+def write_documents(directory, files, paragraphs, seed=3):
+    """כותב מסמכי Word גדולים: מעט בלוקי קשר, כל אחד בפסקה נפרדת, בתוך הרבה טקסט חופשי"""
+    rng = random.Random(seed)
+    filler = [note for note in NOTES if note] + ['פרוטוקול ישיבת הנהלה', 'סיכום שיחה עם הלקוח', 'נושאים לדיון']
+    for index in range(files):
+        doc = Document()
+        for paragraph in range(paragraphs):
+            if paragraph % 40 == 0:
+                # פסקאות צמודות מתאחדות לבלוק אחד, ולכן הבלוק מוקף בפסקאות ריקות
+                doc.add_paragraph('')
+                doc.add_paragraph(contact_block(rng))
+                doc.add_paragraph('')
+            else:
+                doc.add_paragraph(' '.join(rng.choice(filler) for _ in range(6)))
+        doc.save(os.path.join(directory, f"מסמך_{index:02d}.docx"))
+
+
+def write_workbooks(directory, files, rows, seed=6):
+    """כותב קבצי Excel עם שורת כותרות ושורת איש קשר לכל שורה"""
+    rng = random.Random(seed)
+    for index in range(files):
+        workbook = xlsxwriter.Workbook(os.path.join(directory, f"רשימה_{index:02d}.xlsx"))
+        worksheet = workbook.add_worksheet('אנשי קשר')
+        worksheet.write_row(0, 0, ['שם', 'טלפון', 'מייל', 'כתובת'])
+        for row in range(1, rows + 1):
+            worksheet.write_row(row, 0, [
+                f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", random_phone(rng), random_email(rng),
+                f"{rng.choice(STREETS)} {rng.randint(1, 120)}, {rng.choice(CITIES)}",
+            ])
+        workbook.close()
+
+
+def write_texts(directory, files, blocks, seed=7):
+    """כותב קבצי טקסט: בלוקי קשר מופרדים בשורה ריקה"""
+    rng = random.Random(seed)
+    for index in range(files):
+        with open(os.path.join(directory, f"הערות_{index:02d}.txt"), 'w', encoding='utf-8') as file:
+            file.write('\n\n'.join(contact_block(rng) for _ in range(blocks)))
+
+
+def write_mixed(directory, files, paragraphs):
+    """תיקייה מעורבת: מסמכי Word, קבצי Excel, קבצי טקסט, ו-PDF אם reportlab מותקן"""
+    write_documents(directory, files, paragraphs)
+    write_workbooks(directory, files, paragraphs // 10)
+    write_texts(directory, files, paragraphs // 100)
+    try:
+        from bench_pdf_pages import make_pdf
+        for index in range(files):
+            make_pdf(os.path.join(directory, f"חוברת_{index:02d}.pdf"), 4, seed=index)
+    except ImportError:
+        print("reportlab לא מותקן - בלי קבצי PDF")
+
+
+def summary(contacts):
+    """אנשי הקשר בצורה שאפשר להשוות בין סריקות"""
+    return [(contact.name, sorted(contact.phones), sorted(contact.emails), contact.source_file) for contact in contacts]
+
+
+def measure(directory, workers):
+    """זמן סריקה של התיקייה, אנשי הקשר והשגיאות"""
+    extractor = ContactExtractor()
+    start = time.perf_counter()
+    contacts = extractor.scan_directory(directory, workers=workers)
+    return time.perf_counter() - start, summary(contacts), extractor.scan_errors
+
+
+def by_extension(directory):
+    """מספר אנשי הקשר לכל סוג קובץ - סוג שלא מחולץ כראוי בולט כאן באפס"""
+    extractor = ContactExtractor()
+    counts = {}
+    for name in sorted(os.listdir(directory)):
+        extension = name.split('.')[-1]
+        counts[extension] = counts.get(extension, 0) + len(extractor.extract_contacts(os.path.join(directory, name)))
+    return counts
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    paragraphs = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    with tempfile.TemporaryDirectory() as directory:
+        write_mixed(directory, files, paragraphs)
+        print(f"{len(os.listdir(directory))} קבצים ({files} מכל סוג, מסמכים של {paragraphs:,} פסקאות), "
+              f"{os.cpu_count()} ליבות")
+        print("אנשי קשר לפי סוג: " + ", ".join(f"{ext} {count:,}" for ext, count in by_extension(directory).items()))
+
+        sequential_time, sequential, errors = measure(directory, 1)
+        print(f"תהליך אחד: {sequential_time:.2f} שניות ({len(sequential):,} אנשי קשר, {len(errors)} קבצים נכשלו)")
+        for file_path, error in errors.items():
+            print(f"  {os.path.basename(file_path)}: {error}")
+        for workers in [2, 4, None]:
+            parallel_time, parallel, _ = measure(directory, workers)
+            label = f"{workers} תהליכים" if workers else "תהליך לכל ליבה"
+            print(f"{label}: {parallel_time:.2f} שניות (x{sequential_time / parallel_time:.1f}), "
+                  f"תוצאות זהות: {parallel == sequential}")
+
+
+if __name__ == "__main__":
+    main()
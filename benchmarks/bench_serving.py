@@ -0,0 +1,124 @@
+import http.client
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import docx
+from corpus import generate_rows
+
+# שרת הפיתוח כמו ב-app.py (debug עם טעינה מחדש) - כקובץ, כי הטוען מחדש מריץ שוב את הסקריפט
+DEV_SERVER = "from app import app\napp.run(host='127.0.0.1', port={port}, debug=True)\n"
+
+
+def make_document(rows):
+    """מסמך Word קטן להעלאה"""
+    document = docx.Document()
+    for line in generate_rows(rows, seed=11):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def multipart(content, filename):
+    """גוף בקשת multipart עם קובץ אחד בשדה files"""
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="files"; filename="{filename}"\r\n'
+        'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode() + content + f'\r\n--{boundary}--\r\n'.encode()
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+def wait_until_ready(port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            connection.request('GET', '/')
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"השרת בפורט {port} לא עלה")
+
+
+def load(port, method, path, body, content_type, requests, concurrency):
+    """שולח requests בקשות במקביל ומחזיר (בקשות שהושלמו בשנייה, p50, p99 במילישניות, נדחו ב-503, שגיאות).
+    הזמנים נמדדים רק על בקשות שהושלמו"""
+    def one(_):
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=120)
+        start = time.perf_counter()
+        connection.request(method, path, body=body, headers={'Content-Type': content_type} if body else {})
+        status = connection.getresponse()
+        status.read()
+        connection.close()
+        return time.perf_counter() - start, status.status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, range(requests)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for latency, status in results if status < 400) or [0.0]
+    rejected = sum(status == 503 for _, status in results)
+    errors = sum(status >= 400 and status != 503 for _, status in results)
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    return (requests - rejected - errors) / elapsed, p50, p99, rejected, errors
+
+
+def run_server(command, port, workdir):
+    """מפעיל שרת ומחזיר את התהליך כשהוא מוכן"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    process = subprocess.Popen(command, cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wait_until_ready(port)
+    return process
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    workers = sys.argv[3] if len(sys.argv) > 3 else str(os.cpu_count() * 2 + 1)
+    body, content_type = multipart(make_document(40), 'רשימה.docx')
+
+    workdir = tempfile.mkdtemp()
+    dev_script = os.path.join(workdir, 'dev_server.py')
+    servers = [
+        ('שרת הפיתוח (debug)', lambda port: [sys.executable, dev_script]),
+        (f'gunicorn, {workers} תהליכים מחוממים', lambda port: [
+            sys.executable, '-m', 'gunicorn', '-c', os.path.join(ROOT, 'gunicorn.conf.py'),
+            '-w', workers, '-b', f'127.0.0.1:{port}', '--access-logfile', '/dev/null', 'wsgi:app']),
+    ]
+    try:
+        for port, (name, command) in enumerate(servers, start=5180):
+            with open(dev_script, 'w', encoding='utf-8') as file:
+                file.write(DEV_SERVER.format(port=port))
+            process = run_server(command(port), port, workdir)
+            try:
+                print(name)
+                for label, method, path, payload, kind in [
+                    ('דף הבית', 'GET', '/', None, None),
+                    ('חילוץ בתוך הבקשה', 'POST', '/extract?sync=1', body, content_type),
+                ]:
+                    rps, p50, p99, rejected, errors = load(port, method, path, payload, kind, requests, concurrency)
+                    print(f"  {label}: {rps:.1f} בקשות בשנייה, p50 {p50:.0f} מ\"ש, p99 {p99:.0f} מ\"ש"
+                          + (f", {rejected} נדחו (503)" if rejected else "")
+                          + (f", {errors} שגיאות" if errors else ""))
+            finally:
+                process.terminate()
+                process.wait(timeout=60)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import io
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import docx
+from werkzeug.datastructures import FileStorage
+from app import detect_file_type
+from corpus import generate_rows
+
+
+def make_document(rows):
+    """מסמך Word קטן בזיכרון, כמו העלאה טיפוסית"""
+    document = docx.Document()
+    for line in generate_rows(rows, seed=9):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def legacy_upload(upload, folder):
+    """הדרך הקודמת: שמירה לתיקיית ההעלאות, זיהוי סוג מהקובץ בדיסק, פענוח מהדיסק ומחיקה"""
+    path = os.path.join(folder, upload.filename)
+    upload.save(path)
+    detect_file_type(path, upload.filename)
+    paragraphs = len(docx.Document(path).paragraphs)
+    os.remove(path)
+    return paragraphs
+
+
+def spooled_upload(upload):
+    """הדרך החדשה: זיהוי סוג מהבתים הראשונים ופענוח ישירות מהזיכרון"""
+    detect_file_type(upload.stream, upload.filename)
+    return len(docx.Document(upload.stream).paragraphs)
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    uploads = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    content = make_document(rows)
+
+    with tempfile.TemporaryDirectory() as folder:
+        start = time.perf_counter()
+        for _ in range(uploads):
+            legacy_upload(FileStorage(io.BytesIO(content), filename='רשימה.docx'), folder)
+        legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(uploads):
+        spooled_upload(FileStorage(io.BytesIO(content), filename='רשימה.docx'))
+    spooled = time.perf_counter() - start
+
+    print(f"{uploads} העלאות של {len(content) / 1024:.0f}KB")
+    print(f"שמירה לדיסק, זיהוי ופענוח מהדיסק: {legacy * 1000 / uploads:.2f} מ\"ש להעלאה")
+    print(f"בזיכרון עם זיהוי לפי כותרת: {spooled * 1000 / uploads:.2f} מ\"ש להעלאה (x{legacy / spooled:.2f})")
+
+
+if __name__ == "__main__":
+    main()
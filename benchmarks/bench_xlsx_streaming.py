@@ -0,0 +1,110 @@
+import logging
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook, load_workbook
+from corpus import CITIES, FIRST_NAMES, LAST_NAMES, ROLES, STREETS, random_email, random_phone
+
+# הגישה הקודמת (ws[row_idx] במצב מלא) ריבועית במספר השורות, ולכן נמדדת על מדגם
+LEGACY_SAMPLE_ROWS = 3000
+
+
+def write_workbook(path, rows, seed=11):
+    """כותב גיליון בסגנון רשימת משתתפים"""
+    rng = random.Random(seed)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('משתתפים')
+    ws.append(['שם', 'טלפון', 'מייל', 'כתובת', 'תפקיד', 'הערות'])
+    for _ in range(rows):
+        ws.append([
+            f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            random_phone(rng),
+            random_email(rng) if rng.random() < 0.6 else None,
+            f"{rng.choice(STREETS)} {rng.randint(1, 99)}, {rng.choice(CITIES)}" if rng.random() < 0.4 else None,
+            rng.choice(ROLES),
+            None,
+        ])
+    wb.save(path)
+
+
+def full_mode_load(path):
+    """טעינה מלאה כמו קודם, ומעבר על השורות (בלי ws[row_idx])"""
+    wb = load_workbook(path, data_only=True)
+    return sum(1 for ws in wb for _ in ws.iter_rows(values_only=True))
+
+
+def full_mode_random_access(path):
+    """הגישה הקודמת: טעינה מלאה וקריאת כל שורה עם ws[row_idx]"""
+    wb = load_workbook(path, data_only=True)
+    ws = wb.active
+    return sum(1 for row_idx in range(1, ws.max_row + 1) if ws[row_idx])
+
+
+def streaming_read(path):
+    """קריאה בלבד עם iter_rows(values_only=True)"""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        return sum(1 for ws in wb for _ in ws.iter_rows(values_only=True))
+    finally:
+        wb.close()
+
+
+def streaming_extract(path):
+    """החילוץ המלא של extract_from_xlsx"""
+    from contact_extractor import ContactExtractor
+    logging.disable(logging.CRITICAL)
+    return len(ContactExtractor().extract_from_xlsx(path))
+
+
+def run(name, path, queue):
+    """מריץ שלב בתהליך נפרד כדי למדוד את שיא ה-RSS שלו בלבד"""
+    func = globals()[name]
+    start = time.perf_counter()
+    result = func(path)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((result, elapsed, peak_kb / 1024))
+
+
+def measure(name, path):
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run, args=(name, path, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'big.xlsx')
+        sample_path = os.path.join(tmp, 'sample.xlsx')
+        write_workbook(path, rows)
+        write_workbook(sample_path, min(rows, LEGACY_SAMPLE_ROWS))
+        print(f"גיליון של {rows:,} שורות ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+
+        for title, name, target in [
+            ("טעינה מלאה + iter_rows", 'full_mode_load', path),
+            ("קריאה בלבד + iter_rows", 'streaming_read', path),
+            ("extract_from_xlsx (קריאה בלבד)", 'streaming_extract', path),
+        ]:
+            result, elapsed, peak_mb = measure(name, target)
+            print(f"{title}: {elapsed:.2f} שניות, שיא RSS {peak_mb:.0f} MB ({result:,})")
+
+        sample_rows = min(rows, LEGACY_SAMPLE_ROWS)
+        legacy_result, legacy_elapsed, legacy_peak = measure('full_mode_random_access', sample_path)
+        stream_result, stream_elapsed, stream_peak = measure('streaming_read', sample_path)
+        print(f"מדגם של {sample_rows:,} שורות - ws[row_idx] במצב מלא: {legacy_elapsed:.2f} שניות, "
+              f"קריאה בלבד: {stream_elapsed:.2f} שניות (x{legacy_elapsed / stream_elapsed:.0f})")
+
+
+if __name__ == "__main__":
+    main()
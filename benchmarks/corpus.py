@@ -0,0 +1,53 @@
+import random
+from typing import List
+
+FIRST_NAMES = ['משה', 'דוד', 'יוסי', 'אבי', 'רונית', 'מיכל', 'שרה', 'יעל', 'נועה', 'איתי', 'עומר', 'תמר']
+LAST_NAMES = ['כהן', 'לוי', 'מזרחי', 'פרץ', 'ביטון', 'אברהם', 'פרידמן', 'שפירא', 'גולן', 'אזולאי']
+ROLES = ['מנהל מכירות', 'יועצת משכנתאות', 'סוכן ביטוח', 'רכזת הדרכה', 'מנכ"ל', 'נציג שירות']
+STREETS = ['רחוב הרצל', 'שד\' רוטשילד', 'דרך בגין', 'רח\' ז\'בוטינסקי', 'רחוב ויצמן']
+CITIES = ['תל אביב', 'רמת גן', 'חיפה', 'ירושלים', 'פתח תקווה', 'נתניה', 'רעננה']
+DOMAINS = ['gmail.com', 'walla.co.il', 'hotmail.com', 'bezeqint.net', 'company.co.il']
+NOTES = ['בטיפול', 'לא רלוונטי', 'ניסיתי', 'מעוניין', 'הועבר ל', '']
+
+
+def random_phone(rng: random.Random) -> str:
+    """מייצר מספר טלפון באחד הפורמטים הנפוצים בקבצים"""
+    mobile = f"05{rng.randint(0, 9)}"
+    line = f"0{rng.choice('23489')}"
+    number = f"{rng.randint(0, 9999999):07d}"
+    formats = [
+        f"{mobile}-{number}",
+        f"{mobile}{number}",
+        f"{mobile} {number[:3]} {number[3:]}",
+        f"{line}-{number}",
+        f"{line}{number}",
+        f"+972-{mobile[1:]}-{number}",
+        f"+972{mobile[1:]}{number}",
+        f"972{mobile[1:]}{number}",
+        f"{mobile}({number[:3]}){number[3:]}",
+    ]
+    return rng.choice(formats)
+
+
+def random_email(rng: random.Random) -> str:
+    """מייצר כתובת מייל"""
+    local = rng.choice(['info', 'office', 'moshe', 'dana.levi', 'sales', 'r.cohen']) + str(rng.randint(0, 999))
+    return f"{local}@{rng.choice(DOMAINS)}"
+
+
+def generate_rows(count: int, seed: int = 42) -> List[str]:
+    """מייצר שורות טקסט בעברית בסגנון רשימות המשתתפים"""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        parts = [name, rng.choice(ROLES)]
+        if rng.random() < 0.8:
+            parts.append(f"טל: {random_phone(rng)}")
+        if rng.random() < 0.6:
+            parts.append(f"מייל: {random_email(rng)}")
+        if rng.random() < 0.4:
+            parts.append(f"{rng.choice(STREETS)} {rng.randint(1, 120)}, {rng.choice(CITIES)}")
+        parts.append(rng.choice(NOTES))
+        rows.append(' – '.join(part for part in parts if part))
+    return rows
@@ -1,50 +1,156 @@
+import hashlib
 import logging
 import re
-from typing import Dict, List, Optional, Set, Tuple
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from docx import Document
-import pdfplumber
 from openpyxl import load_workbook
 import json
 import os
 import pandas as pd
 import PyPDF2
+from dedup_engine import DedupEngine, NearDuplicateEngine
+from document_cache import DocumentCache
+from exporters import ExcelStreamWriter, open_writer
+from pdf_engine import PdfPageEngine
+from scan_manifest import ScanManifest
+from table_engine import ColumnarEngine
+from text_engine import (
+    EMAIL_CANDIDATE_PATTERN, EMAIL_REJECT_PATTERN, NORMALIZE_TABLE,
+    AnalyzedText, EmailEngine, KeywordMatcher, PhoneScanner, TextAnalyzer, TextNormalizer,
+)
+
+# קבוצה ריקה משותפת לאנשי קשר שעדיין אין להם טלפון / מייל / כתובת
+_EMPTY: FrozenSet[str] = frozenset()
+
+_PHONE_SEPARATORS_PATTERN = re.compile(r'[\s\-\(\)]')
+_PHONE_SPACING_PATTERN = re.compile(r'[\s\-]')
+_VALID_PHONE_PATTERN = re.compile(r'^\+?972\d{8,9}$')
+_VALID_EMAIL_PATTERN = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+
+# מספר השורות שנאספות מגיליון Excel לפני חילוץ עמודתי - מגביל את הזיכרון בקבצים גדולים
+_TABLE_BATCH_ROWS = 5000
+
+# סיומות הקבצים שנסרקים ב-scan_directory
+_SCAN_EXTENSIONS = ['txt', 'docx', 'pdf', 'xlsx', 'xls']
+
+# קובץ אנשי הקשר של save_contacts_to_excel ו-save_contacts: עמודות, וסגנונות הכותרת והתאים ב-Excel
+_EXCEL_COLUMNS = [('name', 'שם'), ('role', 'תפקיד'), ('phones', 'טלפון'), ('emails', 'אימייל'),
+                  ('addresses', 'כתובת'), ('source_file', 'קובץ מקור')]
+_EXCEL_HEADER_FORMAT = {'bold': True, 'bg_color': '#D7E4BC', 'border': 1, 'text_wrap': True, 'valign': 'top'}
+_EXCEL_CELL_FORMAT = {'border': 1, 'text_wrap': True, 'valign': 'top'}
+_EXCEL_MAX_WIDTH = 100
+
+# גרסאות המטמון: יש להעלות את _PARSE_REVISION בכל שינוי בפירוק הקבצים (_parse_*),
+# ואת _RULES_REVISION בכל שינוי בקוד החילוץ שאינו מתבטא ב-rules_version (מילים ותבניות)
+_PARSE_REVISION = 3
+_RULES_REVISION = 1
+
+
+def _contact_row(contact: 'Contact') -> list:
+    """שורת הפלט של איש קשר לפי _EXCEL_COLUMNS"""
+    return [
+        contact.name,
+        contact.role,
+        '; '.join(contact.phones),
+        '; '.join(contact.emails),
+        '; '.join(contact.addresses),
+        contact.source_file,
+    ]
+
+
+def _union(current: Optional[Set[str]], other: Optional[Set[str]]) -> Optional[Set[str]]:
+    """מוסיף את ערכי other לקבוצה הקיימת, ויוצר אותה רק אם צריך"""
+    if not other:
+        return current
+    if current is None:
+        return set(other)
+    current.update(other)
+    return current
+
 
 class Contact:
+    __slots__ = ('_name', '_phones', '_emails', '_addresses', '_source_file', 'role', '_valid')
+
+    # לוגר אחד לכל אנשי הקשר; ההודעות מפורמטות רק כשרמת DEBUG פעילה
+    logger = logging.getLogger(__name__)
+
     def __init__(self, name: str = None, phone: str = None, email: str = None, address: str = None, source_file: str = None):
-        self.name = name
-        self.phones: Set[str] = {phone} if phone else set()
-        self.emails: Set[str] = {email} if email else set()
-        self.addresses: Set[str] = {address} if address else set()
+        self._name = name
+        # הקבוצות נוצרות רק כשמוסיפים להן ערך
+        self._phones: Optional[Set[str]] = {phone} if phone else None
+        self._emails: Optional[Set[str]] = {email} if email else None
+        self._addresses: Optional[Set[str]] = {address} if address else None
         self.source_file = source_file
         self.role = None
-        self.logger = logging.getLogger(__name__)
-        self.logger.debug(f"יצירת איש קשר חדש: {name}")
+        # תוצאת is_valid האחרונה, None אם איש הקשר השתנה מאז
+        self._valid: Optional[bool] = None
+        self.logger.debug("יצירת איש קשר חדש: %s", name)
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._name
+
+    @name.setter
+    def name(self, value: Optional[str]) -> None:
+        self._name = value
+        self._valid = None
+
+    @property
+    def phones(self) -> Set[str]:
+        return self._phones or _EMPTY
+
+    @property
+    def emails(self) -> Set[str]:
+        return self._emails or _EMPTY
+
+    @property
+    def addresses(self) -> Set[str]:
+        return self._addresses or _EMPTY
+
+    @property
+    def source_file(self) -> Optional[str]:
+        return self._source_file
+
+    @source_file.setter
+    def source_file(self, value: Optional[str]) -> None:
+        # אלפי אנשי קשר מאותו גיליון חולקים מחרוזת מקור אחת
+        self._source_file = sys.intern(value) if value else value
 
     def add_phone(self, phone: str) -> None:
         if phone:
             # ניקוי מספר הטלפון
-            phone = re.sub(r'[\s\-\(\)]', '', phone)
+            phone = _PHONE_SEPARATORS_PATTERN.sub('', phone)
             # בדיקת תקינות בסיסית - לפחות 9 ספרות
-            if len(re.findall(r'\d', phone)) >= 9:
+            if sum(c.isdecimal() for c in phone) >= 9:
                 if phone.startswith('972'):
                     phone = '+' + phone
                 elif phone.startswith('05'):
                     phone = '+972' + phone[1:]
                 elif phone.startswith('0'):
                     phone = '+972' + phone[1:]
-                self.phones.add(phone)
-                self.logger.debug(f"הוספת מספר טלפון: {phone} לאיש קשר {self.name}")
+                if self._phones is None:
+                    self._phones = set()
+                self._phones.add(phone)
+                self._valid = None
+                self.logger.debug("הוספת מספר טלפון: %s לאיש קשר %s", phone, self._name)
             else:
-                self.logger.debug(f"דילוג על מספר טלפון לא תקין: {phone}")
+                self.logger.debug("דילוג על מספר טלפון לא תקין: %s", phone)
 
     def add_email(self, email: str) -> None:
         if email:
             email = email.lower().strip()
-            if re.match(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$', email):
-                self.emails.add(email)
-                self.logger.debug(f"הוספת כתובת מייל: {email} לאיש קשר {self.name}")
+            if _VALID_EMAIL_PATTERN.match(email):
+                if self._emails is None:
+                    self._emails = set()
+                self._emails.add(email)
+                self._valid = None
+                self.logger.debug("הוספת כתובת מייל: %s לאיש קשר %s", email, self._name)
             else:
-                self.logger.debug(f"דילוג על כתובת מייל לא תקינה: {email}")
+                self.logger.debug("דילוג על כתובת מייל לא תקינה: %s", email)
 
     def add_address(self, address: str) -> None:
         if address:
@@ -52,77 +158,119 @@ class Contact:
             # בדיקה שהכתובת מכילה לפחות 2 מילים ומספר או אותיות בעברית
             words = address.split()
             if len(words) >= 2 and (any(c.isdigit() for c in address) or re.search(r'[\u0590-\u05FF]', address)):
-                self.addresses.add(address)
-                self.logger.debug(f"הוספת כתובת: {address} לאיש קשר {self.name}")
+                if self._addresses is None:
+                    self._addresses = set()
+                self._addresses.add(address)
+                self.logger.debug("הוספת כתובת: %s לאיש קשר %s", address, self._name)
             else:
-                self.logger.debug(f"דילוג על כתובת לא תקינה: {address}")
+                self.logger.debug("דילוג על כתובת לא תקינה: %s", address)
 
     def add_role(self, role: str) -> None:
         if role:
             role = role.strip()
             if len(role) >= 2 and any(c.isalpha() for c in role):
                 self.role = role
-                self.logger.debug(f"הוספת תפקיד: {role} לאיש קשר {self.name}")
+                self.logger.debug("הוספת תפקיד: %s לאיש קשר %s", role, self._name)
             else:
-                self.logger.debug(f"דילוג על תפקיד לא תקין: {role}")
+                self.logger.debug("דילוג על תפקיד לא תקין: %s", role)
 
     def merge(self, other: 'Contact') -> None:
         if other.name and (not self.name or len(other.name) > len(self.name)):
-            self.name = other.name
-            self.logger.debug(f"עדכון שם בזמן מיזוג: {self.name}")
-        self.phones.update(other.phones)
-        self.emails.update(other.emails)
-        self.addresses.update(other.addresses)
+            self._name = other.name
+            self.logger.debug("עדכון שם בזמן מיזוג: %s", self._name)
+        self._phones = _union(self._phones, other._phones)
+        self._emails = _union(self._emails, other._emails)
+        self._addresses = _union(self._addresses, other._addresses)
         if other.role and (not self.role or len(other.role) > len(self.role)):
             self.role = other.role
-            self.logger.debug(f"עדכון תפקיד בזמן מיזוג: {self.role}")
+            self.logger.debug("עדכון תפקיד בזמן מיזוג: %s", self.role)
         if other.source_file:
-            self.source_file = other.source_file
-        self.logger.debug(f"מיזוג הושלם עבור איש קשר: {self.name}")
+            self._source_file = other.source_file
+        self._valid = None
+        self.logger.debug("מיזוג הושלם עבור איש קשר: %s", self._name)
+
+    def to_record(self, file_path: str) -> Dict:
+        """ממיר למילון לשמירה במטמון. קובץ המקור נשמר יחסית לנתיב הקובץ שחולץ"""
+        record = {
+            'name': self._name,
+            'role': self.role,
+            'phones': sorted(self.phones),
+            'emails': sorted(self.emails),
+            'addresses': sorted(self.addresses),
+            'source': self._source_file,
+        }
+        if self._source_file and self._source_file.startswith(file_path):
+            record['source'] = None
+            record['source_suffix'] = self._source_file[len(file_path):]
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict, file_path: str) -> 'Contact':
+        """בונה איש קשר ממילון שנשמר ב-to_record, בלי להריץ שוב את הנרמול של add_*"""
+        source = record['source']
+        if 'source_suffix' in record:
+            source = file_path + record['source_suffix']
+        contact = cls(name=record['name'], source_file=source)
+        contact.role = record['role']
+        contact._phones = set(record['phones']) or None
+        contact._emails = set(record['emails']) or None
+        contact._addresses = set(record['addresses']) or None
+        return contact
 
     def is_valid(self) -> bool:
         """בודק אם איש הקשר תקין"""
+        # התוצאה נשמרת עד לשינוי הבא באיש הקשר
+        if self._valid is None:
+            self._valid = self._check_valid()
+        return self._valid
+
+    def _check_valid(self) -> bool:
+        """מריץ את בדיקות התקינות בפועל"""
         # בדיקת שם
-        if not self.name or not any(c.isalpha() for c in self.name):
-            self.logger.debug(f"איש קשר לא תקין - שם חסר או לא תקין: {self.name}")
+        if not self._name or not any(c.isalpha() for c in self._name):
+            self.logger.debug("איש קשר לא תקין - שם חסר או לא תקין: %s", self._name)
             return False
             
         # בדיקת אורך שם
-        if len(self.name.strip()) < 2:
-            self.logger.debug(f"איש קשר לא תקין - שם קצר מדי: {self.name}")
+        if len(self._name.strip()) < 2:
+            self.logger.debug("איש קשר לא תקין - שם קצר מדי: %s", self._name)
             return False
             
         # בדיקת פרטי קשר - חייב לפחות טלפון או אימייל
-        has_contact = bool(self.phones or self.emails)
+        has_contact = bool(self._phones or self._emails)
         if not has_contact:
-            self.logger.debug(f"איש קשר לא תקין - אין פרטי קשר: {self.name}")
+            self.logger.debug("איש קשר לא תקין - אין פרטי קשר: %s", self._name)
             return False
             
         # בדיקת תקינות טלפונים
         for phone in self.phones:
-            if not re.match(r'^\+?972\d{8,9}$', re.sub(r'[\s\-]', '', phone)):
-                self.logger.debug(f"איש קשר לא תקין - מספר טלפון לא תקין: {phone}")
+            if not _VALID_PHONE_PATTERN.match(_PHONE_SPACING_PATTERN.sub('', phone)):
+                self.logger.debug("איש קשר לא תקין - מספר טלפון לא תקין: %s", phone)
                 return False
                 
         # בדיקת תקינות אימיילים
         for email in self.emails:
-            if not re.match(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$', email):
-                self.logger.debug(f"איש קשר לא תקין - כתובת אימייל לא תקינה: {email}")
+            if not _VALID_EMAIL_PATTERN.match(email):
+                self.logger.debug("איש קשר לא תקין - כתובת אימייל לא תקינה: %s", email)
                 return False
                 
-        self.logger.debug(f"איש קשר תקין: {self.name} (טלפונים: {len(self.phones)}, אימיילים: {len(self.emails)})")
+        self.logger.debug("איש קשר תקין: %s (טלפונים: %d, אימיילים: %d)", self._name, len(self.phones), len(self.emails))
         return True
 
 class ContactExtractor:
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, pdf_workers: Optional[int] = 1):
         self.logger = logging.getLogger(__name__)
         
         # Israeli address pattern with variations
-        self.street_prefixes = r'(?:רח\'|רחוב|שד\'|שדרות|דרך|סמטת|סמ\'|שכונת|שכ\'|בול\'|בולוורד|כיכר|מתחם)'
+        self.street_prefix_words = [
+            "רח'", 'רחוב', "שד'", 'שדרות', 'דרך', 'סמטת', "סמ'", 'שכונת', "שכ'",
+            "בול'", 'בולוורד', 'כיכר', 'מתחם'
+        ]
+        self.street_prefixes = '(?:' + '|'.join(self.street_prefix_words) + ')'
         self.city_names = r'(?:תל[- ]אביב|רמת[- ]גן|חיפה|ירושלים|באר[- ]שבע|רחובות|פתח[- ]תקווה|רעננה|הרצליה|גבעתיים|חולון|בת[- ]ים|נתניה|אשדוד|אשקלון|רמלה|לוד|כפר[- ]סבא|רמת[- ]השרון|ראש[- ]העין|פ"ת|פ״ת|רמת גן|רמת-גן|תל אביב|תל-אביב|באר שבע|באר-שבע)'
         
         # Words that indicate a role/title rather than a name
-        self.role_words = [
+        self.role_words = frozenset([
             'מנהל', 'מנהלת', 'יועץ', 'יועצת', 'עובד', 'עובדת', 'אחראי', 'אחראית',
             'מזכיר', 'מזכירה', 'ראש', 'סגן', 'סגנית', 'מפקח', 'מפקחת', 'רכז', 'רכזת',
             'משפטי', 'משפטית', 'כספים', 'פרויקט', 'שירות', 'לקוחות', 'תפעול', 'מחקר',
@@ -131,87 +279,225 @@ class ContactExtractor:
             'מערב', 'מזרח', 'סוכן', 'סוכנת', 'נציג', 'נציגה', 'מוקד', 'שלוחה',
             'בטיפול', 'במעקב', 'הועבר', 'לא', 'כרגע', 'רלוונטי', 'נרשם', 'נרשמה',
             'מעוניין', 'ניסיתי', 'רחוק', 'קורס', 'לימודי', 'בוקר', 'השקעות',
-            'מנכ"ל', 'מנכ"לית', 'סמנכ"ל', 'סמנכ"לית', 'מנהל', 'מנהלת', 'מנהלים',
-            'מנהלות', 'מנהלי', 'מנהלות', 'מנהל', 'מנהלת', 'מנהלים', 'מנהלות',
-            'מנהלי', 'מנהלות', 'מנהל', 'מנהלת', 'מנהלים', 'מנהלות', 'מנהלי', 'מנהלות'
-        ]
+            'מנכ"ל', 'מנכ"לית', 'סמנכ"ל', 'סמנכ"לית', 'מנהלים', 'מנהלות', 'מנהלי'
+        ])
         
         # Contact label patterns
-        self.contact_labels = [
+        self.contact_labels = frozenset([
             'טלפון', 'נייד', 'טל', 'פקס', 'דוא"ל', 'אימייל', 'מייל', 'כתובת',
             'שם', 'איש קשר', 'פרטי התקשרות', 'פרטים', 'פרטי קשר', 'תפקיד',
             'משרד', 'סניף', 'מחלקה', 'יחידה', 'אגף', 'מטה', 'הנהלה',
             'טלפון:', 'נייד:', 'טל:', 'פקס:', 'דוא"ל:', 'אימייל:', 'מייל:', 'כתובת:',
             'שם:', 'איש קשר:', 'פרטי התקשרות:', 'פרטים:', 'פרטי קשר:', 'תפקיד:',
             'משרד:', 'סניף:', 'מחלקה:', 'יחידה:', 'אגף:', 'מטה:', 'הנהלה:'
-        ]
+        ])
+        self.non_name_words = self.role_words | self.contact_labels
+
+        # סיווג שורות טקסט במעבר אחד: כתובת, פרטי קשר, מציין שם ומילות תפקיד
+        self.line_matcher = KeywordMatcher({
+            'street': self.street_prefix_words,
+            'address_word': ['קומה', 'דירה', 'כניסה', 'בניין', 'מתחם'],
+            'contact_detail': [
+                'טלפון:', 'נייד:', 'טל:', 'פקס:', 'דוא"ל:', 'אימייל:', 'מייל:', 'כתובת:',
+                'ת.ד.', 'מיקוד', 'ת.ז.', '@', 'שלוחה', 'מוקד:', 'אזור', 'ראש העין'
+            ],
+            'name_indicator': ['שם:', 'איש קשר:', 'נציג:'],
+            'role': self.role_words,
+        })
+
+        # זיהוי שורת כותרות ועמודות בטבלאות (Excel, Word ו-PDF)
+        self.column_order = ['name', 'phone', 'email', 'address', 'role']
+        self.column_titles = {'name': 'שם', 'phone': 'טלפון', 'email': 'מייל', 'address': 'כתובת', 'role': 'תפקיד'}
+        self.header_matcher = KeywordMatcher({
+            'header': ['שם', 'טלפון', 'מייל', 'כתובת', 'תפקיד'],
+            'name': ['שם', 'איש קשר', 'נציג', 'חברה', 'שם פרטי', 'שם משפחה', 'שם מלא'],
+            'phone': ['טלפון', 'נייד', 'טל', 'פלאפון', 'מס טלפון', 'טלפונים', 'סלולרי', 'נייח'],
+            'email': ['מייל', 'אימייל', 'דוא"ל', 'דואל', 'כתובת מייל', 'אימיילים', '@'],
+            'address': ['כתובת', 'עיר', 'ישוב', 'רחוב', 'בית', 'כתובות', 'מיקוד'],
+            'role': ['תפקיד', 'תפקידים', 'תפקידים נוספים', 'משרה', 'תפקיד בחברה'],
+        })
 
         # Compile regex patterns
         self.name_pattern = re.compile(r'[\u0590-\u05FF]+(?:\s+[\u0590-\u05FF]+){1,3}')
-        self.phone_pattern = re.compile(r'(?:\+972|05\d|\+972-\d{2}|0\d{1,2}[-.]?)\d{7,8}')
-        self.email_pattern = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
         self.address_pattern = re.compile(f"{self.street_prefixes}\\s+[\\u0590-\\u05FF\\s,]+\\d+|{self.city_names}")
+        self.phone_scanner = PhoneScanner()
+        self.email_engine = EmailEngine()
+        self.normalizer = TextNormalizer()
+
+        # כל תבניות הכתובת מתחילות באחת מהמילים האלה - בלעדיהן אין טעם לסרוק
+        self.address_hint_pattern = re.compile(f"{self.street_prefixes}|ת\\.?ד|מיקוד|בניין|דירה|קומה|כניסה")
+        self.analyzer = TextAnalyzer(self.normalizer, self.address_hint_pattern)
+
+        # חילוץ טלפונים ומיילים מעמודות שלמות של טבלאות
+        self.columnar = ColumnarEngine(self.phone_scanner, self.email_engine)
+
+        # פירוק PDF בניתוח פריסה אחד לעמוד; pdf_workers גדול מ-1 (או None לכל הליבות) מפזר
+        # את העמודים של קובץ ארוך על מאגר תהליכים
+        self.pdf_engine = PdfPageEngine(pdf_workers)
+
+        # איחוד כפילויות לפי כל טלפון ומייל, ולפי דמיון שם בתוך בלוקים
+        self.dedup = DedupEngine()
+        self.near_duplicates = NearDuplicateEngine()
         
         # Initialize contacts list
         self.contacts = []
-
-    def scan_directory(self, directory_path: str) -> List[Contact]:
-        """סורק תיקייה ומחלץ אנשי קשר מכל הקבצים הנתמכים"""
-        contacts = []
-        try:
-            for root, dirs, files in os.walk(directory_path):
-                for file in files:
-                    if file.lower().endswith(tuple(f'.{ext}' for ext in ['xlsx', 'xls', 'doc', 'docx', 'pdf'])):
-                        file_path = os.path.join(root, file)
-                        try:
-                            self.logger.info(f"מעבד קובץ: {file_path}")
-                            file_contacts = self.extract_contacts(file_path)
-                            contacts.extend(file_contacts)
-                            self.logger.info(f"נמצאו {len(file_contacts)} אנשי קשר בקובץ {file_path}")
-                        except Exception as e:
-                            self.logger.error(f"שגיאה בעיבוד הקובץ {file_path}: {str(e)}")
-                            continue
-        except Exception as e:
-            self.logger.error(f"שגיאה בסריקת התיקייה {directory_path}: {str(e)}")
         
-        self.logger.info(f"נמצאו {len(contacts)} אנשי קשר בסך הכל בתיקייה {directory_path}")
-        return contacts
-
-    def _clean_text(self, text: str) -> str:
-        """מנקה ומנרמל טקסט"""
-        if not text:
-            return ""
-            
-        # המרה למחרוזת
-        text = str(text)
+        # שגיאות הסריקה האחרונה של scan_directory: נתיב קובץ -> הודעת שגיאה
+        self.scan_errors: Dict[str, str] = {}
+        # סיכום הסריקה האחרונה: קבצים, דולגו, חולצו, נכשלו, אנשי קשר וזמן
+        self.scan_stats: Dict[str, float] = {}
+        # רשימת הקבצים של הסריקה המצטברת האחרונה, עד ש-commit_scan שומר אותה
+        self.scan_manifest: Optional[ScanManifest] = None
         
-        # החלפת גרשיים שונים
-        text = re.sub(r'[""״\'׳]', '"', text)
+        # מטמון המסמכים המפורקים ואנשי הקשר שחולצו מהם (כבוי אם לא הוגדרה תיקייה)
+        self.document_cache = DocumentCache(cache_dir, f"v{_PARSE_REVISION}") if cache_dir else None
+
+    def scan_directory(self, directory_path: str, workers: Optional[int] = 1,
+                       manifest_path: Optional[str] = None) -> list:
+        """סורק תיקייה ומחלץ אנשי קשר מכל הקבצים המתאימים.
+        workers גדול מ-1 (או None לכל הליבות) מפזר את הקבצים על מאגר תהליכים, והתוצאות מאוחדות לפי סדר הקבצים.
+        manifest_path מפעיל סריקה מצטברת: קבצים שלא השתנו מאז הסריקה הקודמת מדולגים,
+        ומוחזרים רק אנשי הקשר מקבצים חדשים או ששונו. הרשימה המעודכנת לא נשמרת כאן - הקורא
+        שומר קודם את אנשי הקשר שהוחזרו ואחר כך קורא ל-commit_scan, כך שקריסה ביניהם לא מסמנת
+        קבצים כחולצו בלי שאנשי הקשר שלהם נשמרו"""
+        start_time = time.perf_counter()
+        file_paths = self._list_scan_files(directory_path)
+        self.scan_errors = {}
         
-        # החלפת מקפים שונים
-        text = re.sub(r'[-–—]', '-', text)
+        manifest = ScanManifest(manifest_path) if manifest_path else None
+        pending = [file_path for file_path in file_paths if not manifest.is_unchanged(file_path)] if manifest else file_paths
         
-        # החלפת פסיקים שונים
-        text = re.sub(r'[,،]', ',', text)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(pending))
         
-        # החלפת נקודות שונים
-        text = re.sub(r'[\.٫]', '.', text)
+        if workers > 1:
+            self.logger.info(f"סורק {len(pending)} קבצים ב-{workers} תהליכים")
+            results = self._scan_parallel(pending, workers)
+        else:
+            results = [_extract_file(self, file_path) for file_path in pending]
         
-        # החלפת נקודותיים שונים
-        text = re.sub(r'[:׃]', ':', text)
+        all_contacts = []
+        for file_path, contacts, error in results:
+            if error is not None:
+                # שגיאה בקובץ אחד לא עוצרת את הסריקה - נרשמת עם נתיב הקובץ
+                self.scan_errors[file_path] = error
+                self.logger.error(f"שגיאה בקריאת הקובץ {file_path}: {error}")
+                continue
+            all_contacts.extend(contacts)
+            # קובץ שנכשל לא נרשם, כך שינוסה שוב בסריקה הבאה
+            if manifest:
+                manifest.record(file_path)
         
-        # החלפת סוגריים שונים
-        text = re.sub(r'[\(\)]', '(', text)
-        text = re.sub(r'[\[\]]', '[', text)
-        text = re.sub(r'[\{\}]', '{', text)
+        if manifest:
+            manifest.prune(directory_path, file_paths)
+        self.scan_manifest = manifest
         
-        # החלפת רווחים מיותרים
-        text = re.sub(r'\s+', ' ', text)
+        self.scan_stats = {
+            'files': len(file_paths),
+            'skipped': len(file_paths) - len(pending),
+            'extracted': len(pending) - len(self.scan_errors),
+            'failed': len(self.scan_errors),
+            'contacts': len(all_contacts),
+            'seconds': time.perf_counter() - start_time,
+        }
+        self.logger.info(
+            f"נמצאו {len(all_contacts)} אנשי קשר ב-{len(file_paths)} קבצים בתיקייה {directory_path} "
+            f"(דולגו {self.scan_stats['skipped']}, חולצו {self.scan_stats['extracted']}, "
+            f"נכשלו {self.scan_stats['failed']}, {self.scan_stats['seconds']:.2f} שניות)"
+        )
+        return all_contacts
+
+    def commit_scan(self) -> None:
+        """שומר את רשימת הקבצים של הסריקה המצטברת האחרונה - לקרוא אחרי שאנשי הקשר שהיא החזירה נשמרו"""
+        if self.scan_manifest is not None:
+            self.scan_manifest.save()
+            self.scan_manifest = None
+
+    def _list_scan_files(self, directory_path: str) -> List[str]:
+        """מחזיר את הקבצים הנתמכים בתיקייה בסדר קבוע (ממוין לפי תיקייה ושם)"""
+        file_paths = []
+        for root, dirs, files in os.walk(directory_path):
+            dirs.sort()
+            for file in sorted(files):
+                if file.split('.')[-1].lower() in _SCAN_EXTENSIONS:
+                    file_paths.append(os.path.join(root, file))
+        return file_paths
+
+    def _scan_parallel(self, file_paths: List[str], workers: int) -> List[Tuple[str, list, Optional[str]]]:
+        """מחלץ את הקבצים במאגר תהליכים ומחזיר את התוצאות לפי סדר הקבצים"""
+        results = {}
+        crashed = []
+        cache_args = (self.document_cache.cache_dir,) if self.document_cache else ()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_scan_worker, initargs=cache_args) as pool:
+            futures = [(file_path, pool.submit(_scan_file, file_path)) for file_path in file_paths]
+            for file_path, future in futures:
+                try:
+                    results[file_path] = future.result()
+                except BrokenProcessPool:
+                    crashed.append(file_path)
+                except Exception as e:
+                    results[file_path] = (file_path, [], str(e))
         
-        # הסרת רווחים בתחילת וסוף הטקסט
-        text = text.strip()
+        # תהליך שקרס מפיל את כל המאגר - כל קובץ שנפגע מורץ שוב לבד כדי לזהות את הקובץ האשם
+        for file_path in crashed:
+            self.logger.warning(f"תהליך עבודה קרס, מריץ שוב את הקובץ {file_path}")
+            with ProcessPoolExecutor(max_workers=1, initializer=_init_scan_worker, initargs=cache_args) as pool:
+                try:
+                    results[file_path] = pool.submit(_scan_file, file_path).result()
+                except Exception as e:
+                    results[file_path] = (file_path, [], f"תהליך העבודה קרס: {str(e) or type(e).__name__}")
         
-        return text
+        return [results[file_path] for file_path in file_paths]
+
+    @property
+    def rules_version(self) -> str:
+        """גיבוב קצר של כללי החילוץ - שינוי במילות תפקיד, תוויות, תבניות או כותרות נותן גרסה חדשה"""
+        rules = {
+            'revision': _RULES_REVISION,
+            'role_words': sorted(self.role_words),
+            'contact_labels': sorted(self.contact_labels),
+            'street_prefix_words': self.street_prefix_words,
+            'city_names': self.city_names,
+            'line_vocabularies': {label: sorted(words) for label, words in self.line_matcher.vocabularies.items()},
+            'header_vocabularies': {label: sorted(words) for label, words in self.header_matcher.vocabularies.items()},
+            'patterns': [
+                self.name_pattern.pattern, self.address_pattern.pattern, self.address_hint_pattern.pattern,
+                self.phone_scanner.pattern.pattern, EMAIL_CANDIDATE_PATTERN.pattern, EMAIL_REJECT_PATTERN.pattern,
+            ],
+            'normalize_table': sorted(NORMALIZE_TABLE.items()),
+        }
+        encoded = json.dumps(rules, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def _clean_text(self, text: str) -> str:
+        """מנקה ומנרמל טקסט"""
+        if not text:
+            return ""
+
+        # המרה למחרוזת
+        return self.normalizer.normalize(str(text))
+
+    def _analyze(self, text) -> AnalyzedText:
+        """מנתח טקסט פעם אחת עבור כל המחלצים (מקבל גם ניתוח קיים)"""
+        if isinstance(text, AnalyzedText):
+            return text
+        return self.analyzer.analyze(str(text) if text else "")
+
+    def _is_header_row(self, row_values: List[str]) -> bool:
+        """בודק אם שורה מכילה מספיק מידע להיות שורת כותרות"""
+        return 'header' in self.header_matcher.labels(" ".join(row_values).lower())
+
+    def _detect_columns(self, headers: List[str]) -> Dict[str, List[int]]:
+        """ממפה כל כותרת לסוג העמודה שלה (שם, טלפון, מייל, כתובת, תפקיד)"""
+        columns = {column: [] for column in self.column_order}
+        for idx, header in enumerate(headers):
+            header = str(header).lower()
+            column = self.header_matcher.first(header, self.column_order)
+            if column:
+                columns[column].append(idx)
+                self.logger.debug(f"נמצאה עמודת {self.column_titles[column]}: {header} (עמודה {idx+1})")
+        return columns
 
     def _is_likely_name_line(self, line: str) -> bool:
         """בודק אם שורה נראית כמו שם"""
@@ -223,28 +509,27 @@ class ContactExtractor:
         if len(line.split()) > 8:  # הוגדל כדי לאפשר תארים ותפקידים
             return False
             
+        # סיווג השורה במעבר אחד מול כל אוצרות המילים
+        labels = self.line_matcher.labels(line)
+
         # דילוג על שורות שנראות כמו כתובות או מכילות מספרים
-        if (re.search(self.street_prefixes, line) or 
+        if ('street' in labels or 
             re.search(r'\d{3,}', line) or
-            re.search(r'קומה|דירה|כניסה|בניין|מתחם', line)):
+            'address_word' in labels):
             return False
             
         # דילוג על שורות שמכילות פרטי קשר
-        if any(pattern in line.lower() for pattern in [
-            'טלפון:', 'נייד:', 'טל:', 'פקס:', 'דוא"ל:', 'אימייל:', 'מייל:', 'כתובת:',
-            'ת.ד.', 'מיקוד', 'ת.ז.', '@', 'שלוחה', 'מוקד:', 'אזור', 'ראש העין'
-        ]):
+        if 'contact_detail' in labels:
             return False
             
         # דילוג על שורות שמכילות רק מילות תפקיד או מילים נפוצות
         words = line.split()
-        non_name_words = [w for w in words if w not in self.role_words and 
-                         w not in self.contact_labels]
+        non_name_words = [w for w in words if w not in self.non_name_words]
         if not non_name_words:
             return False
             
         # בדיקה אם השורה מתחילה בתואר או מכילה אינדיקטורים לשם
-        if any(indicator in line for indicator in ['שם:', 'איש קשר:', 'נציג:']):
+        if 'name_indicator' in labels:
             return True
             
         # בדיקה אם השורה מכילה תבנית שם עברי (לפחות שתי מילים בעברית)
@@ -295,7 +580,7 @@ class ContactExtractor:
             # בדיקה אם החלק השני נראה כמו המשך שם
             if (len(second_part.split()) <= 2 and 
                 re.search(r'[\u0590-\u05FF]', second_part) and
-                not any(word in second_part for word in self.role_words)):
+                'role' not in self.line_matcher.labels(second_part)):
                 name = f"{name} {second_part}"
         
         # דילוג אם זה רק תואר או מילה נפוצה
@@ -304,7 +589,7 @@ class ContactExtractor:
             
         # דילוג אם מכיל רק מילות תפקיד או מילים נפוצות
         words = name.split()
-        non_role_words = [w for w in words if w not in self.role_words and w not in self.contact_labels]
+        non_role_words = [w for w in words if w not in self.non_name_words]
         if not non_role_words:
             return None
             
@@ -330,8 +615,14 @@ class ContactExtractor:
         self.logger.debug(f"נמצא שם: {name}")
         return name
 
-    def _extract_name_and_role(self, text: str) -> Optional[Tuple[str, Optional[str]]]:
+    def _extract_name_and_role(self, text) -> Optional[Tuple[str, Optional[str]]]:
         """חולץ שם ותפקיד מטקסט"""
+        # שם חייב להכיל מילים בעברית
+        if isinstance(text, AnalyzedText):
+            if not text.hebrew_words:
+                return None
+            text = text.raw
+
         # ניסיון למצוא שם ותפקיד בפורמט: "שם - תפקיד"
         match = re.match(r'^(.+?)\s*[-,]\s*(.+?)(?=(?:,|\s*(?:טלפון|נייד|טל|פקס|דוא"ל|אימייל|מייל|כתובת)\s*:|$))', text)
         if match:
@@ -352,141 +643,38 @@ class ContactExtractor:
         
         return None
 
-    def _extract_phones(self, text: str) -> List[str]:
+    def _extract_phones(self, text) -> List[str]:
         """חולץ מספרי טלפון מטקסט"""
-        phones = set()
-        text = self._clean_text(text)
-        
-        # תבניות למספרי טלפון ישראליים
-        patterns = [
-            r'0[23489]-\d{7}',  # קווי
-            r'05[0-9]-\d{7}',   # ניידים
-            r'07[0-9]-\d{7}',   # מיוחדים
-            r'\+972[23489]\d{8}',  # פורמט בינלאומי קווי
-            r'\+972-?5[0-9]-?\d{7}',  # פורמט בינלאומי נייד
-            r'0[23489]\d{7}',  # קווי ללא מקף
-            r'05[0-9]\d{7}',   # ניידים ללא מקף
-            r'07[0-9]\d{7}',   # מיוחדים ללא מקף
-            r'972[23489]\d{8}',  # פורמט בינלאומי קווי ללא פלוס
-            r'9725[0-9]\d{7}',  # פורמט בינלאומי נייד ללא פלוס
-            r'0[23489]\s*\d{3}\s*\d{4}',  # קווי עם רווחים
-            r'05[0-9]\s*\d{3}\s*\d{4}',   # ניידים עם רווחים
-            r'07[0-9]\s*\d{3}\s*\d{4}',   # מיוחדים עם רווחים
-            r'0[23489]\(\d{3}\)\d{4}',  # קווי עם סוגריים
-            r'05[0-9]\(\d{3}\)\d{4}',   # ניידים עם סוגריים
-            r'07[0-9]\(\d{3}\)\d{4}'    # מיוחדים עם סוגריים
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                phone = match.group()
-                # ניקוי מספר הטלפון
-                phone = re.sub(r'[\s\-\(\)]', '', phone)
-                
-                # המרה לפורמט סטנדרטי
-                if phone.startswith('972'):
-                    phone = '+' + phone
-                elif phone.startswith('05'):
-                    phone = '+972' + phone[1:]
-                elif phone.startswith('0'):
-                    phone = '+972' + phone[1:]
-                
-                # בדיקת תקינות
-                if len(phone) >= 10:  # מספר מינימלי של ספרות
-                    phones.add(phone)
-                    self.logger.debug(f"נמצא מספר טלפון: {phone}")
-                
-        return sorted(list(phones))
+        analyzed = self._analyze(text)
+        # למספר הקצר ביותר (קווי) יש 9 ספרות
+        if analyzed.digit_count < 9:
+            return []
+        phones = self.phone_scanner.scan(analyzed.text)
+        for phone in phones:
+            self.logger.debug(f"נמצא מספר טלפון: {phone}")
+        return phones
 
-    def _extract_emails(self, text: str) -> List[str]:
+    def _extract_emails(self, text) -> List[str]:
         """חולץ כתובות מייל מטקסט"""
-        emails = set()
-        text = self._clean_text(text)
-        
-        # תבניות לכתובות מייל
-        patterns = [
-            r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',  # תבנית בסיסית
-            r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\.[a-zA-Z]{2,}',  # תתי-דומיינים
-            r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\.[a-zA-Z]{2,}\.[a-zA-Z]{2,}'  # תתי-דומיינים מרובים
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                email = match.group().lower().strip()
-                
-                # בדיקת תקינות
-                if self._is_valid_email(email):
-                    emails.add(email)
-                    self.logger.debug(f"נמצאה כתובת מייל: {email}")
-                
-        return sorted(list(emails))
+        analyzed = self._analyze(text)
+        if not analyzed.has_at:
+            return []
+        emails = self.email_engine.extract(analyzed.text)
+        for email in emails:
+            self.logger.debug(f"נמצאה כתובת מייל: {email}")
+        return emails
 
     def _is_valid_email(self, email: str) -> bool:
         """בודק תקינות כתובת מייל"""
-        # בדיקה בסיסית
-        if not re.match(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$', email):
-            return False
-            
-        # בדיקת תבניות לא תקינות
-        invalid_patterns = [
-            r'example\.com$',
-            r'test\.com$',
-            r'domain\.com$',
-            r'@.*@',
-            r'\.{2,}',
-            r'^[0-9]+@',
-            r'\.$',
-            r'\.@',
-            r'@\.',
-            r'\.@\.',
-            r'\.com\.',
-            r'\.net\.',
-            r'\.org\.',
-            r'\.edu\.',
-            r'\.gov\.',
-            r'\.mil\.',
-            r'\.int\.',
-            r'\.biz\.',
-            r'\.info\.',
-            r'\.name\.',
-            r'\.pro\.',
-            r'\.aero\.',
-            r'\.coop\.',
-            r'\.museum\.',
-            r'\.jobs\.',
-            r'\.mobi\.',
-            r'\.tel\.',
-            r'\.travel\.',
-            r'\.cat\.',
-            r'\.asia\.',
-            r'\.post\.',
-            r'\.xxx\.'
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, email):
-                return False
-                
-        # בדיקת אורך
-        if len(email) < 5 or len(email) > 254:
-            return False
-            
-        # בדיקת תווים מיוחדים
-        if re.search(r'[<>()\[\]\\,;:{}]', email):
-            return False
-            
-        # בדיקת תווים מיותרים
-        if re.search(r'[^\x00-\x7F]', email):
-            return False
-            
-        return True
+        return self.email_engine.is_valid(email)
 
-    def _extract_addresses(self, text: str) -> List[str]:
+    def _extract_addresses(self, text) -> List[str]:
         """חולץ כתובות מטקסט"""
         addresses = []
-        text = self._clean_text(text)
+        analyzed = self._analyze(text)
+        if not analyzed.street_hits:
+            return []
+        text = analyzed.text
         
         # תבניות לכתובות
         patterns = [
@@ -542,530 +730,444 @@ class ContactExtractor:
         # הסרת כפילויות
         return list(set(addresses))
 
-    def extract_from_xlsx(self, file_path: str) -> List[Contact]:
-        """חולץ אנשי קשר מקובץ Excel"""
+    def extract_from_xlsx(self, file_path: str, raise_errors: bool = False) -> List[Contact]:
+        """חולץ אנשי קשר מקובץ Excel; raise_errors זורק שגיאה בקובץ במקום להחזיר רשימה ריקה"""
         try:
-            contacts = []
+            self.analyzer.reset()
             self.logger.info(f"מתחיל לעבד קובץ Excel: {file_path}")
-            wb = load_workbook(file_path, data_only=True)
+            if self.document_cache is not None:
+                contacts = self._extract_cached(file_path, self._parse_xlsx, self._evaluate_xlsx)
+            else:
+                contacts = self._stream_xlsx(file_path)
             
+            self.logger.info(f"נמצאו {len(contacts)} אנשי קשר בקובץ {file_path}")
+            return contacts
+
+        except Exception as e:
+            self.logger.error(f"שגיאה בעיבוד קובץ Excel {file_path}: {str(e)}")
+            if raise_errors:
+                raise
+            return []
+
+    def _open_sheet(self, wb, sheet_name: str):
+        """מחזיר גיליון של חוברת במצב קריאה בלבד, עם מידות מתוקנות"""
+        ws = wb[sheet_name]
+        self.logger.info(f"מעבד גיליון: {sheet_name}")
+        
+        # במצב קריאה בלבד המידות נלקחות מהקובץ עצמו. כלים מסוימים שומרים מידות חסרות או
+        # שגויות (למשל A1), ואז openpyxl חותך את השורות - במקרה כזה קוראים בלי מידות
+        if not ws.max_row or not ws.max_column or ws.max_row <= 1 or ws.max_column <= 1:
+            self.logger.debug(f"מידות הגיליון {sheet_name} לא אמינות, קורא את כל השורות")
+            ws.reset_dimensions()
+        else:
+            self.logger.info(f"גיליון {sheet_name} מכיל {ws.max_row} שורות ו-{ws.max_column} עמודות")
+        return ws
+
+    def _stream_xlsx(self, file_path: str) -> List[Contact]:
+        """חולץ ישירות מהקובץ: השורות נקראות אחת אחת ולא נשמרות בזיכרון"""
+        contacts = []
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
             for sheet_name in wb.sheetnames:
                 try:
-                    ws = wb[sheet_name]
-                    self.logger.info(f"מעבד גיליון: {sheet_name}")
-                    
-                    # דילוג על גיליונות ריקים
-                    if ws.max_row <= 1 or ws.max_column <= 1:
-                        self.logger.debug(f"דילוג על גיליון ריק: {sheet_name}")
-                        continue
-                        
-                    self.logger.info(f"גיליון {sheet_name} מכיל {ws.max_row} שורות ו-{ws.max_column} עמודות")
-                    
-                    # זיהוי עמודות
-                    headers = []
-                    header_row = None
-                    
-                    # חיפוש שורת כותרות בחמש השורות הראשונות
-                    for row_idx in range(1, min(6, ws.max_row + 1)):
-                        row_values = [str(cell.value).strip() if cell.value else "" for cell in ws[row_idx]]
-                        self.logger.debug(f"בודק שורה {row_idx} לכותרות: {row_values}")
-                        # בדיקה אם השורה מכילה מספיק מידע להיות שורת כותרות
-                        if any(word in " ".join(row_values).lower() for word in ['שם', 'טלפון', 'מייל', 'כתובת', 'תפקיד']):
-                            headers = [str(val).lower() for val in row_values]
-                            header_row = row_idx
-                            self.logger.info(f"נמצאה שורת כותרות בשורה {row_idx}: {headers}")
-                            break
-                    
-                    if not header_row:
-                        self.logger.warning(f"לא נמצאה שורת כותרות בגיליון {sheet_name}")
-                        continue
-                    
-                    # מציאת עמודות רלוונטיות
-                    name_cols = []
-                    phone_cols = []
-                    email_cols = []
-                    address_cols = []
-                    role_cols = []
-                    
-                    for idx, header in enumerate(headers):
-                        header = str(header).lower()
-                        # זיהוי עמודות שם
-                        if any(word in header for word in ['שם', 'איש קשר', 'נציג', 'חברה', 'שם פרטי', 'שם משפחה', 'שם מלא']):
-                            name_cols.append(idx)
-                            self.logger.debug(f"נמצאה עמודת שם: {header} (עמודה {idx+1})")
-                        # זיהוי עמודות טלפון
-                        elif any(word in header for word in ['טלפון', 'נייד', 'טל', 'פלאפון', 'מס טלפון', 'טלפונים', 'סלולרי', 'נייח']):
-                            phone_cols.append(idx)
-                            self.logger.debug(f"נמצאה עמודת טלפון: {header} (עמודה {idx+1})")
-                        # זיהוי עמודות מייל
-                        elif any(word in header for word in ['מייל', 'אימייל', 'דוא"ל', 'דואל', 'כתובת מייל', 'אימיילים', '@']):
-                            email_cols.append(idx)
-                            self.logger.debug(f"נמצאה עמודת מייל: {header} (עמודה {idx+1})")
-                        # זיהוי עמודות כתובת
-                        elif any(word in header for word in ['כתובת', 'עיר', 'ישוב', 'רחוב', 'בית', 'כתובות', 'מיקוד']):
-                            address_cols.append(idx)
-                            self.logger.debug(f"נמצאה עמודת כתובת: {header} (עמודה {idx+1})")
-                        # זיהוי עמודות תפקיד
-                        elif any(word in header for word in ['תפקיד', 'תפקידים', 'תפקידים נוספים', 'משרה', 'תפקיד בחברה']):
-                            role_cols.append(idx)
-                            self.logger.debug(f"נמצאה עמודת תפקיד: {header} (עמודה {idx+1})")
-                    
-                    # עיבוד כל שורה
-                    for row_idx in range(header_row + 1, ws.max_row + 1):
-                        row = ws[row_idx]
-                        row_values = [str(cell.value).strip() if cell.value else "" for cell in row]
-                        
-                        # דילוג על שורות ריקות
-                        if not any(row_values):
-                            continue
-                            
-                        contact = Contact(source_file=f"{file_path} - {sheet_name}")
-                        self.logger.debug(f"מעבד שורה {row_idx}")
-                        
-                        # חילוץ שם
-                        names = []
-                        for col in name_cols:
-                            if col < len(row_values) and row_values[col]:
-                                names.append(row_values[col])
-                        if names:
-                            # אם יש כמה שמות, משתמשים בארוך ביותר
-                            name = max(names, key=len)
-                            if name and any(c.isalpha() for c in name):
-                                contact.name = name
-                                self.logger.debug(f"נמצא שם: {name}")
-                        
-                        # חילוץ טלפונים
-                        for col in phone_cols:
-                            if col < len(row_values) and row_values[col]:
-                                phones = self._extract_phones(row_values[col])
-                                for phone in phones:
-                                    contact.add_phone(phone)
-                        
-                        # חילוץ אימיילים
-                        for col in email_cols:
-                            if col < len(row_values) and row_values[col]:
-                                emails = self._extract_emails(row_values[col])
-                                for email in emails:
-                                    contact.add_email(email)
-                        
-                        # חילוץ כתובות
-                        for col in address_cols:
-                            if col < len(row_values) and row_values[col]:
-                                addresses = self._extract_addresses(row_values[col])
-                                for address in addresses:
-                                    contact.add_address(address)
-                        
-                        # חילוץ תפקיד
-                        roles = []
-                        for col in role_cols:
-                            if col < len(row_values) and row_values[col]:
-                                roles.append(row_values[col])
-                        if roles:
-                            # אם יש כמה תפקידים, משתמשים בארוך ביותר
-                            role = max(roles, key=len)
-                            if role:
-                                contact.add_role(role)
-                        
-                        # בדיקת כל הטקסט בשורה לחיפוש מידע נוסף
-                        row_text = ' '.join(row_values)
-                        if not contact.phones:
-                            for phone in self._extract_phones(row_text):
-                                contact.add_phone(phone)
-                        if not contact.emails:
-                            for email in self._extract_emails(row_text):
-                                contact.add_email(email)
-                        if not contact.addresses:
-                            for address in self._extract_addresses(row_text):
-                                contact.add_address(address)
-                        
-                        if contact.is_valid():
-                            contacts.append(contact)
-                            self.logger.debug(f"נוסף איש קשר: {contact.name}")
-                        else:
-                            self.logger.debug(f"נדחה איש קשר לא תקין בשורה {row_idx}")
-                            
+                    ws = self._open_sheet(wb, sheet_name)
+                    contacts.extend(self._extract_from_sheet(
+                        ws.iter_rows(values_only=True), sheet_name, f"{file_path} - {sheet_name}"
+                    ))
+                except Exception as e:
+                    self.logger.error(f"שגיאה בעיבוד גיליון {sheet_name}: {str(e)}")
+                    continue
+        finally:
+            wb.close()
+        return contacts
+
+    def _parse_xlsx(self, file_path: str) -> Dict:
+        """מפרק קובץ Excel לגיליונות של שורות טקסט (השלב היקר, נשמר במטמון)"""
+        sheets = []
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for sheet_name in wb.sheetnames:
+                try:
+                    ws = self._open_sheet(wb, sheet_name)
+                    rows = [[str(value).strip() if value else "" for value in values]
+                            for values in ws.iter_rows(values_only=True)]
+                    sheets.append({'name': sheet_name, 'rows': rows})
                 except Exception as e:
                     self.logger.error(f"שגיאה בעיבוד גיליון {sheet_name}: {str(e)}")
                     continue
+        finally:
+            wb.close()
+        return {'sheets': sheets}
+
+    def _evaluate_xlsx(self, parsed: Dict, file_path: str) -> List[Contact]:
+        """מפעיל את כללי החילוץ על קובץ Excel מפורק"""
+        contacts = []
+        for sheet in parsed['sheets']:
+            try:
+                contacts.extend(self._extract_from_sheet(
+                    sheet['rows'], sheet['name'], f"{file_path} - {sheet['name']}"
+                ))
+            except Exception as e:
+                self.logger.error(f"שגיאה בעיבוד גיליון {sheet['name']}: {str(e)}")
+                continue
+        return contacts
+
+    def _extract_from_sheet(self, rows, sheet_name: str, source_file: str) -> List[Contact]:
+        """חולץ אנשי קשר מגיליון בודד במעבר אחד על השורות"""
+        contacts = []
+        headers = []
+        header_row = None
+        columns = None
+        batch = []
+        
+        for row_idx, values in enumerate(rows, 1):
+            row_values = [str(value).strip() if value else "" for value in values]
+            
+            # חיפוש שורת כותרות בחמש השורות הראשונות
+            if header_row is None:
+                if row_idx > 5:
+                    break
+                self.logger.debug(f"בודק שורה {row_idx} לכותרות: {row_values}")
+                # בדיקה אם השורה מכילה מספיק מידע להיות שורת כותרות
+                if self._is_header_row(row_values):
+                    headers = [str(val).lower() for val in row_values]
+                    header_row = row_idx
+                    self.logger.info(f"נמצאה שורת כותרות בשורה {row_idx}: {headers}")
+                    # מציאת עמודות רלוונטיות
+                    columns = self._detect_columns(headers)
+                continue
             
+            # השורות נאספות לקבוצות ומחולצות עמודה אחר עמודה
+            batch.append(row_values)
+            if len(batch) >= _TABLE_BATCH_ROWS:
+                contacts.extend(self.extract_from_table(batch, columns, source_file))
+                batch = []
+        
+        if batch:
+            contacts.extend(self.extract_from_table(batch, columns, source_file))
+        
+        if header_row is None:
+            self.logger.warning(f"לא נמצאה שורת כותרות בגיליון {sheet_name}")
+        
+        return contacts
+
+    def _table_rows(self, table) -> List[List[str]]:
+        """ממיר טבלה (רשימת שורות או DataFrame) לשורות של מחרוזות, בלי שורות ריקות"""
+        if isinstance(table, pd.DataFrame):
+            table = table.astype(object).where(table.notna(), None).values.tolist()
+        rows = []
+        for values in table:
+            row_values = [str(value).strip() if value else "" for value in values]
+            # דילוג על שורות ריקות
+            if any(row_values):
+                rows.append(row_values)
+        return rows
+
+    def extract_from_table(self, table, columns: Dict[str, List[int]], source_file: str,
+                           find_names: bool = False) -> List[Contact]:
+        """חולץ אנשי קשר מטבלה שלמה לפי תפקידי העמודות שזוהו בכותרות.
+        עמודות הטלפון והמייל מעובדות בבת אחת, וחיפוש בטקסט השורה נעשה רק לשורות שלא נפתרו"""
+        rows = self._table_rows(table)
+        if not rows:
+            return []
+        
+        # טלפונים ומיילים לכל שורה, מכל העמודות המתאימות
+        row_phones = [[] for _ in rows]
+        for col in columns['phone']:
+            cells = [row_values[col] if col < len(row_values) else "" for row_values in rows]
+            for found, phones in zip(row_phones, self.columnar.phone_column(cells)):
+                found.extend(phones)
+        
+        row_emails = [[] for _ in rows]
+        for col in columns['email']:
+            cells = [row_values[col] if col < len(row_values) else "" for row_values in rows]
+            for found, emails in zip(row_emails, self.columnar.email_column(cells)):
+                found.extend(emails)
+        
+        contacts = []
+        for row_values, phones, emails in zip(rows, row_phones, row_emails):
+            contact = self._contact_from_row(row_values, columns, source_file, phones, emails, find_names)
+            if contact.is_valid():
+                contacts.append(contact)
+                self.logger.debug(f"נוסף איש קשר: {contact.name}")
+            else:
+                self.logger.debug(f"נדחה איש קשר לא תקין: {row_values}")
+        
+        self.logger.debug(f"נמצאו {len(contacts)} אנשי קשר ב-{len(rows)} שורות של {source_file}")
+        return contacts
+
+    def _contact_from_row(self, row_values: List[str], columns: Dict[str, List[int]], source_file: str,
+                          phones: List[str], emails: List[str], find_name: bool = False) -> Contact:
+        """בונה איש קשר משורת טבלה לפי העמודות שזוהו בכותרות.
+        הטלפונים והמיילים מהעמודות כבר חולצו מראש ב-extract_from_table"""
+        contact = Contact(source_file=source_file)
+        
+        # חילוץ שם
+        names = []
+        for col in columns['name']:
+            if col < len(row_values) and row_values[col]:
+                names.append(row_values[col])
+        if names:
+            # אם יש כמה שמות, משתמשים בארוך ביותר
+            name = max(names, key=len)
+            if name and any(c.isalpha() for c in name):
+                contact.name = name
+                self.logger.debug(f"נמצא שם: {name}")
+        
+        # טלפונים ואימיילים מהעמודות
+        for phone in phones:
+            contact.add_phone(phone)
+        for email in emails:
+            contact.add_email(email)
+        
+        # חילוץ כתובות
+        for col in columns['address']:
+            if col < len(row_values) and row_values[col]:
+                addresses = self._extract_addresses(row_values[col])
+                for address in addresses:
+                    contact.add_address(address)
+        
+        # חילוץ תפקיד
+        roles = []
+        for col in columns['role']:
+            if col < len(row_values) and row_values[col]:
+                roles.append(row_values[col])
+        if roles:
+            # אם יש כמה תפקידים, משתמשים בארוך ביותר
+            role = max(roles, key=len)
+            if role:
+                contact.add_role(role)
+        
+        # בדיקת כל הטקסט בשורה רק אם חסר מידע
+        if find_name and not contact.name or not (contact.phones and contact.emails and contact.addresses):
+            row_analysis = self._analyze(' '.join(row_values))
+            
+            # אם אין שם, מנסה למצוא בטקסט המלא
+            if find_name and not contact.name:
+                name_and_role = self._extract_name_and_role(row_analysis)
+                if name_and_role:
+                    name, role = name_and_role
+                    contact.name = name
+                    if role:
+                        contact.add_role(role)
+            
+            if not contact.phones:
+                for phone in self._extract_phones(row_analysis):
+                    contact.add_phone(phone)
+            if not contact.emails:
+                for email in self._extract_emails(row_analysis):
+                    contact.add_email(email)
+            if not contact.addresses:
+                for address in self._extract_addresses(row_analysis):
+                    contact.add_address(address)
+        
+        return contact
+
+    def extract_from_doc(self, file_path: str, raise_errors: bool = False) -> List[Contact]:
+        """חולץ אנשי קשר מקובץ Word; raise_errors זורק שגיאה בקובץ במקום להחזיר רשימה ריקה"""
+        try:
+            self.analyzer.reset()
+            contacts = self._extract_document(file_path, self._parse_doc, self._evaluate_doc)
             self.logger.info(f"נמצאו {len(contacts)} אנשי קשר בקובץ {file_path}")
             return contacts
 
         except Exception as e:
-            self.logger.error(f"שגיאה בעיבוד קובץ Excel {file_path}: {str(e)}")
+            self.logger.error(f"שגיאה בחילוץ אנשי קשר מקובץ Word {file_path}: {str(e)}")
+            if raise_errors:
+                raise
             return []
 
-    def extract_from_doc(self, file_path: str) -> List[Contact]:
-        """חולץ אנשי קשר מקובץ Word"""
-        try:
-            contacts = []
+    def _parse_doc(self, file_path: str) -> Dict:
+        """מפרק קובץ Word לשורות טבלה ופסקאות (השלב היקר, נשמר במטמון)"""
+        tables = []
+        paragraphs = []
+        
+        # עבור קבצי DOCX
+        if file_path.lower().endswith('.docx'):
+            doc = Document(file_path)
+            self.logger.info(f"מעבד קובץ Word: {file_path}")
             
-            # עבור קבצי DOCX
-            if file_path.lower().endswith('.docx'):
-                doc = Document(file_path)
-                self.logger.info(f"מעבד קובץ Word: {file_path}")
-                
-                # עיבוד טבלאות
-                for table_idx, table in enumerate(doc.tables):
-                    try:
-                        self.logger.debug(f"מעבד טבלה {table_idx + 1}")
-                        
-                        # קבלת כותרות מהשורה הראשונה
-                        headers = []
-                        header_row = None
-                        
-                        # חיפוש שורת כותרות בשלוש השורות הראשונות
-                        for row_idx in range(min(3, len(table.rows))):
-                            row_values = [cell.text.strip() for cell in table.rows[row_idx].cells]
-                            # בדיקה אם השורה מכילה מספיק מידע להיות שורת כותרות
-                            if any(word in " ".join(row_values).lower() for word in ['שם', 'טלפון', 'מייל', 'כתובת', 'תפקיד']):
-                                headers = [str(val).lower() for val in row_values]
-                                header_row = row_idx
-                                self.logger.debug(f"נמצאה שורת כותרות בשורה {row_idx + 1}: {headers}")
-                                break
-                        
-                        if not header_row:
-                            self.logger.debug(f"לא נמצאה שורת כותרות בטבלה {table_idx + 1}, מנסה לחלץ מידע מכל השורות")
-                            header_row = -1
-                        
-                        # מציאת עמודות רלוונטיות
-                        name_cols = []
-                        phone_cols = []
-                        email_cols = []
-                        address_cols = []
-                        role_cols = []
-                        
-                        if header_row >= 0:
-                            for idx, header in enumerate(headers):
-                                header = str(header).lower()
-                                # זיהוי עמודות שם
-                                if any(word in header for word in ['שם', 'איש קשר', 'נציג', 'חברה', 'שם פרטי', 'שם משפחה', 'שם מלא']):
-                                    name_cols.append(idx)
-                                    self.logger.debug(f"נמצאה עמודת שם: {header} (עמודה {idx+1})")
-                                # זיהוי עמודות טלפון
-                                elif any(word in header for word in ['טלפון', 'נייד', 'טל', 'פלאפון', 'מס טלפון', 'טלפונים', 'סלולרי', 'נייח']):
-                                    phone_cols.append(idx)
-                                    self.logger.debug(f"נמצאה עמודת טלפון: {header} (עמודה {idx+1})")
-                                # זיהוי עמודות מייל
-                                elif any(word in header for word in ['מייל', 'אימייל', 'דוא"ל', 'דואל', 'כתובת מייל', 'אימיילים', '@']):
-                                    email_cols.append(idx)
-                                    self.logger.debug(f"נמצאה עמודת מייל: {header} (עמודה {idx+1})")
-                                # זיהוי עמודות כתובת
-                                elif any(word in header for word in ['כתובת', 'עיר', 'ישוב', 'רחוב', 'בית', 'כתובות', 'מיקוד']):
-                                    address_cols.append(idx)
-                                    self.logger.debug(f"נמצאה עמודת כתובת: {header} (עמודה {idx+1})")
-                                # זיהוי עמודות תפקיד
-                                elif any(word in header for word in ['תפקיד', 'תפקידים', 'תפקידים נוספים', 'משרה', 'תפקיד בחברה']):
-                                    role_cols.append(idx)
-                                    self.logger.debug(f"נמצאה עמודת תפקיד: {header} (עמודה {idx+1})")
-                        
-                        # עיבוד כל שורה
-                        start_row = header_row + 1 if header_row >= 0 else 0
-                        for row_idx in range(start_row, len(table.rows)):
-                            row = table.rows[row_idx]
-                            row_values = [cell.text.strip() for cell in row.cells]
-                            
-                            # דילוג על שורות ריקות
-                            if not any(row_values):
-                                continue
-                                
-                            contact = Contact(source_file=f"{file_path} - טבלה {table_idx + 1}")
-                            self.logger.debug(f"מעבד שורה {row_idx + 1}")
-                            
-                            if header_row >= 0:
-                                # חילוץ לפי עמודות מזוהות
-                                # חילוץ שם
-                                names = []
-                                for col in name_cols:
-                                    if col < len(row_values) and row_values[col]:
-                                        names.append(row_values[col])
-                                if names:
-                                    # אם יש כמה שמות, משתמשים בארוך ביותר
-                                    name = max(names, key=len)
-                                    if name and any(c.isalpha() for c in name):
-                                        contact.name = name
-                                        self.logger.debug(f"נמצא שם: {name}")
-                                
-                                # חילוץ טלפונים
-                                for col in phone_cols:
-                                    if col < len(row_values) and row_values[col]:
-                                        phones = self._extract_phones(row_values[col])
-                                        for phone in phones:
-                                            contact.add_phone(phone)
-                                
-                                # חילוץ אימיילים
-                                for col in email_cols:
-                                    if col < len(row_values) and row_values[col]:
-                                        emails = self._extract_emails(row_values[col])
-                                        for email in emails:
-                                            contact.add_email(email)
-                                
-                                # חילוץ כתובות
-                                for col in address_cols:
-                                    if col < len(row_values) and row_values[col]:
-                                        addresses = self._extract_addresses(row_values[col])
-                                        for address in addresses:
-                                            contact.add_address(address)
-                                
-                                # חילוץ תפקיד
-                                roles = []
-                                for col in role_cols:
-                                    if col < len(row_values) and row_values[col]:
-                                        roles.append(row_values[col])
-                                if roles:
-                                    # אם יש כמה תפקידים, משתמשים בארוך ביותר
-                                    role = max(roles, key=len)
-                                    if role:
-                                        contact.add_role(role)
-                            
-                            # חילוץ מידע מכל התאים בשורה
-                            row_text = ' '.join(row_values)
-                            
-                            # אם אין שם, מנסה למצוא בטקסט המלא
-                            if not contact.name:
-                                name_and_role = self._extract_name_and_role(row_text)
-                                if name_and_role:
-                                    name, role = name_and_role
-                                    contact.name = name
-                                    if role:
-                                        contact.add_role(role)
-                            
-                            # חיפוש מידע נוסף בטקסט המלא
-                            if not contact.phones:
-                                for phone in self._extract_phones(row_text):
-                                    contact.add_phone(phone)
-                            if not contact.emails:
-                                for email in self._extract_emails(row_text):
-                                    contact.add_email(email)
-                            if not contact.addresses:
-                                for address in self._extract_addresses(row_text):
-                                    contact.add_address(address)
-                            
-                            if contact.is_valid():
-                                contacts.append(contact)
-                                self.logger.debug(f"נוסף איש קשר: {contact.name}")
-                            else:
-                                self.logger.debug(f"נדחה איש קשר לא תקין בשורה {row_idx + 1}")
-                    
-                    except Exception as e:
-                        self.logger.error(f"שגיאה בעיבוד טבלה {table_idx + 1}: {str(e)}")
-                        continue
-                
-                # עיבוד פסקאות
-                paragraphs_text = []
-                current_paragraph = []
-                
-                for para in doc.paragraphs:
-                    text = para.text.strip()
-                    if text:
-                        current_paragraph.append(text)
-                    elif current_paragraph:
-                        paragraphs_text.append(' '.join(current_paragraph))
-                        current_paragraph = []
-                
-                if current_paragraph:
-                    paragraphs_text.append(' '.join(current_paragraph))
-                
-                # עיבוד כל פסקה
-                for para_text in paragraphs_text:
-                    try:
-                        # חיפוש אנשי קשר בפסקה
-                        para_contacts = self._extract_contacts_from_text(para_text)
-                        if para_contacts:
-                            contacts.extend(para_contacts)
-                            self.logger.debug(f"נמצאו {len(para_contacts)} אנשי קשר בפסקה")
-                    except Exception as e:
-                        self.logger.error(f"שגיאה בעיבוד פסקה: {str(e)}")
-                        continue
+            for table_idx, table in enumerate(doc.tables):
+                try:
+                    # קריאה לפי עמודות: row.cells בונה מחדש את כל תאי הטבלה בכל קריאה
+                    columns_text = [[cell.text.strip() for cell in column.cells] for column in table.columns]
+                    tables.append([list(values) for values in zip(*columns_text)])
+                except Exception as e:
+                    self.logger.error(f"שגיאה בעיבוד טבלה {table_idx + 1}: {str(e)}")
+                    tables.append([])
             
+            paragraphs = [para.text.strip() for para in doc.paragraphs]
+        
+        return {'tables': tables, 'paragraphs': paragraphs}
+
+    def _evaluate_doc(self, parsed: Dict, file_path: str) -> List[Contact]:
+        """מפעיל את כללי החילוץ על קובץ Word מפורק"""
+        contacts = []
+        
+        # עיבוד טבלאות
+        for table_idx, rows in enumerate(parsed['tables']):
+            try:
+                self.logger.debug(f"מעבד טבלה {table_idx + 1}")
+                contacts.extend(self._extract_from_document_table(
+                    rows, f"{file_path} - טבלה {table_idx + 1}", f"טבלה {table_idx + 1}"
+                ))
+            except Exception as e:
+                self.logger.error(f"שגיאה בעיבוד טבלה {table_idx + 1}: {str(e)}")
+                continue
+        
+        # עיבוד פסקאות
+        paragraphs_text = []
+        current_paragraph = []
+        
+        for text in parsed['paragraphs']:
+            if text:
+                current_paragraph.append(text)
+            elif current_paragraph:
+                paragraphs_text.append(' '.join(current_paragraph))
+                current_paragraph = []
+        
+        if current_paragraph:
+            paragraphs_text.append(' '.join(current_paragraph))
+        
+        # עיבוד כל פסקה
+        for para_text in paragraphs_text:
+            try:
+                # חיפוש אנשי קשר בפסקה
+                para_contacts = self._extract_contacts_from_text(para_text)
+                if para_contacts:
+                    contacts.extend(para_contacts)
+                    self.logger.debug(f"נמצאו {len(para_contacts)} אנשי קשר בפסקה")
+            except Exception as e:
+                self.logger.error(f"שגיאה בעיבוד פסקה: {str(e)}")
+                continue
+        
+        return contacts
+
+    def _extract_from_document_table(self, rows: List[List], source_file: str, table_name: str) -> List[Contact]:
+        """חולץ אנשי קשר מטבלה של Word או PDF: כותרות בשלוש השורות הראשונות, או כל השורות כטקסט"""
+        # קבלת כותרות מהשורה הראשונה
+        headers = []
+        header_row = None
+        
+        # חיפוש שורת כותרות בשלוש השורות הראשונות
+        for row_idx in range(min(3, len(rows))):
+            row_values = [str(cell).strip() if cell else "" for cell in rows[row_idx]]
+            # בדיקה אם השורה מכילה מספיק מידע להיות שורת כותרות
+            if self._is_header_row(row_values):
+                headers = [str(val).lower() if val else "" for val in row_values]
+                header_row = row_idx
+                self.logger.debug(f"נמצאה שורת כותרות בשורה {row_idx + 1}: {headers}")
+                break
+        
+        if header_row is None:
+            self.logger.debug(f"לא נמצאה שורת כותרות ב{table_name}, מנסה לחלץ מידע מכל השורות")
+            header_row = -1
+        
+        # מציאת עמודות רלוונטיות
+        columns = self._detect_columns(headers if header_row >= 0 else [])
+        
+        # עיבוד כל השורות שאחרי הכותרות, עמודה אחר עמודה
+        start_row = header_row + 1 if header_row >= 0 else 0
+        return self.extract_from_table(rows[start_row:], columns, source_file, find_names=True)
+
+    def extract_from_pdf(self, file_path: str, raise_errors: bool = False) -> List[Contact]:
+        """חולץ אנשי קשר מקובץ PDF; raise_errors זורק שגיאה בקובץ במקום להחזיר רשימה ריקה"""
+        try:
+            self.analyzer.reset()
+            self.logger.info(f"מעבד קובץ PDF: {file_path}")
+            contacts = self._extract_document(file_path, self._parse_pdf, self._evaluate_pdf)
             self.logger.info(f"נמצאו {len(contacts)} אנשי קשר בקובץ {file_path}")
             return contacts
 
         except Exception as e:
-            self.logger.error(f"שגיאה בחילוץ אנשי קשר מקובץ Word {file_path}: {str(e)}")
+            self.logger.error(f"שגיאה בחילוץ אנשי קשר מקובץ PDF {file_path}: {str(e)}")
+            if raise_errors:
+                raise
             return []
 
-    def extract_from_pdf(self, file_path: str) -> List[Contact]:
-        """חולץ אנשי קשר מקובץ PDF"""
+    def extract_from_txt(self, file_path: str, raise_errors: bool = False) -> List[Contact]:
+        """חולץ אנשי קשר מקובץ טקסט (UTF-8), בלוק אחר בלוק כמו פסקאות במסמך"""
         try:
-            contacts = []
-            self.logger.info(f"מעבד קובץ PDF: {file_path}")
-            
-            # שימוש ב-pdfplumber
-            with pdfplumber.open(file_path) as pdf:
-                # עיבוד כל עמוד
-                for page_num, page in enumerate(pdf.pages, 1):
+            self.analyzer.reset()
+            with open(file_path, 'r', encoding='utf-8') as file:
+                contacts = self._extract_contacts_from_text(file.read())
+            self.logger.info(f"נמצאו {len(contacts)} אנשי קשר בקובץ {file_path}")
+            return contacts
+
+        except Exception as e:
+            self.logger.error(f"שגיאה בחילוץ אנשי קשר מקובץ טקסט {file_path}: {str(e)}")
+            if raise_errors:
+                raise
+            return []
+
+    def _parse_pdf(self, file_path: str) -> Dict:
+        """מפרק קובץ PDF לטקסט (מחוץ לטבלאות) ולטבלאות של כל עמוד (השלב היקר, נשמר במטמון)"""
+        return self.pdf_engine.parse(file_path)
+
+    def _evaluate_pdf(self, parsed: Dict, file_path: str) -> List[Contact]:
+        """מפעיל את כללי החילוץ על קובץ PDF מפורק"""
+        contacts = []
+        
+        for page_num, page in enumerate(parsed['pages'], 1):
+            try:
+                # חיפוש אנשי קשר בטקסט
+                page_text = page['text']
+                if page_text:
+                    text_contacts = self._extract_contacts_from_text(page_text)
+                    if text_contacts:
+                        contacts.extend(text_contacts)
+                        self.logger.debug(f"נמצאו {len(text_contacts)} אנשי קשר בטקסט בעמוד {page_num}")
+                
+                # חילוץ טבלאות
+                for table_idx, table in enumerate(page['tables']):
                     try:
-                        self.logger.debug(f"מעבד עמוד {page_num}")
+                        self.logger.debug(f"מעבד טבלה {table_idx + 1} בעמוד {page_num}")
                         
-                        # חילוץ טקסט
-                        page_text = page.extract_text()
-                        if page_text:
-                            # חיפוש אנשי קשר בטקסט
-                            text_contacts = self._extract_contacts_from_text(page_text)
-                            if text_contacts:
-                                contacts.extend(text_contacts)
-                                self.logger.debug(f"נמצאו {len(text_contacts)} אנשי קשר בטקסט בעמוד {page_num}")
+                        if not table or not any(table):
+                            continue
                         
-                        # חילוץ טבלאות
-                        tables = page.extract_tables()
-                        for table_idx, table in enumerate(tables):
-                            try:
-                                self.logger.debug(f"מעבד טבלה {table_idx + 1} בעמוד {page_num}")
-                                
-                                if not table or not any(table):
-                                    continue
-                                
-                                # קבלת כותרות מהשורה הראשונה
-                                headers = []
-                                header_row = None
-                                
-                                # חיפוש שורת כותרות בשלוש השורות הראשונות
-                                for row_idx in range(min(3, len(table))):
-                                    row_values = [str(cell).strip() if cell else "" for cell in table[row_idx]]
-                                    # בדיקה אם השורה מכילה מספיק מידע להיות שורת כותרות
-                                    if any(word in " ".join(row_values).lower() for word in ['שם', 'טלפון', 'מייל', 'כתובת', 'תפקיד']):
-                                        headers = [str(val).lower() if val else "" for val in row_values]
-                                        header_row = row_idx
-                                        self.logger.debug(f"נמצאה שורת כותרות בשורה {row_idx + 1}: {headers}")
-                                        break
-                                
-                                if not header_row:
-                                    self.logger.debug(f"לא נמצאה שורת כותרות בטבלה {table_idx + 1}, מנסה לחלץ מידע מכל השורות")
-                                    header_row = -1
-                                
-                                # מציאת עמודות רלוונטיות
-                                name_cols = []
-                                phone_cols = []
-                                email_cols = []
-                                address_cols = []
-                                role_cols = []
-                                
-                                if header_row >= 0:
-                                    for idx, header in enumerate(headers):
-                                        header = str(header).lower()
-                                        # זיהוי עמודות שם
-                                        if any(word in header for word in ['שם', 'איש קשר', 'נציג', 'חברה', 'שם פרטי', 'שם משפחה', 'שם מלא']):
-                                            name_cols.append(idx)
-                                            self.logger.debug(f"נמצאה עמודת שם: {header} (עמודה {idx+1})")
-                                        # זיהוי עמודות טלפון
-                                        elif any(word in header for word in ['טלפון', 'נייד', 'טל', 'פלאפון', 'מס טלפון', 'טלפונים', 'סלולרי', 'נייח']):
-                                            phone_cols.append(idx)
-                                            self.logger.debug(f"נמצאה עמודת טלפון: {header} (עמודה {idx+1})")
-                                        # זיהוי עמודות מייל
-                                        elif any(word in header for word in ['מייל', 'אימייל', 'דוא"ל', 'דואל', 'כתובת מייל', 'אימיילים', '@']):
-                                            email_cols.append(idx)
-                                            self.logger.debug(f"נמצאה עמודת מייל: {header} (עמודה {idx+1})")
-                                        # זיהוי עמודות כתובת
-                                        elif any(word in header for word in ['כתובת', 'עיר', 'ישוב', 'רחוב', 'בית', 'כתובות', 'מיקוד']):
-                                            address_cols.append(idx)
-                                            self.logger.debug(f"נמצאה עמודת כתובת: {header} (עמודה {idx+1})")
-                                        # זיהוי עמודות תפקיד
-                                        elif any(word in header for word in ['תפקיד', 'תפקידים', 'תפקידים נוספים', 'משרה', 'תפקיד בחברה']):
-                                            role_cols.append(idx)
-                                            self.logger.debug(f"נמצאה עמודת תפקיד: {header} (עמודה {idx+1})")
-                                
-                                # עיבוד כל שורה
-                                start_row = header_row + 1 if header_row >= 0 else 0
-                                for row_idx in range(start_row, len(table)):
-                                    row_values = [str(cell).strip() if cell else "" for cell in table[row_idx]]
-                                    
-                                    # דילוג על שורות ריקות
-                                    if not any(row_values):
-                                        continue
-                                        
-                                    contact = Contact(source_file=f"{file_path} - עמוד {page_num}, טבלה {table_idx + 1}")
-                                    self.logger.debug(f"מעבד שורה {row_idx + 1}")
-                                    
-                                    if header_row >= 0:
-                                        # חילוץ לפי עמודות מזוהות
-                                        # חילוץ שם
-                                        names = []
-                                        for col in name_cols:
-                                            if col < len(row_values) and row_values[col]:
-                                                names.append(row_values[col])
-                                        if names:
-                                            # אם יש כמה שמות, משתמשים בארוך ביותר
-                                            name = max(names, key=len)
-                                            if name and any(c.isalpha() for c in name):
-                                                contact.name = name
-                                                self.logger.debug(f"נמצא שם: {name}")
-                                        
-                                        # חילוץ טלפונים
-                                        for col in phone_cols:
-                                            if col < len(row_values) and row_values[col]:
-                                                phones = self._extract_phones(row_values[col])
-                                                for phone in phones:
-                                                    contact.add_phone(phone)
-                                        
-                                        # חילוץ אימיילים
-                                        for col in email_cols:
-                                            if col < len(row_values) and row_values[col]:
-                                                emails = self._extract_emails(row_values[col])
-                                                for email in emails:
-                                                    contact.add_email(email)
-                                        
-                                        # חילוץ כתובות
-                                        for col in address_cols:
-                                            if col < len(row_values) and row_values[col]:
-                                                addresses = self._extract_addresses(row_values[col])
-                                                for address in addresses:
-                                                    contact.add_address(address)
-                                        
-                                        # חילוץ תפקיד
-                                        roles = []
-                                        for col in role_cols:
-                                            if col < len(row_values) and row_values[col]:
-                                                roles.append(row_values[col])
-                                        if roles:
-                                            # אם יש כמה תפקידים, משתמשים בארוך ביותר
-                                            role = max(roles, key=len)
-                                            if role:
-                                                contact.add_role(role)
-                                    
-                                    # חילוץ מידע מכל התאים בשורה
-                                    row_text = ' '.join(row_values)
-                                    
-                                    # אם אין שם, מנסה למצוא בטקסט המלא
-                                    if not contact.name:
-                                        name_and_role = self._extract_name_and_role(row_text)
-                                        if name_and_role:
-                                            name, role = name_and_role
-                                            contact.name = name
-                                            if role:
-                                                contact.add_role(role)
-                                    
-                                    # חיפוש מידע נוסף בטקסט המלא
-                                    if not contact.phones:
-                                        for phone in self._extract_phones(row_text):
-                                            contact.add_phone(phone)
-                                    if not contact.emails:
-                                        for email in self._extract_emails(row_text):
-                                            contact.add_email(email)
-                                    if not contact.addresses:
-                                        for address in self._extract_addresses(row_text):
-                                            contact.add_address(address)
-                                    
-                                    if contact.is_valid():
-                                        contacts.append(contact)
-                                        self.logger.debug(f"נוסף איש קשר: {contact.name}")
-                                    else:
-                                        self.logger.debug(f"נדחה איש קשר לא תקין בשורה {row_idx + 1}")
-                            
-                            except Exception as e:
-                                self.logger.error(f"שגיאה בעיבוד טבלה {table_idx + 1} בעמוד {page_num}: {str(e)}")
-                                continue
+                        contacts.extend(self._extract_from_document_table(
+                            table, f"{file_path} - עמוד {page_num}, טבלה {table_idx + 1}",
+                            f"טבלה {table_idx + 1} בעמוד {page_num}"
+                        ))
                     
                     except Exception as e:
-                        self.logger.error(f"שגיאה בעיבוד עמוד {page_num}: {str(e)}")
+                        self.logger.error(f"שגיאה בעיבוד טבלה {table_idx + 1} בעמוד {page_num}: {str(e)}")
                         continue
             
-            self.logger.info(f"נמצאו {len(contacts)} אנשי קשר בקובץ {file_path}")
-            return contacts
+            except Exception as e:
+                self.logger.error(f"שגיאה בעיבוד עמוד {page_num}: {str(e)}")
+                continue
+        
+        return contacts
 
-        except Exception as e:
-            self.logger.error(f"שגיאה בחילוץ אנשי קשר מקובץ PDF {file_path}: {str(e)}")
-            return []
+    def _extract_document(self, file_path: str, parse, evaluate) -> List[Contact]:
+        """מפרק את הקובץ ומפעיל עליו את כללי החילוץ, דרך המטמון אם הוגדר"""
+        if self.document_cache is None:
+            return evaluate(parse(file_path), file_path)
+        return self._extract_cached(file_path, parse, evaluate)
+
+    def _extract_cached(self, file_path: str, parse, evaluate) -> List[Contact]:
+        """חילוץ דרך שתי שכבות המטמון: אנשי קשר לפי גרסת הכללים, ואחריהם המסמך המפורק"""
+        cache = self.document_cache
+        key = cache.key(file_path)
+        rules_version = self.rules_version
+        
+        records = cache.load_contacts(key, rules_version)
+        if records is not None:
+            self.logger.debug(f"אנשי הקשר של {file_path} נטענו מהמטמון")
+            return [Contact.from_record(record, file_path) for record in records]
+        
+        parsed = cache.load_parsed(key)
+        if parsed is None:
+            parsed = parse(file_path)
+            cache.store_parsed(key, parsed)
+        else:
+            self.logger.debug(f"המסמך המפורק של {file_path} נטען מהמטמון")
+        
+        contacts = evaluate(parsed, file_path)
+        cache.store_contacts(key, rules_version, [contact.to_record(file_path) for contact in contacts])
+        return contacts
 
     def _extract_contacts_from_text(self, text: str) -> List[Contact]:
         """חולץ אנשי קשר מטקסט גולמי"""
@@ -1084,8 +1186,11 @@ class ContactExtractor:
                 current_contact = None
                 continue
             
+            # ניתוח השורה פעם אחת עבור כל המחלצים
+            analyzed = self._analyze(line)
+
             # ניסיון לחלץ שם ותפקיד
-            name_and_role = self._extract_name_and_role(line)
+            name_and_role = self._extract_name_and_role(analyzed)
             if name_and_role:
                 if current_contact and current_contact.is_valid():
                     contacts.append(current_contact)
@@ -1099,17 +1204,17 @@ class ContactExtractor:
             # חילוץ מידע נוסף
             if current_contact:
                 # חילוץ מספרי טלפון
-                phones = self._extract_phones(line)
+                phones = self._extract_phones(analyzed)
                 for phone in phones:
                     current_contact.add_phone(phone)
                 
                 # חילוץ כתובות מייל
-                emails = self._extract_emails(line)
+                emails = self._extract_emails(analyzed)
                 for email in emails:
                     current_contact.add_email(email)
                 
                 # חילוץ כתובות
-                addresses = self._extract_addresses(line)
+                addresses = self._extract_addresses(analyzed)
                 for address in addresses:
                     current_contact.add_address(address)
         
@@ -1201,218 +1306,87 @@ class ContactExtractor:
             return []
             
     def remove_duplicates(self, contacts):
-        """מסיר כפילויות מרשימת אנשי קשר"""
-        unique_contacts = {}
-        
-        for contact in contacts:
-            # יצירת מפתח ייחודי
-            name_key = contact.name.lower().strip() if contact.name else ""
-            phone_key = list(contact.phones)[0] if contact.phones else ""
-            email_key = list(contact.emails)[0] if contact.emails else ""
-            key = f"{name_key}_{phone_key}_{email_key}"
-            
-            if key in unique_contacts:
-                # מיזוג אנשי קשר זהים
-                unique_contacts[key].merge(contact)
-                self.logger.debug(f"מיזוג איש קשר: {contact.name}")
-            else:
-                unique_contacts[key] = contact
-                self.logger.debug(f"הוספת איש קשר חדש: {contact.name}")
-        
-        result = list(unique_contacts.values())
+        """מסיר כפילויות מרשימת אנשי קשר - אנשי קשר שחולקים טלפון או מייל כלשהו ממוזגים"""
+        result = self.dedup.deduplicate(contacts)
         self.logger.info(f"נמצאו {len(result)} אנשי קשר ייחודיים מתוך {len(contacts)} אנשי קשר")
         return result
+
+    def remove_near_duplicates(self, contacts):
+        """ממזג אנשי קשר ששמם כמעט זהה (כתיב, תארים, סדר מילים) ושחולקים שם, סיומת טלפון או מייל.
+        שני אנשים עם אותו שם וטלפונים ומיילים שונים לא ממוזגים"""
+        result = self.near_duplicates.deduplicate(contacts)
+        stats = self.near_duplicates.stats
+        self.logger.info(
+            f"כפילויות בכתיב שונה: {len(contacts)} -> {len(result)} אנשי קשר, "
+            f"{stats['pairs_compared']} זוגות נבדקו ב-{stats['seconds']:.2f} שניות "
+            f"({stats['records_per_second']:.0f} רשומות ו-{stats['pairs_per_second']:.0f} זוגות בשנייה)"
+        )
+        return result
         
-    def extract_contacts(self, file_path):
-        """מחלץ אנשי קשר מקובץ בודד"""
+    def extract_contacts(self, file_path: str) -> List[Contact]:
+        """מחלץ אנשי קשר מקובץ בודד לפי הסיומת. שגיאה בקובץ נזרקת ולא מוחזרת כרשימה ריקה,
+        כך ש-scan_directory רושם אותה ולא מסמן את הקובץ כחולץ"""
         extension = file_path.split('.')[-1].lower()
-        
-        if extension in ['txt']:
-            return self._extract_from_txt(file_path)
-        elif extension in ['docx']:
-            return self._extract_from_docx(file_path)
-        elif extension in ['pdf']:
-            return self._extract_from_pdf(file_path)
-        elif extension in ['xlsx', 'xls']:
-            return self._extract_from_excel(file_path)
-        else:
+        extractors = {
+            'txt': self.extract_from_txt,
+            'docx': self.extract_from_doc,
+            'pdf': self.extract_from_pdf,
+            'xlsx': self.extract_from_xlsx,
+            'xls': self.extract_from_xlsx,
+        }
+        if extension not in extractors:
             raise ValueError(f"סוג הקובץ {extension} אינו נתמך")
+        return extractors[extension](file_path, raise_errors=True)
 
-    def scan_directory(self, directory_path):
-        """סורק תיקייה ומחלץ אנשי קשר מכל הקבצים המתאימים"""
-        all_contacts = []
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                if file.split('.')[-1].lower() in ['txt', 'docx', 'pdf', 'xlsx', 'xls']:
-                    file_path = os.path.join(root, file)
-                    try:
-                        contacts = self.extract_contacts(file_path)
-                        all_contacts.extend(contacts)
-                    except Exception as e:
-                        print(f"שגיאה בקריאת הקובץ {file}: {str(e)}")
-        return all_contacts
-
-    def remove_duplicates(self, contacts):
-        """מסיר כפילויות מרשימת אנשי הקשר"""
-        df = pd.DataFrame(contacts)
-        if not df.empty:
-            df = df.drop_duplicates()
-        return df.to_dict('records')
-
-    def save_contacts_to_excel(self, contacts, output_path):
-        """שומר את אנשי הקשר לקובץ אקסל"""
-        df = pd.DataFrame(contacts)
-        df.to_excel(output_path, index=False)
-
-    def _extract_from_txt(self, file_path):
-        """מחלץ אנשי קשר מקובץ טקסט"""
-        contacts = []
-        with open(file_path, 'r', encoding='utf-8') as file:
-            text = file.read()
-            phones = self.phone_pattern.findall(text)
-            emails = self.email_pattern.findall(text)
-            
-            for phone in phones:
-                contacts.append({'phone': phone})
-            for email in emails:
-                contacts.append({'email': email})
-        return contacts
-
-    def _extract_from_docx(self, file_path):
-        """מחלץ אנשי קשר מקובץ Word"""
-        contacts = []
-        doc = Document(file_path)
-        for paragraph in doc.paragraphs:
-            phones = self.phone_pattern.findall(paragraph.text)
-            emails = self.email_pattern.findall(paragraph.text)
-            
-            for phone in phones:
-                contacts.append({'phone': phone})
-            for email in emails:
-                contacts.append({'email': email})
-        return contacts
-
-    def _extract_from_pdf(self, file_path):
+    def save_contacts_to_excel(self, contacts: Iterable[Contact], output_path: str) -> None:
+        """שומר אנשי קשר לקובץ Excel - שורה אחר שורה, עם רוחב עמודות שנצבר תוך כדי הכתיבה"""
         try:
-            if file_ext in ['.xlsx', '.xls']:
-                self.logger.info(f"מחלץ מקובץ Excel: {file_path}")
-                contacts = self.extract_from_xlsx(file_path)
-            elif file_ext in ['.docx', '.doc']:
-                self.logger.info(f"מחלץ מקובץ Word: {file_path}")
-                contacts = self.extract_from_doc(file_path)
-            elif file_ext in ['.pdf']:
-                self.logger.info(f"מחלץ מקובץ PDF: {file_path}")
-                contacts = self.extract_from_pdf(file_path)
-            else:
-                self.logger.warning(f"סוג קובץ לא נתמך: {file_ext} בקובץ {file_path}")
-                # ניסיון לזהות את סוג הקובץ לפי התוכן
-                contacts = []
-                errors = []
-                
-                try:
-                    # ניסיון לפתוח כקובץ Excel
-                    contacts = self.extract_from_xlsx(file_path)
-                    if contacts:
-                        self.logger.info(f"זוהה כקובץ Excel למרות הסיומת: {file_path}")
-                        return contacts
-                except Exception as excel_error:
-                    errors.append(f"שגיאת Excel: {str(excel_error)}")
-                    
-                try:
-                    # ניסיון לפתוח כקובץ Word
-                    contacts = self.extract_from_doc(file_path)
-                    if contacts:
-                        self.logger.info(f"זוהה כקובץ Word למרות הסיומת: {file_path}")
-                        return contacts
-                except Exception as word_error:
-                    errors.append(f"שגיאת Word: {str(word_error)}")
-                    
-                try:
-                    # ניסיון לפתוח כקובץ PDF
-                    contacts = self.extract_from_pdf(file_path)
-                    if contacts:
-                        self.logger.info(f"זוהה כקובץ PDF למרות הסיומת: {file_path}")
-                        return contacts
-                except Exception as pdf_error:
-                    errors.append(f"שגיאת PDF: {str(pdf_error)}")
-                    
-                self.logger.warning(f"סוג קובץ לא נתמך: {file_path}")
-                self.logger.error(f"שגיאות בניסיון לזהות את סוג הקובץ: {', '.join(errors)}")
-                return []
-            
-            self.logger.info(f"נמצאו {len(contacts)} אנשי קשר בקובץ {file_path}")
-            return contacts
+            with ExcelStreamWriter(output_path, _EXCEL_COLUMNS, header_format=_EXCEL_HEADER_FORMAT,
+                                   cell_format=_EXCEL_CELL_FORMAT, max_width=_EXCEL_MAX_WIDTH,
+                                   freeze_header=True) as writer:
+                for contact in contacts:
+                    writer.write_row(_contact_row(contact))
+            self.logger.info(f"נשמרו {writer.rows} אנשי קשר לקובץ {output_path}")
             
         except Exception as e:
-            self.logger.error(f"שגיאה בחילוץ אנשי קשר מהקובץ {file_path}: {str(e)}")
-            return []
+            self.logger.error(f"שגיאה בשמירת אנשי קשר לקובץ Excel: {str(e)}")
+            raise 
 
-    def save_contacts_to_excel(self, contacts: List[Contact], output_path: str) -> None:
-        """שומר אנשי קשר לקובץ Excel"""
+    def save_contacts(self, contacts: Iterable[Contact], output_path: str,
+                      export_format: Optional[str] = None) -> None:
+        """שומר אנשי קשר בפורמט לפי סיומת הקובץ (או export_format): xlsx מעוצב, csv, jsonl או parquet"""
+        export_format = export_format or os.path.splitext(output_path)[1].lstrip('.').lower()
+        if export_format == 'xlsx':
+            self.save_contacts_to_excel(contacts, output_path)
+            return
         try:
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            
-            # יצירת חוברת עבודה חדשה
-            wb = Workbook()
-            ws = wb.active
-            ws.title = 'אנשי קשר'
-            
-            # הגדרת סגנונות
-            header_font = Font(bold=True)
-            header_fill = PatternFill(start_color='D7E4BC', end_color='D7E4BC', fill_type='solid')
-            cell_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            cell_alignment = Alignment(wrap_text=True, vertical='top')
-            
-            # כתיבת כותרות
-            headers = ['שם', 'תפקיד', 'טלפון', 'אימייל', 'כתובת', 'קובץ מקור']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.border = cell_border
-                cell.alignment = cell_alignment
-            
-            # כתיבת נתונים
-            for row, contact in enumerate(contacts, 2):
-                ws.cell(row=row, column=1, value=contact.name)
-                ws.cell(row=row, column=2, value=contact.role)
-                ws.cell(row=row, column=3, value='; '.join(contact.phones))
-                ws.cell(row=row, column=4, value='; '.join(contact.emails))
-                ws.cell(row=row, column=5, value='; '.join(contact.addresses))
-                ws.cell(row=row, column=6, value=contact.source_file)
-                
-                # החלת סגנונות על תאים
-                for col in range(1, 7):
-                    cell = ws.cell(row=row, column=col)
-                    cell.border = cell_border
-                    cell.alignment = cell_alignment
-            
-            # התאמת רוחב עמודות
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column].width = min(adjusted_width, 100)
-            
-            # הקפאת שורת הכותרות
-            ws.freeze_panes = 'A2'
-            
-            # שמירת הקובץ
-            wb.save(output_path)
-            self.logger.info(f"נשמרו {len(contacts)} אנשי קשר לקובץ {output_path}")
-            
+            with open_writer(export_format, output_path, _EXCEL_COLUMNS) as writer:
+                for contact in contacts:
+                    writer.write_row(_contact_row(contact))
+            self.logger.info(f"נשמרו {writer.rows} אנשי קשר לקובץ {output_path}")
         except Exception as e:
-            self.logger.error(f"שגיאה בשמירת אנשי קשר לקובץ Excel: {str(e)}")
-            raise 
\ No newline at end of file
+            self.logger.error(f"שגיאה בשמירת אנשי קשר לקובץ {export_format}: {str(e)}")
+            raise
+
+
+# מחלץ אחד לכל תהליך עבודה - נבנה פעם אחת ומשמש לכל הקבצים שהתהליך מקבל
+_worker_extractor: Optional[ContactExtractor] = None
+
+
+def _init_scan_worker(cache_dir: Optional[str] = None) -> None:
+    """מאתחל את המחלץ של תהליך העבודה, עם אותו מטמון מסמכים כמו המחלץ הראשי"""
+    global _worker_extractor
+    _worker_extractor = ContactExtractor(cache_dir)
+
+
+def _scan_file(file_path: str) -> Tuple[str, list, Optional[str]]:
+    """מחלץ קובץ בודד בתהליך עבודה"""
+    return _extract_file(_worker_extractor, file_path)
+
+
+def _extract_file(extractor: ContactExtractor, file_path: str) -> Tuple[str, list, Optional[str]]:
+    """מחלץ קובץ בודד ומחזיר (נתיב, אנשי קשר, שגיאה) - שגיאה מוחזרת כטקסט ולא נזרקת"""
+    try:
+        return file_path, extractor.extract_contacts(file_path), None
+    except Exception as e:
+        return file_path, [], str(e) or type(e).__name__
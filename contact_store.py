@@ -0,0 +1,207 @@
+import logging
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from contact_extractor import Contact, ContactExtractor
+
+# טלפונים ומיילים מנורמלים (כמו ב-Contact.add_phone / add_email) הם מפתחות ראשיים,
+# ולכן כל מספר או כתובת שייכים לאיש קשר אחד בלבד והחיפוש לפיהם נעשה באינדקס
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    name_key TEXT,
+    role TEXT,
+    source_file TEXT
+);
+CREATE TABLE IF NOT EXISTS phones (
+    phone TEXT PRIMARY KEY,
+    contact_id INTEGER NOT NULL REFERENCES contacts(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS emails (
+    email TEXT PRIMARY KEY,
+    contact_id INTEGER NOT NULL REFERENCES contacts(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS addresses (
+    contact_id INTEGER NOT NULL REFERENCES contacts(id) ON DELETE CASCADE,
+    address TEXT NOT NULL,
+    PRIMARY KEY (contact_id, address)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_contacts_name_key ON contacts(name_key);
+CREATE INDEX IF NOT EXISTS idx_phones_contact ON phones(contact_id);
+CREATE INDEX IF NOT EXISTS idx_emails_contact ON emails(contact_id);
+"""
+
+
+def name_key(name: Optional[str]) -> str:
+    """מפתח החיפוש לפי שם - כמו בהסרת הכפילויות"""
+    return name.lower().strip() if name else ""
+
+
+class ContactStore:
+    """מאגר אנשי קשר ב-SQLite עם אינדקסים לפי טלפון, מייל ושם.
+    הוספת קובץ עולה כגודל הקובץ ולא כגודל המאגר, והייצוא ל-Excel נעשה רק כשצריך"""
+
+    def __init__(self, db_path: str):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'ContactStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+    def upsert(self, contacts: Iterable[Contact]) -> Dict[str, int]:
+        """מוסיף אנשי קשר או ממזג אותם עם אנשי קשר קיימים בעלי טלפון או מייל משותף.
+        הכל בטרנזקציה אחת; מחזיר כמה נוספו, כמה עודכנו וכמה נדחו"""
+        counts = {'inserted': 0, 'updated': 0, 'skipped': 0}
+        with self.connection:
+            for contact in contacts:
+                if not contact.is_valid():
+                    counts['skipped'] += 1
+                    continue
+                if self._upsert_one(contact):
+                    counts['updated'] += 1
+                else:
+                    counts['inserted'] += 1
+        self.logger.info(
+            f"נוספו {counts['inserted']} אנשי קשר, עודכנו {counts['updated']}, נדחו {counts['skipped']}"
+        )
+        return counts
+
+    def _upsert_one(self, contact: Contact) -> bool:
+        """מכניס איש קשר בודד, ומחזיר True אם מוזג עם איש קשר קיים"""
+        matches = self._matching_ids(contact)
+        if not matches:
+            cursor = self.connection.execute(
+                "INSERT INTO contacts (name, name_key, role, source_file) VALUES (?, ?, ?, ?)",
+                (contact.name, name_key(contact.name), contact.role, contact.source_file)
+            )
+            self._insert_details(cursor.lastrowid, contact)
+            return False
+
+        # איש הקשר הקיים הוותיק ביותר נשאר; אחרים שנמצאו דרך טלפון או מייל אחר מתמזגים אליו
+        target_id = min(matches)
+        merged = self.get(target_id)
+        for other_id in sorted(matches - {target_id}):
+            merged.merge(self.get(other_id))
+            self.connection.execute("DELETE FROM contacts WHERE id = ?", (other_id,))
+        merged.merge(contact)
+
+        self.connection.execute(
+            "UPDATE contacts SET name = ?, name_key = ?, role = ?, source_file = ? WHERE id = ?",
+            (merged.name, name_key(merged.name), merged.role, merged.source_file, target_id)
+        )
+        for table in ('phones', 'emails', 'addresses'):
+            self.connection.execute(f"DELETE FROM {table} WHERE contact_id = ?", (target_id,))
+        self._insert_details(target_id, merged)
+        return True
+
+    def _matching_ids(self, contact: Contact) -> set:
+        """מזהי אנשי הקשר הקיימים שחולקים טלפון או מייל עם איש הקשר"""
+        ids = set()
+        for phone in contact.phones:
+            row = self.connection.execute("SELECT contact_id FROM phones WHERE phone = ?", (phone,)).fetchone()
+            if row:
+                ids.add(row[0])
+        for email in contact.emails:
+            row = self.connection.execute("SELECT contact_id FROM emails WHERE email = ?", (email,)).fetchone()
+            if row:
+                ids.add(row[0])
+        return ids
+
+    def _insert_details(self, contact_id: int, contact: Contact) -> None:
+        self.connection.executemany(
+            "INSERT INTO phones (phone, contact_id) VALUES (?, ?)", [(phone, contact_id) for phone in contact.phones]
+        )
+        self.connection.executemany(
+            "INSERT INTO emails (email, contact_id) VALUES (?, ?)", [(email, contact_id) for email in contact.emails]
+        )
+        self.connection.executemany(
+            "INSERT INTO addresses (contact_id, address) VALUES (?, ?)",
+            [(contact_id, address) for address in contact.addresses]
+        )
+
+    def get(self, contact_id: int) -> Optional[Contact]:
+        """טוען איש קשר לפי מזהה"""
+        row = self.connection.execute(
+            "SELECT name, role, source_file FROM contacts WHERE id = ?", (contact_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return self._build(row, self._details('phones', 'phone', contact_id),
+                           self._details('emails', 'email', contact_id),
+                           self._details('addresses', 'address', contact_id))
+
+    def _details(self, table: str, column: str, contact_id: int) -> List[str]:
+        return [value for (value,) in self.connection.execute(
+            f"SELECT {column} FROM {table} WHERE contact_id = ?", (contact_id,)
+        )]
+
+    @staticmethod
+    def _build(row, phones: List[str], emails: List[str], addresses: List[str]) -> Contact:
+        name, role, source_file = row
+        return Contact.from_record({
+            'name': name, 'role': role, 'source': source_file,
+            'phones': phones, 'emails': emails, 'addresses': addresses,
+        }, source_file or "")
+
+    def find_by_phone(self, phone: str) -> Optional[Contact]:
+        """מחפש איש קשר לפי טלפון (מנורמל כמו ב-Contact.add_phone)"""
+        probe = Contact()
+        probe.add_phone(phone)
+        for normalized in probe.phones:
+            row = self.connection.execute("SELECT contact_id FROM phones WHERE phone = ?", (normalized,)).fetchone()
+            if row:
+                return self.get(row[0])
+        return None
+
+    def find_by_email(self, email: str) -> Optional[Contact]:
+        """מחפש איש קשר לפי כתובת מייל"""
+        row = self.connection.execute(
+            "SELECT contact_id FROM emails WHERE email = ?", (email.lower().strip(),)
+        ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def find_by_name(self, name: str) -> List[Contact]:
+        """מחזיר את כל אנשי הקשר בשם הזה"""
+        rows = self.connection.execute("SELECT id FROM contacts WHERE name_key = ? ORDER BY id", (name_key(name),))
+        return [self.get(contact_id) for (contact_id,) in rows.fetchall()]
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """מחזיר את כל אנשי הקשר לפי סדר ההוספה, בשלוש שאילתות"""
+        details = {}
+        for table, column in (('phones', 'phone'), ('emails', 'email'), ('addresses', 'address')):
+            values: Dict[int, List[str]] = {}
+            for contact_id, value in self.connection.execute(f"SELECT contact_id, {column} FROM {table}"):
+                values.setdefault(contact_id, []).append(value)
+            details[table] = values
+
+        for contact_id, *row in self.connection.execute(
+            "SELECT id, name, role, source_file FROM contacts ORDER BY id"
+        ):
+            yield self._build(row, details['phones'].get(contact_id, []), details['emails'].get(contact_id, []),
+                              details['addresses'].get(contact_id, []))
+
+    def import_excel(self, file_path: str, extractor: Optional[ContactExtractor] = None) -> Dict[str, int]:
+        """מייבא קובץ Excel ראשי קיים (מעבר חד-פעמי מהקובץ למאגר)"""
+        extractor = extractor or ContactExtractor()
+        return self.upsert(extractor.load_contacts_from_excel(file_path))
+
+    def export_to_excel(self, output_path: str, extractor: Optional[ContactExtractor] = None) -> int:
+        """מייצא את כל המאגר לקובץ Excel בעיצוב הרגיל, ומחזיר כמה אנשי קשר נכתבו"""
+        extractor = extractor or ContactExtractor()
+        contacts = list(self.iter_contacts())
+        extractor.save_contacts_to_excel(contacts, output_path)
+        return len(contacts)
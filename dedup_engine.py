@@ -0,0 +1,228 @@
+import re
+import time
+from difflib import SequenceMatcher
+from itertools import chain, combinations
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+# תארים שלא משנים את זהות האדם (אחרי הסרת גרשיים)
+NAME_TITLES = frozenset({
+    'עוד', 'עוהד', 'דר', 'דוקטור', 'פרופ', 'פרופסור', 'רוח', 'מר', 'גב', 'גברת', 'הרב', 'רב', 'מהנדס',
+    'מהנדסת', 'אדריכל', 'אדריכלית', 'אינג', 'רפ', 'mr', 'mrs', 'ms', 'dr', 'adv',
+})
+
+# ראשי תיבות נפוצים (אחרי הסרת גרשיים) והצורה המלאה שלהם
+NAME_ALIASES = {
+    'תא': 'תל אביב', 'רג': 'רמת גן', 'פת': 'פתח תקווה', 'בב': 'בני ברק', 'ראשלצ': 'ראשון לציון',
+    'קש': 'קרית שמונה', 'בש': 'באר שבע', 'פתח תקוה': 'פתח תקווה',
+}
+
+# אותיות סופיות מנורמלות לצורה הרגילה, וגרש/גרשיים עבריים מוסרים כמו מירכאות
+_NAME_TABLE = str.maketrans({'ך': 'כ', 'ם': 'מ', 'ן': 'נ', 'ף': 'פ', 'ץ': 'צ', '"': None, "'": None, '״': None, '׳': None})
+_NAME_TOKEN_PATTERN = re.compile(r'[^\W\d_]+')
+_NON_DIGITS_PATTERN = re.compile(r'\D')
+
+# מספר הספרות האחרונות של טלפון שמשמשות כמפתח חסימה (בלי הקידומת)
+PHONE_SUFFIX_DIGITS = 7
+
+
+def identity_keys(phones: Iterable[str], emails: Iterable[str]) -> Tuple[str, ...]:
+    """הטלפונים והמיילים המלאים של רשומה בצורה אחידה: טלפון כספרות בלבד עם 0 במקום 972
+    (050-1234567, 0501234567 ו-+972501234567 הם אותו מספר), ומייל באותיות קטנות"""
+    keys = []
+    for phone in phones:
+        digits = _NON_DIGITS_PATTERN.sub('', phone)
+        if digits.startswith('972'):
+            digits = '0' + digits[3:]
+        if digits and digits not in keys:
+            keys.append(digits)
+    for email in emails:
+        email = email.strip().lower()
+        if email and email not in keys:
+            keys.append(email)
+    return tuple(keys)
+
+
+def name_tokens(name: str) -> FrozenSet[str]:
+    """קבוצת המילים המנורמלת של שם: בלי תארים, עם ראשי תיבות מורחבים ובלי אותיות סופיות"""
+    if not name:
+        return frozenset()
+    tokens = []
+    for token in _NAME_TOKEN_PATTERN.findall(name.lower().translate(_NAME_TABLE)):
+        if token in NAME_TITLES:
+            continue
+        tokens.extend(NAME_ALIASES.get(token, token).translate(_NAME_TABLE).split())
+    return frozenset(tokens)
+
+
+class DisjointSet:
+    """איחוד-חיפוש על אינדקסים 0..n-1, עם איחוד לפי גודל וקיצור מסלולים"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            # קיצור מסלול בחצי: כל צומת בדרך מצביע על הסבא שלו
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+
+    def groups(self) -> List[List[int]]:
+        """הקבוצות לפי ההופעה הראשונה, ובתוך כל קבוצה לפי סדר האינדקסים"""
+        grouped: Dict[int, List[int]] = {}
+        find = self.find
+        for index in range(len(self.parent)):
+            grouped.setdefault(find(index), []).append(index)
+        return list(grouped.values())
+
+
+class DedupEngine:
+    """מאחד אנשי קשר שחולקים טלפון או מייל כלשהו (גם דרך שרשרת של אנשי קשר).
+    כל טלפון ומייל מנורמל נרשם במילון, כך שהזמן כמעט ליניארי במספר המזהים"""
+
+    def groups(self, contacts: Sequence) -> List[List[int]]:
+        """מחזיר קבוצות של אינדקסים לאנשי קשר כפולים.
+        הקבוצות מסודרות לפי ההופעה הראשונה, ובתוך כל קבוצה לפי סדר הקלט"""
+        sets = DisjointSet(len(contacts))
+        union = sets.union
+        owners: Dict[str, int] = {}
+        # אנשי קשר בלי טלפון ומייל מאוחדים רק לפי שם, כמו במפתח הקודם
+        name_owners: Dict[str, int] = {}
+
+        for index, contact in enumerate(contacts):
+            phones, emails = contact.phones, contact.emails
+            if not phones and not emails:
+                key = contact.name.lower().strip() if contact.name else ""
+                owner = name_owners.setdefault(key, index)
+                if owner != index:
+                    union(owner, index)
+                continue
+            # טלפונים ומיילים במילון אחד - מייל תמיד מכיל '@' וטלפון מנורמל אף פעם לא
+            for identifier in chain(phones, emails):
+                owner = owners.setdefault(identifier, index)
+                if owner != index:
+                    union(owner, index)
+
+        return sets.groups()
+
+    def deduplicate(self, contacts: Sequence) -> List:
+        """ממזג כל קבוצה לאיש הקשר הראשון בה בעזרת Contact.merge, לפי סדר הקלט"""
+        return merge_groups(contacts, self.groups(contacts))
+
+
+class NearDuplicateEngine:
+    """מוצא כפילויות שנבדלות רק בכתיב השם (תארים, ראשי תיבות, סדר שם פרטי ומשפחה).
+    רק רשומות שחולקות מפתח חסימה - קבוצת מילות השם, סיומת טלפון או החלק המקומי של המייל -
+    עוברות בדיקת דמיון, במקום השוואה של כל הזוגות. מפתחות החסימה רק מצמצמים את ההשוואות:
+    שם דומה לא מאחד שתי קבוצות שלכל אחת מהן טלפונים או מיילים ואין ביניהן טלפון מלא או מייל
+    מלא משותף - אלה שני אנשים עם אותו שם, גם אם סיומת הטלפון או שם המשתמש במייל זהים"""
+
+    def __init__(self, threshold: float = 0.85, max_block_size: int = 50):
+        self.threshold = threshold
+        # בלוק גדול מזה (שם נפוץ מאוד, info@...) לא מכריע כלום ומדולג
+        self.max_block_size = max_block_size
+        self.stats: Dict[str, float] = {}
+
+    @staticmethod
+    def blocking_keys(name: str, phones: Iterable[str], emails: Iterable[str]) -> List[str]:
+        """מפתחות החסימה של רשומה"""
+        keys = []
+        tokens = name_tokens(name)
+        if tokens:
+            keys.append('n:' + ' '.join(sorted(tokens)))
+        for phone in phones:
+            digits = _NON_DIGITS_PATTERN.sub('', phone)
+            if len(digits) >= PHONE_SUFFIX_DIGITS:
+                keys.append('p:' + digits[-PHONE_SUFFIX_DIGITS:])
+        for email in emails:
+            local = email.lower().split('@', 1)[0]
+            if local:
+                keys.append('e:' + local)
+        return keys
+
+    def similarity(self, first: str, second: str) -> float:
+        """דמיון בין שני שמות מנורמלים (מילים ממוינות), בין 0 ל-1"""
+        if first == second:
+            return 1.0
+        matcher = SequenceMatcher(None, first, second, autojunk=False)
+        # חסמים עליונים זולים לפני החישוב המלא
+        if matcher.real_quick_ratio() < self.threshold or matcher.quick_ratio() < self.threshold:
+            return 0.0
+        return matcher.ratio()
+
+    def groups(self, records: Sequence[Tuple[str, Iterable[str], Iterable[str]]]) -> List[List[int]]:
+        """מקבל רשומות (שם, טלפונים, מיילים) ומחזיר קבוצות אינדקסים של כפילויות, לפי סדר הקלט"""
+        start = time.perf_counter()
+        names = []
+        # הטלפונים והמיילים המלאים של כל קבוצה, לפי השורש שלה (בהתחלה כל רשומה היא קבוצה).
+        # tuple ולא set - ברוב הרשומות יש מזהה אחד או שניים, וכך הזיכרון קטן פי כמה
+        identifiers: List[Tuple[str, ...]] = []
+        blocks: Dict[str, List[int]] = {}
+        for index, (name, phones, emails) in enumerate(records):
+            names.append(' '.join(sorted(name_tokens(name))))
+            identifiers.append(identity_keys(phones, emails))
+            for key in self.blocking_keys(name, phones, emails):
+                blocks.setdefault(key, []).append(index)
+
+        sets = DisjointSet(len(records))
+        find = sets.find
+        compared = oversized = matches = 0
+        for members in blocks.values():
+            if len(members) > self.max_block_size:
+                oversized += 1
+                continue
+            for first, second in combinations(members, 2):
+                # כבר באותה קבוצה - דרך בלוק אחר או דרך שרשרת של איחודים
+                root_first, root_second = find(first), find(second)
+                if root_first == root_second:
+                    continue
+                # שתי קבוצות עם מזהים ובלי טלפון או מייל משותף לא מאוחדות לפי שם, גם לא דרך רשומה
+                # שלישית בלי מזהים; בלוק של סיומת טלפון או שם משתמש במייל לא מספיק
+                first_ids, second_ids = identifiers[root_first], identifiers[root_second]
+                if first_ids and second_ids and not any(key in second_ids for key in first_ids):
+                    continue
+                compared += 1
+                if names[first] and self.similarity(names[first], names[second]) >= self.threshold:
+                    sets.union(first, second)
+                    identifiers[find(first)] = first_ids + tuple(key for key in second_ids if key not in first_ids)
+                    matches += 1
+
+        seconds = time.perf_counter() - start
+        self.stats = {
+            'records': len(records),
+            'blocks': len(blocks),
+            'oversized_blocks': oversized,
+            'pairs_compared': compared,
+            'matches': matches,
+            'seconds': seconds,
+            'records_per_second': len(records) / seconds if seconds else 0.0,
+            'pairs_per_second': compared / seconds if seconds else 0.0,
+        }
+        return sets.groups()
+
+    def deduplicate(self, contacts: Sequence) -> List:
+        """ממזג אנשי קשר כפולים לפי דמיון שם בתוך בלוקים, בעזרת Contact.merge"""
+        records = [(contact.name, contact.phones, contact.emails) for contact in contacts]
+        return merge_groups(contacts, self.groups(records))
+
+
+def merge_groups(contacts: Sequence, groups: List[List[int]]) -> List:
+    """ממזג כל קבוצה לאיש הקשר הראשון בה, לפי סדר הקלט"""
+    result = []
+    for group in groups:
+        first = contacts[group[0]]
+        for index in group[1:]:
+            first.merge(contacts[index])
+        result.append(first)
+    return result
@@ -0,0 +1,74 @@
+import json
+import logging
+import os
+from typing import Any, Optional
+
+from scan_manifest import file_digest
+
+
+class DocumentCache:
+    """מטמון דו-שכבתי על הדיסק, לפי גיבוב תוכן הקובץ.
+    שכבה ראשונה: המסמך המפורק (פסקאות, שורות טבלה וטקסט עמודים) - יקר לחישוב ולא תלוי בכללי החילוץ.
+    שכבה שנייה: אנשי הקשר שחולצו, לפי גרסת הכללים - שינוי כללים מריץ רק את השלב הזול"""
+
+    def __init__(self, cache_dir: str, parse_version: str):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.parse_version = parse_version
+        self.stats = {'contacts_hits': 0, 'parsed_hits': 0, 'misses': 0}
+
+    def key(self, file_path: str) -> str:
+        """מפתח הקובץ במטמון: סוג הקובץ וגיבוב התוכן"""
+        kind = os.path.splitext(file_path)[1].lower().lstrip('.')
+        return f"{kind}-{file_digest(file_path)}"
+
+    def _parsed_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, 'parsed', self.parse_version, f"{key}.json")
+
+    def _contacts_path(self, key: str, rules_version: str) -> str:
+        return os.path.join(self.cache_dir, 'contacts', rules_version, f"{key}.json")
+
+    def load_parsed(self, key: str) -> Optional[Any]:
+        """מחזיר את המסמך המפורק מהשכבה הראשונה, או None"""
+        parsed = self._load(self._parsed_path(key))
+        if parsed is not None:
+            self.stats['parsed_hits'] += 1
+        else:
+            self.stats['misses'] += 1
+        return parsed
+
+    def store_parsed(self, key: str, parsed: Any) -> None:
+        self._store(self._parsed_path(key), parsed)
+
+    def load_contacts(self, key: str, rules_version: str) -> Optional[Any]:
+        """מחזיר את רשומות אנשי הקשר מהשכבה השנייה, או None"""
+        records = self._load(self._contacts_path(key, rules_version))
+        if records is not None:
+            self.stats['contacts_hits'] += 1
+        return records
+
+    def store_contacts(self, key: str, rules_version: str, records: Any) -> None:
+        self._store(self._contacts_path(key, rules_version), records)
+
+    def _load(self, path: str) -> Optional[Any]:
+        """קורא רשומה מהמטמון - רשומה חסרה או פגומה נחשבת כהחטאה"""
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"רשומה פגומה במטמון {path}: {str(e)}")
+            return None
+
+    def _store(self, path: str, value: Any) -> None:
+        """כותב רשומה דרך קובץ זמני, כך שקורא במקביל לא רואה רשומה חצויה"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(value, file, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            # מטמון שלא נכתב לא מפיל את החילוץ
+            self.logger.warning(f"שגיאה בכתיבה למטמון {path}: {str(e)}")
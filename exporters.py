@@ -0,0 +1,222 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import xlsxwriter
+
+# עמודות הפלט: שדה באיש הקשר וכותרת העמודה
+CONTACT_COLUMNS: List[Tuple[str, str]] = [
+    ('name', 'שם'),
+    ('phone', 'טלפון'),
+    ('email', 'אימייל'),
+    ('address', 'כתובת'),
+    ('source', 'מקור'),
+]
+
+HEADER_FORMAT = {
+    'bold': True,
+    'align': 'center',
+    'valign': 'vcenter',
+    'bg_color': '#4F81BD',
+    'font_color': 'white',
+    'border': 1,
+}
+
+CELL_FORMAT = {
+    'align': 'right',
+    'valign': 'vcenter',
+    'border': 1,
+}
+
+# מספר שורות הנתונים המרבי בגליון Excel (בלי שורת הכותרת)
+EXCEL_MAX_ROWS = 1048575
+
+# מספר השורות שנאספות לפני כתיבת קבוצת שורות ל-Parquet - מגביל את הזיכרון
+PARQUET_BATCH_ROWS = 10000
+
+
+class StreamWriter(ABC):
+    """בסיס לכותבי הפלט: מקבלים אנשי קשר אחד אחד ולא מחזיקים את כל הרשימה.
+    columns היא רשימת (שדה, כותרת); כל מחלקה יורשת מממשת write_row ו-close - מחלקה שחסר
+    לה אחד מהם נכשלת כבר ביצירת הכותב, ולא באמצע הייצוא"""
+
+    def __init__(self, path: str, columns: List[Tuple[str, str]] = CONTACT_COLUMNS):
+        self.path = path
+        self.fields = [field for field, _ in columns]
+        self.headers = [header for _, header in columns]
+        self.rows = 0
+
+    def write(self, contact: Dict) -> None:
+        """כותב איש קשר אחד (מילון לפי שדות העמודות) כשורה"""
+        self.write_row([contact.get(field) for field in self.fields])
+
+    @abstractmethod
+    def write_row(self, values: Sequence[Any]) -> None:
+        """כותב שורה של ערכים לפי סדר העמודות"""
+
+    def write_all(self, contacts: Iterable[Dict]) -> int:
+        for contact in contacts:
+            self.write(contact)
+        return self.rows
+
+    @abstractmethod
+    def close(self) -> None:
+        """מסיים את הקובץ וסוגר אותו"""
+
+    def __enter__(self) -> 'StreamWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class ExcelStreamWriter(StreamWriter):
+    """כותב אנשי קשר לקובץ Excel מעוצב שורה אחר שורה, במצב הזיכרון הקבוע של xlsxwriter:
+    כל שורה נכתבת לקובץ זמני כשמתחילים את הבאה, ורוחב העמודות נצבר תוך כדי הכתיבה.
+    הזיכרון לא תלוי במספר אנשי הקשר. הסגנונות (כותרת, תא, ותא בשורה לסירוגין אם ביקשו) נוצרים פעם אחת
+    ומשותפים לכל השורות. column_widths קובע רוחב קבוע לכל עמודה במקום הרוחב הנצבר"""
+
+    def __init__(self, path: str, columns: List[Tuple[str, str]] = CONTACT_COLUMNS,
+                 sheet_name: str = 'אנשי קשר', header_format: Dict = HEADER_FORMAT,
+                 cell_format: Dict = CELL_FORMAT, max_width: Optional[int] = None,
+                 freeze_header: bool = False, alternate_format: Optional[Dict] = None,
+                 column_widths: Optional[Sequence[int]] = None):
+        super().__init__(path, columns)
+        self.max_width = max_width
+        self.workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+        self.worksheet = self.workbook.add_worksheet(sheet_name)
+        self.header_format = self.workbook.add_format(header_format)
+        self.cell_format = self.workbook.add_format(cell_format)
+        # שורות הנתונים הזוגיות ב-Excel (2, 4, ...) מקבלות את הסגנון החלופי
+        self.alternate_format = self.workbook.add_format(alternate_format) if alternate_format else None
+        self.column_widths = column_widths
+
+        self.worksheet.write_row(0, 0, self.headers, self.header_format)
+        self.widths = [len(header) for header in self.headers]
+        if freeze_header:
+            self.worksheet.freeze_panes(1, 0)
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        if self.rows >= EXCEL_MAX_ROWS:
+            # xlsxwriter מתעלם בשקט משורות מעבר לגבול, ולכן עוצרים כאן במקום לאבד נתונים
+            raise ValueError(f"בגליון Excel יש מקום ל-{EXCEL_MAX_ROWS} שורות לכל היותר - יש לבחור csv, jsonl או parquet")
+        self.rows += 1
+        cell_format = self.alternate_format if self.alternate_format and self.rows % 2 else self.cell_format
+        for col, value in enumerate(values):
+            if value is None:
+                self.worksheet.write_blank(self.rows, col, None, cell_format)
+                continue
+            self.worksheet.write(self.rows, col, value, cell_format)
+            if self.column_widths is not None:
+                continue
+            length = len(str(value))
+            if length > self.widths[col]:
+                self.widths[col] = length
+
+    def close(self) -> None:
+        # רוחב העמודות נשמר בראש הגליון רק בסגירה, ולכן אפשר לקבוע אותו אחרי שכל השורות נכתבו
+        widths = self.column_widths
+        if widths is None:
+            widths = [width + 2 if self.max_width is None else min(width + 2, self.max_width)
+                      for width in self.widths]
+        for col, width in enumerate(widths):
+            self.worksheet.set_column(col, col, width)
+        self.workbook.close()
+
+
+class CsvStreamWriter(StreamWriter):
+    """CSV ב-UTF-8 עם BOM, כך ש-Excel מזהה את העברית; שורת הכותרת לפי כותרות העמודות"""
+
+    def __init__(self, path: str, columns: List[Tuple[str, str]] = CONTACT_COLUMNS):
+        super().__init__(path, columns)
+        self.file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.headers)
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        self.rows += 1
+        self.writer.writerow(['' if value is None else value for value in values])
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class JsonLinesStreamWriter(StreamWriter):
+    """JSON Lines - אובייקט אחד בכל שורה, לפי שמות השדות"""
+
+    def __init__(self, path: str, columns: List[Tuple[str, str]] = CONTACT_COLUMNS):
+        super().__init__(path, columns)
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        self.rows += 1
+        self.file.write(json.dumps(dict(zip(self.fields, values)), ensure_ascii=False))
+        self.file.write('\n')
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ParquetStreamWriter(StreamWriter):
+    """Parquet עמודתי, לפי שמות השדות וכל העמודות מחרוזות. השורות נאספות בקבוצות של
+    batch_rows ונכתבות כקבוצת שורות, כך שהזיכרון תלוי בגודל הקבוצה ולא במספר אנשי הקשר"""
+
+    def __init__(self, path: str, columns: List[Tuple[str, str]] = CONTACT_COLUMNS,
+                 batch_rows: int = PARQUET_BATCH_ROWS):
+        # pyarrow נטען רק כשמבקשים Parquet
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        super().__init__(path, columns)
+        self.pa = pa
+        self.batch_rows = batch_rows
+        self.schema = pa.schema([(field, pa.string()) for field in self.fields])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.batch: List[List[Any]] = [[] for _ in self.fields]
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        self.rows += 1
+        for column, value in zip(self.batch, values):
+            column.append(None if value is None else str(value))
+        if len(self.batch[0]) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self.batch[0]:
+            self.writer.write_batch(self.pa.record_batch(self.batch, schema=self.schema))
+            self.batch = [[] for _ in self.fields]
+
+    def close(self) -> None:
+        self._flush()
+        self.writer.close()
+
+
+# פורמטי הפלט - השם הוא גם סיומת הקובץ
+EXPORT_FORMATS = {
+    'xlsx': ExcelStreamWriter,
+    'csv': CsvStreamWriter,
+    'jsonl': JsonLinesStreamWriter,
+    'parquet': ParquetStreamWriter,
+}
+
+
+def open_writer(export_format: str, path: str, columns: Optional[List[Tuple[str, str]]] = None,
+                **options) -> StreamWriter:
+    """פותח כותב לפי שם הפורמט; options מועברים לכותב (למשל סגנונות ל-xlsx)"""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"פורמט פלט לא נתמך: {export_format}")
+    return EXPORT_FORMATS[export_format](path, columns or CONTACT_COLUMNS, **options)
+
+
+def write_contacts(contacts: Iterable[Dict], path: str, export_format: str = 'xlsx',
+                   columns: Optional[List[Tuple[str, str]]] = None) -> int:
+    """כותב אנשי קשר מכל איטרטור לקובץ בפורמט המבוקש ומחזיר את מספר השורות"""
+    with open_writer(export_format, path, columns) as writer:
+        return writer.write_all(contacts)
+
+
+def write_contacts_excel(contacts: Iterable[Dict], path: str,
+                         columns: Optional[List[Tuple[str, str]]] = None) -> int:
+    """כותב אנשי קשר מכל איטרטור לקובץ Excel מעוצב ומחזיר את מספר השורות"""
+    return write_contacts(contacts, path, 'xlsx', columns)
@@ -0,0 +1,33 @@
+import multiprocessing
+import os
+
+# הגדרות שרת הייצור: gunicorn -c gunicorn.conf.py wsgi:app
+bind = os.environ.get('BIND', '0.0.0.0:5001')
+
+# תהליכי שרת שמתפצלים מראש, ובכל אחד כמה חוטים לבקשות קצרות (מצב עבודה, הורדה, זרם התקדמות).
+# כל תהליך שרת מחזיק מאגר עבודות משלו עם JOB_WORKERS תהליכי חילוץ (ראו app.py), ולכן ברירת המחדל
+# מחלקת את הליבות בין המאגרים: סך תהליכי החילוץ בשרת כולו הוא בערך מספר הליבות ולא פי כמה ממנו
+job_workers = int(os.environ.get('JOB_WORKERS', 2))
+workers = int(os.environ.get('WEB_WORKERS', max(1, multiprocessing.cpu_count() // max(1, job_workers))))
+worker_class = 'gthread'
+threads = int(os.environ.get('WEB_THREADS', 8))
+
+# האפליקציה נטענת ומחוממת (wsgi.warm_up) פעם אחת בתהליך הראשי, לפני ה-fork
+preload_app = True
+
+# חילוץ בתוך הבקשה (sync=1) של קובץ גדול לוקח זמן; בכיבוי, בקשות פתוחות מקבלות 30 שניות להסתיים
+timeout = 300
+graceful_timeout = 30
+keepalive = 5
+
+# החלפת תהליכים מדי פעם מונעת הצטברות זיכרון מפענחים
+max_requests = 1000
+max_requests_jitter = 100
+
+accesslog = '-'
+
+
+def worker_exit(server, worker):
+    """עבודות שעוד לא התחילו נשארות בתור - תהליך שרת אחר ימשיך אותן"""
+    from app import job_queue
+    job_queue.shutdown(wait=False, cancel_pending=True)
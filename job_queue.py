@@ -0,0 +1,277 @@
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Set
+
+# מצבי עבודה
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+# מספר הניסיונות לעבודה שתהליך העבודה שלה קרס, לפני שהיא מסומנת כנכשלת
+MAX_ATTEMPTS = 3
+
+# תהליכי העבודה לא נוצרים ב-fork: המאגר נבנה בתוך חוט של בקשה בתהליך שרת מרובה חוטים (gthread),
+# ו-fork מעתיק מנעולים שחוטים אחרים מחזיקים (למשל של קובץ הלוג) - הילד ננעל בכתיבה הראשונה ללוג.
+# forkserver מפצל מתהליך נקי בעל חוט אחד; spawn כשאינו זמין
+_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+
+# מספר השניות בין חיפושי עבודות יתומות של תהליכי שרת שיצאו (למשל אחרי max_requests)
+JOB_RECOVERY_INTERVAL = 30
+
+
+class JobStore:
+    """מצב העבודות על הדיסק - קובץ JSON לכל עבודה, כך שהמצב שורד קריסה של תהליך או של השרת"""
+
+    def __init__(self, jobs_dir: str):
+        self.logger = logging.getLogger(__name__)
+        self.jobs_dir = jobs_dir
+        os.makedirs(jobs_dir, exist_ok=True)
+
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def progress_path(self, job_id: str) -> str:
+        """קובץ ההתקדמות של העבודה (נכתב מתהליך העבודה)"""
+        return os.path.join(self.jobs_dir, f"{job_id}.progress")
+
+    def create(self, files: List[Dict[str, str]], job_id: Optional[str] = None,
+               options: Optional[Dict] = None) -> Dict:
+        """רושם עבודה חדשה בתור; options הם הגדרות שהמטפל קורא מהעבודה (למשל פורמט הפלט)"""
+        now = time.time()
+        job = {
+            'id': job_id or uuid.uuid4().hex,
+            'status': QUEUED,
+            'files': files,
+            'options': options or {},
+            'attempts': 0,
+            # תהליך השרת שהעבודה נמצאת בתור שלו
+            'owner': os.getpid(),
+            'created': now,
+            'updated': now,
+        }
+        self.save(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """טוען עבודה, או None אם אינה קיימת"""
+        try:
+            with open(self._path(job_id), 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.error(f"שגיאה בטעינת העבודה {job_id}: {str(e)}")
+            return None
+
+    def save(self, job: Dict) -> None:
+        """שומר עבודה דרך קובץ זמני, כך שקורא לא רואה מצב חצוי"""
+        job['updated'] = time.time()
+        temp_path = f"{self._path(job['id'])}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(job, file, ensure_ascii=False)
+        os.replace(temp_path, self._path(job['id']))
+
+    def update(self, job_id: str, **fields) -> Optional[Dict]:
+        """מעדכן שדות של עבודה קיימת"""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.update(fields)
+        self.save(job)
+        return job
+
+    def claim(self, job_id: str, previous_owner) -> bool:
+        """תביעת עבודה יתומה - רק תהליך אחד מצליח ליצור את קובץ התביעה עבור אותו בעלים קודם"""
+        try:
+            os.close(os.open(os.path.join(self.jobs_dir, f"{job_id}.{previous_owner}.claim"),
+                             os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            return False
+
+    def release_claims(self, job_id: str) -> None:
+        """מוחק את קבצי התביעה של עבודה שהסתיימה"""
+        for name in os.listdir(self.jobs_dir):
+            if name.startswith(f"{job_id}.") and name.endswith('.claim'):
+                try:
+                    os.remove(os.path.join(self.jobs_dir, name))
+                except OSError:
+                    pass
+
+    def unfinished(self) -> List[Dict]:
+        """עבודות שעדיין לא הסתיימו, לפי סדר היצירה"""
+        jobs = []
+        for name in os.listdir(self.jobs_dir):
+            if name.endswith('.json'):
+                job = self.get(name[:-len('.json')])
+                if job and job['status'] in (QUEUED, RUNNING):
+                    jobs.append(job)
+        return sorted(jobs, key=lambda job: job['created'])
+
+
+def _process_alive(pid: Optional[int]) -> bool:
+    """האם תהליך עם המזהה הזה עדיין רץ"""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _run_job(store: JobStore, handler: Callable[[Dict], Dict], job_id: str) -> Dict:
+    """רץ בתהליך העבודה: מסמן את העבודה כרצה ומפעיל את המטפל"""
+    job = store.update(job_id, status=RUNNING, pid=os.getpid())
+    return handler(job)
+
+
+class JobQueue:
+    """תור עבודות עם מאגר תהליכים. המטפל מקבל את העבודה ומחזיר מילון תוצאה שנשמר בה.
+    תהליך שקרס מפיל את כל המאגר: העבודות שרצו בו חוזרות לתור בלי שנספר להן ניסיון, וכל אחת מורצת
+    לבד במאגר משלה - כך ניסיון נספר רק לעבודה שבאמת מפילה את התהליך.
+    כמה תהליכי שרת יכולים לחלוק את אותה תיקיית עבודות: כל אחד ממשיך רק עבודות שהבעלים שלהן כבר לא רץ,
+    ב-start הראשון ואחר כך לכל היותר פעם ב-JOB_RECOVERY_INTERVAL שניות"""
+
+    def __init__(self, store: JobStore, handler: Callable[[Dict], Dict], workers: int = 2):
+        self.logger = logging.getLogger(__name__)
+        self.store = store
+        self.handler = handler
+        self.workers = workers
+        self.pool: Optional[ProcessPoolExecutor] = None
+        # מאגרים של תהליך אחד לעבודות שרצו במאגר שקרס, עד שהעבודה בהם מסתיימת
+        self.isolated: Set[ProcessPoolExecutor] = set()
+        self.lock = threading.Lock()
+        self.last_recovery = 0.0
+
+    def start(self) -> None:
+        """מפעיל את המאגר ומחזיר לתור עבודות שנקטעו (למשל בקריסה של השרת או ביציאה של תהליך שרת אחר).
+        נקרא בכל בקשה: אחרי הפעם הראשונה רק מחפש עבודות יתומות, אם עבר מספיק זמן מהחיפוש הקודם"""
+        now = time.monotonic()
+        with self.lock:
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=_MP_CONTEXT)
+            elif now - self.last_recovery < JOB_RECOVERY_INTERVAL:
+                return
+            self.last_recovery = now
+        self.recover()
+
+    def recover(self) -> None:
+        """מחזיר לתור עבודות שהבעלים שלהן ותהליך העבודה שלהן כבר לא רצים"""
+        for job in self.store.unfinished():
+            # עבודה של תהליך שרת אחר שעדיין רץ נשארת אצלו
+            if _process_alive(job.get('owner')) or _process_alive(job.get('pid')):
+                continue
+            if not self.store.claim(job['id'], job.get('owner')):
+                continue
+            if job['status'] == RUNNING:
+                self.logger.warning(f"העבודה {job['id']} נקטעה, מחזיר אותה לתור")
+                if not self._requeue(job['id'], 'תהליך השרת של העבודה יצא באמצע העבודה'):
+                    continue
+            else:
+                self.store.update(job['id'], owner=os.getpid())
+            self._dispatch(job['id'])
+
+    def submit(self, files: List[Dict[str, str]], job_id: Optional[str] = None,
+               options: Optional[Dict] = None) -> Dict:
+        """יוצר עבודה חדשה ושולח אותה למאגר; מחזיר מיד את העבודה במצב המתנה"""
+        self.start()
+        job = self.store.create(files, job_id, options)
+        self._dispatch(job['id'])
+        self.logger.info(f"עבודה {job['id']} נוספה לתור ({len(files)} קבצים)")
+        return job
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """סוגר את המאגר. עבודות שבוטלו נשארות בתור, ותהליך שרת אחר ימשיך אותן אחרי שהתהליך הזה ייצא"""
+        with self.lock:
+            pool, self.pool = self.pool, None
+            isolated, self.isolated = self.isolated, set()
+        for closing in ([pool] if pool is not None else []) + list(isolated):
+            closing.shutdown(wait=wait, cancel_futures=cancel_pending)
+
+    def _dispatch(self, job_id: str) -> None:
+        with self.lock:
+            pool = self.pool
+            if pool is None:
+                # המאגר נסגר - העבודה נשארת בתור וממשיכה ב-start הבא
+                return
+            future = pool.submit(_run_job, self.store, self.handler, job_id)
+        future.add_done_callback(lambda done: self._finish(job_id, pool, done))
+
+    def _dispatch_isolated(self, job_id: str) -> None:
+        """מריץ עבודה לבד במאגר של תהליך אחד, כך שקריסה בו היא בוודאות של העבודה הזאת"""
+        with self.lock:
+            if self.pool is None:
+                return
+            pool = ProcessPoolExecutor(max_workers=1, mp_context=_MP_CONTEXT)
+            self.isolated.add(pool)
+            future = pool.submit(_run_job, self.store, self.handler, job_id)
+        future.add_done_callback(lambda done: self._finish(job_id, pool, done, isolated=True))
+
+    def _finish(self, job_id: str, pool: ProcessPoolExecutor, future, isolated: bool = False) -> None:
+        """נקרא כשהעבודה הסתיימה, נכשלה או שתהליך העבודה קרס"""
+        if isolated:
+            with self.lock:
+                self.isolated.discard(pool)
+            pool.shutdown(wait=False)
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except BrokenProcessPool:
+            if isolated:
+                # העבודה רצה לבד - היא שהפילה את התהליך, ורק לה נספר ניסיון
+                if self._requeue(job_id, 'תהליך העבודה קרס'):
+                    self._dispatch_isolated(job_id)
+                return
+            # תהליך שקרס מפיל את כל המאגר, ולא ידוע איזו עבודה הפילה אותו: יוצרים מאגר חדש,
+            # וכל עבודה שהייתה בו חוזרת לתור בלי ניסיון נוסף ומורצת לבד
+            self._replace_pool(pool)
+            if self._requeue(job_id, 'מאגר העבודות קרס', count_attempt=False):
+                self._dispatch_isolated(job_id)
+            return
+        except Exception as e:
+            self.logger.error(f"שגיאה בעבודה {job_id}: {str(e)}")
+            self.store.update(job_id, status=FAILED, error=str(e))
+            self.store.release_claims(job_id)
+            return
+        self.store.update(job_id, status=DONE, result=result)
+        self.store.release_claims(job_id)
+        self.logger.info(f"עבודה {job_id} הסתיימה")
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        """מחליף מאגר שקרס - פעם אחת, גם אם כמה עבודות בו נכשלו"""
+        with self.lock:
+            if self.pool is broken:
+                broken.shutdown(wait=False)
+                self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=_MP_CONTEXT)
+
+    def _requeue(self, job_id: str, reason: str, count_attempt: bool = True) -> bool:
+        """מחזיר עבודה לתור אם נשארו ניסיונות; אחרת מסמן אותה כנכשלת.
+        count_attempt=False מחזיר אותה בלי לספור ניסיון (העבודה לא בהכרח אשמה)"""
+        job = self.store.get(job_id)
+        if job is None:
+            return False
+        if count_attempt:
+            job['attempts'] += 1
+        if job['attempts'] >= MAX_ATTEMPTS:
+            self.logger.error(f"העבודה {job_id} נכשלה אחרי {job['attempts']} ניסיונות: {reason}")
+            job.update(status=FAILED, error=reason)
+            self.store.save(job)
+            self.store.release_claims(job_id)
+            return False
+        self.logger.warning(f"{reason} - העבודה {job_id} חוזרת לתור (ניסיון {job['attempts'] + 1})")
+        job.update(status=QUEUED, owner=os.getpid())
+        self.store.save(job)
+        return True
@@ -0,0 +1,201 @@
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pdfplumber
+import PyPDF2
+
+# מספר העמודים בכל משימה במאגר התהליכים - כל משימה פותחת את הקובץ מחדש, ולכן לא עמוד בודד
+PDF_CHUNK_PAGES = 16
+
+# קובץ עם פחות עמודים מזה מפורק בתהליך הנוכחי - הפעלת המאגר יקרה מהחיסכון
+PDF_PARALLEL_MIN_PAGES = 32
+
+# עמוד עם פחות תווים (בלי רווחים) מזה לא יכול להכיל שם וטלפון או מייל, ומדולג
+PDF_MIN_TEXT_CHARS = 8
+
+# מספר קווי המסגרת שממנו עמוד נשלח לזיהוי טבלאות: מלבן בודד (ארבעה קווים) כבר יוצר תא
+PDF_TABLE_MIN_EDGES = 4
+
+# נתיבי המיון של עמוד, מהזול ליקר: דילוג, טקסט של PyPDF2, טקסט של pdfplumber, וזיהוי טבלאות מלא
+TRIAGE_PATHS = ('skip', 'pypdf2', 'text', 'tables')
+
+# פקודות הציור בזרם התוכן: מלבן (re) שהוא ארבעה קווים, וקטע קו או עקומה (l, c, v, y) שהם קו אחד
+_DRAW_OP = re.compile(rb'(?:^|(?<=[\s\])>]))(re|[lcvy])(?=[\s/\[(<%]|$)')
+# פקודות הצגת טקסט בזרם התוכן (Tj, TJ, ' ו-") - בלוק טקסט ריק (BT ET) לא נחשב
+_TEXT_OP = re.compile(rb'(?<=[\s\])>])(Tj|TJ|\'|")(?=[\s/\[(<%]|$)')
+# ספרה (טלפון) או @ (מייל) - בלי אחד מהם אין בעמוד איש קשר
+_CONTACT_HINT = re.compile(r'[0-9@]')
+# עברית וערבית: PyPDF2 מחזיר אותן בסדר חזותי (הפוך), ולכן הטקסט שלהן נלקח מ-pdfplumber
+_RTL = re.compile('[\u0590-\u08ff\ufb1d-\ufdff\ufe70-\ufeff]')
+
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[float, float, float, float]
+
+
+def _outside(bboxes: Sequence[BBox]) -> Callable[[Dict], bool]:
+    """מסנן לאובייקטים של העמוד שמרכזם מחוץ לכל אזורי הטבלאות"""
+    def test(obj: Dict) -> bool:
+        if 'x0' not in obj:
+            return True
+        x = (obj['x0'] + obj['x1']) / 2
+        y = (obj['top'] + obj['bottom']) / 2
+        return not any(x0 <= x <= x1 and top <= y <= bottom for x0, top, x1, bottom in bboxes)
+    return test
+
+
+def parse_page(page, page_num: int) -> Dict:
+    """מפרק עמוד אחד בניתוח פריסה אחד: הטבלאות מזוהות פעם אחת ותאיהן נלקחים מאותו זיהוי,
+    והטקסט נבנה רק מהתווים שמחוץ לאזורי הטבלאות - כך תוכן טבלה לא עובר גם בנתיב הטקסט.
+    עמוד שנכשל באמצע שומר את מה שכבר חולץ ממנו"""
+    entry = {'text': None, 'tables': []}
+    text_page = page
+    try:
+        tables = page.find_tables()
+        entry['tables'] = [table.extract() for table in tables]
+        if tables:
+            text_page = page.filter(_outside([table.bbox for table in tables]))
+    except Exception as e:
+        logger.error(f"שגיאה בזיהוי טבלאות בעמוד {page_num}: {str(e)}")
+        entry['tables'] = []
+    try:
+        entry['text'] = text_page.extract_text()
+    except Exception as e:
+        logger.error(f"שגיאה בחילוץ טקסט בעמוד {page_num}: {str(e)}")
+    return entry
+
+
+def _scan_contents(page) -> Optional[Tuple[int, bool]]:
+    """סורק את זרם התוכן של עמוד PyPDF2 בלי לפענח את האובייקטים שלו: מחזיר (מספר קווי המסגרת,
+    האם העמוד מציג טקסט), או None כשאי אפשר לדעת בזול - עמוד שמצייר דרך Form XObject"""
+    xobjects = page.get('/Resources', {}).get('/XObject', {})
+    if any(xobject.get_object().get('/Subtype') == '/Form' for xobject in xobjects.values()):
+        return None
+    contents = page.get_contents()
+    if contents is None:
+        return 0, False
+    data = contents.get_data()
+    return sum(4 if op == b're' else 1 for op in _DRAW_OP.findall(data)), bool(_TEXT_OP.search(data))
+
+
+def triage_page(page) -> Tuple[str, Optional[str], Dict]:
+    """ממיין עמוד PyPDF2 לפי סימנים זולים: מספר קווי המסגרת בזרם התוכן, ואם אין מספיק לטבלה -
+    הטקסט ש-PyPDF2 קורא ישירות מהזרם (צפיפות, ספרות ו-@). מחזיר (נתיב, טקסט לנתיב pypdf2 או None,
+    הסימנים). בכל ספק הנתיב הוא tables"""
+    try:
+        scanned = _scan_contents(page)
+        if scanned is None:
+            return 'tables', None, {}
+        edges, shows_text = scanned
+        if edges >= PDF_TABLE_MIN_EDGES:
+            return 'tables', None, {'edges': edges}
+        text = page.extract_text() or ''
+    except Exception as e:
+        logger.debug(f"מיון העמוד נכשל, עובר לזיהוי טבלאות: {str(e)}")
+        return 'tables', None, {}
+    chars = sum(1 for c in text if not c.isspace())
+    signals = {'edges': edges, 'chars': chars}
+    # עמוד שמציג טקסט ש-PyPDF2 לא הצליח לקרוא לא ממוין - הקריאה של pdfplumber תכריע
+    if chars == 0 and shows_text:
+        return 'tables', None, signals
+    if chars < PDF_MIN_TEXT_CHARS or not _CONTACT_HINT.search(text):
+        return 'skip', None, signals
+    if _RTL.search(text):
+        return 'text', None, signals
+    return 'pypdf2', text, signals
+
+
+def parse_pages(pdf, reader=None, first_page: int = 1) -> List[Dict]:
+    """מפרק את כל העמודים של PDF פתוח; first_page הוא מספר העמוד הראשון בו.
+    כשמועבר reader (PyPDF2 על אותו קובץ) כל עמוד ממוין קודם ב-triage_page, ורק עמודים
+    שעשויים להכיל טבלה עוברים את זיהוי הטבלאות. לכל עמוד נרשמים הנתיב והזמן"""
+    pages = []
+    for page_num, page in enumerate(pdf.pages, first_page):
+        logger.debug(f"מעבד עמוד {page_num}")
+        start = time.perf_counter()
+        path, text, signals = triage_page(reader.pages[page_num - 1]) if reader is not None else ('tables', None, {})
+        if path == 'tables':
+            entry = parse_page(page, page_num)
+        elif path == 'text':
+            entry = {'text': None, 'tables': []}
+            try:
+                entry['text'] = page.extract_text()
+            except Exception as e:
+                logger.error(f"שגיאה בחילוץ טקסט בעמוד {page_num}: {str(e)}")
+        else:
+            entry = {'text': text, 'tables': []}
+        # העמוד שומר את האובייקטים שפוענחו - משחררים אותם לפני העמוד הבא
+        page.flush_cache()
+        entry['triage'] = dict(signals, path=path, seconds=time.perf_counter() - start)
+        logger.debug(f"עמוד {page_num}: {path} {signals}")
+        pages.append(entry)
+    return pages
+
+
+def triage_summary(pages: List[Dict]) -> Dict[str, Dict]:
+    """מספר העמודים והזמן הכולל בכל נתיב מיון"""
+    summary = {path: {'pages': 0, 'seconds': 0.0} for path in TRIAGE_PATHS}
+    for page in pages:
+        triage = page.get('triage', {})
+        if triage.get('path') in summary:
+            summary[triage['path']]['pages'] += 1
+            summary[triage['path']]['seconds'] += triage['seconds']
+    return summary
+
+
+def _open_reader(file_path: str):
+    """פותח את הקובץ ב-PyPDF2 לצורך המיון; None (בלי מיון) אם נכשל"""
+    try:
+        return PyPDF2.PdfReader(file_path)
+    except Exception as e:
+        logger.warning(f"לא ניתן למיין את עמודי {file_path}, כל העמודים יעברו זיהוי טבלאות: {str(e)}")
+        return None
+
+
+def _parse_chunk(file_path: str, first_page: int, last_page: int, triage: bool = True) -> List[Dict]:
+    """רץ בתהליך עבודה: פותח את הקובץ ומפרק את העמודים first_page..last_page (כולל, מ-1)"""
+    reader = _open_reader(file_path) if triage else None
+    with pdfplumber.open(file_path, pages=range(first_page, last_page + 1)) as pdf:
+        return parse_pages(pdf, reader, first_page)
+
+
+class PdfPageEngine:
+    """מפרק PDF לטקסט וטבלאות של כל עמוד. בקובץ ארוך העמודים מחולקים לקבוצות רצופות
+    ומפורקים במאגר תהליכים; התוצאות מאוחדות לפי סדר העמודים, כך שהפלט זהה לפירוק רציף.
+    triage=False מעביר כל עמוד בזיהוי הטבלאות המלא, בלי המיון הזול"""
+
+    def __init__(self, workers: Optional[int] = 1, chunk_pages: int = PDF_CHUNK_PAGES,
+                 min_parallel_pages: int = PDF_PARALLEL_MIN_PAGES, triage: bool = True):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_pages = chunk_pages
+        self.min_parallel_pages = min_parallel_pages
+        self.triage = triage
+
+    def parse(self, file_path: str) -> Dict:
+        parsed = self._parse(file_path)
+        if self.triage:
+            summary = triage_summary(parsed['pages'])
+            logger.info(f"מיון עמודי {file_path}: " + ", ".join(
+                f"{path} {stats['pages']} ({stats['seconds']:.2f} שנ')" for path, stats in summary.items()))
+        return parsed
+
+    def _parse(self, file_path: str) -> Dict:
+        with pdfplumber.open(file_path) as pdf:
+            page_count = len(pdf.pages)
+            if self.workers <= 1 or page_count < self.min_parallel_pages:
+                reader = _open_reader(file_path) if self.triage else None
+                return {'pages': parse_pages(pdf, reader)}
+
+        chunks = [(first, min(first + self.chunk_pages - 1, page_count))
+                  for first in range(1, page_count + 1, self.chunk_pages)]
+        workers = min(self.workers, len(chunks))
+        logger.info(f"מפרק {page_count} עמודים של {file_path} ב-{workers} תהליכים")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_parse_chunk, [file_path] * len(chunks),
+                               [first for first, _ in chunks], [last for _, last in chunks],
+                               [self.triage] * len(chunks))
+            return {'pages': [page for chunk in results for page in chunk]}
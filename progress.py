@@ -0,0 +1,92 @@
+import json
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+# מרווח מינימלי בשניות בין שתי כתיבות של קובץ ההתקדמות
+FLUSH_INTERVAL = 0.5
+
+
+class ProgressReporter:
+    """מצב ההתקדמות של עבודת חילוץ: קובץ, גליון או עמוד נוכחי, אנשי קשר שנמצאו וזמן משוער לסיום.
+    העדכונים רק משנים שדות בזיכרון; הכתיבה לקובץ מוגבלת לפעם בחצי שנייה, כך שהחילוץ לא מואט"""
+
+    def __init__(self, path: Optional[str] = None, files_total: int = 0, interval: float = FLUSH_INTERVAL):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.interval = interval
+        self.started = time.time()
+        self.last_flush = 0.0
+        # אנשי הקשר שנמצאו בקבצים שכבר הסתיימו
+        self.contacts_before_file = 0
+        self.state: Dict = {
+            'seq': 0,
+            'files_total': files_total,
+            'files_done': 0,
+            'file': None,
+            'unit': None,
+            'unit_name': None,
+            'units_done': 0,
+            'units_total': 0,
+            'contacts': 0,
+            'elapsed': 0.0,
+            'eta': None,
+        }
+
+    def start_file(self, name: str) -> None:
+        self.state.update(file=name, unit=None, unit_name=None, units_done=0, units_total=0)
+        self.flush(force=True)
+
+    def step(self, unit: str, name: str, done: int, total: int, contacts: int = 0) -> None:
+        """התחלת יחידה בתוך הקובץ - unit הוא 'sheet' או 'page', contacts הם אנשי הקשר שנמצאו בקובץ עד כה"""
+        self.state.update(unit=unit, unit_name=name, units_done=done, units_total=total,
+                          contacts=self.contacts_before_file + contacts)
+        self.flush()
+
+    def finish_file(self, contacts: int) -> None:
+        self.contacts_before_file += contacts
+        self.state['files_done'] += 1
+        self.state.update(units_done=0, units_total=0, contacts=self.contacts_before_file)
+        self.flush(force=True)
+
+    def fraction(self) -> float:
+        """החלק שהושלם מכל העבודה, לפי קבצים ולפי היחידה הנוכחית בקובץ"""
+        state = self.state
+        if not state['files_total']:
+            return 0.0
+        current = state['units_done'] / state['units_total'] if state['units_total'] else 0.0
+        done = min(state['files_done'] + current, state['files_total'])
+        return done / state['files_total']
+
+    def flush(self, force: bool = False) -> None:
+        """כותב את המצב לקובץ, אם עבר מספיק זמן מהכתיבה הקודמת"""
+        now = time.time()
+        if not force and now - self.last_flush < self.interval:
+            return
+        self.last_flush = now
+
+        state = self.state
+        state['seq'] += 1
+        state['elapsed'] = now - self.started
+        fraction = self.fraction()
+        state['eta'] = state['elapsed'] * (1 - fraction) / fraction if fraction else None
+        if self.path is None:
+            return
+        try:
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(state, file, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            # דיווח התקדמות שנכשל לא מפיל את החילוץ
+            self.logger.warning(f"שגיאה בכתיבת ההתקדמות {self.path}: {str(e)}")
+
+
+def read_progress(path: str) -> Optional[Dict]:
+    """קורא את מצב ההתקדמות האחרון שנכתב, או None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
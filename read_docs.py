@@ -4,11 +4,11 @@ import subprocess
 from pathlib import Path
 import pandas as pd
 import re
-from openpyxl import load_workbook
-from openpyxl.utils import get_column_letter
+import sys
 import docx2txt
 import tempfile
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from dedup_engine import NearDuplicateEngine
+from exporters import open_writer
 
 def clean_name(name):
     if not name:
@@ -386,101 +386,32 @@ def read_doc(file_path):
         print(f"Error reading DOC: {str(e)}")
         return []
 
-def format_excel(filename):
-    # טעינת קובץ ה-Excel
-    wb = load_workbook(filename)
-    ws = wb.active
-    
-    # שינוי סדר העמודות והסרת עמודת הערות
-    column_order = ['שם', 'טלפון', 'מייל', 'כתובת']
-    current_columns = []
-    for cell in ws[1]:
-        current_columns.append(cell.value)
-    
-    # יצירת מיפוי עמודות
-    column_mapping = {col: idx + 1 for idx, col in enumerate(current_columns)}
-    
-    # הוספת עמודות חדשות בסדר הרצוי
-    for col_idx, col_name in enumerate(column_order, 1):
-        if col_name not in current_columns:
-            ws.insert_cols(col_idx)
-            ws.cell(row=1, column=col_idx, value=col_name)
-    
-    # העתקת נתונים לסדר החדש
-    data = []
-    for row in ws.iter_rows(min_row=2):
-        row_data = {}
-        for cell in row:
-            col_name = ws.cell(row=1, column=cell.column).value
-            if col_name in column_order or col_name == 'מקור':  # כולל גם את עמודת המקור
-                if col_name == 'מקור':
-                    row_data['הערות'] = cell.value  # העברת תוכן המקור להערות
-                else:
-                    row_data[col_name] = cell.value
-        data.append(row_data)
-    
-    # מחיקת כל השורות מלבד הכותרת
-    ws.delete_rows(2, ws.max_row)
-    
-    # הוספת הנתונים בסדר החדש
-    for row_idx, row_data in enumerate(data, 2):
-        for col_idx, col_name in enumerate(column_order, 1):
-            ws.cell(row=row_idx, column=col_idx, value=row_data.get(col_name, ''))
-    
-    # עיצוב כותרות העמודות
-    header_font = Font(name='Arial', bold=True, size=12)
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    
-    for col in range(1, ws.max_column + 1):
-        cell = ws.cell(row=1, column=col)
-        cell.font = Font(name='Arial', bold=True, size=12, color="FFFFFF")  # צבע לבן לטקסט
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-    
-    # עיצוב תאי הטבלה
-    data_font = Font(name='Arial', size=11)
-    data_alignment = Alignment(horizontal="right", vertical="center", wrap_text=True)  # הוספת wrap_text=True
-    alternate_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-    
-    for row in range(2, ws.max_row + 1):
-        for col in range(1, ws.max_column + 1):
-            cell = ws.cell(row=row, column=col)
-            cell.font = data_font
-            cell.alignment = data_alignment
-            # צביעת שורות לסירוגין
-            if row % 2 == 0:
-                cell.fill = alternate_fill
-    
-    # התאמת רוחב העמודות
-    column_widths = {
-        'שם': 25,
-        'טלפון': 15,
-        'מייל': 30,
-        'כתובת': 20
-    }
-    
-    for col_idx, col_name in enumerate(column_order, 1):
-        column_letter = get_column_letter(col_idx)
-        ws.column_dimensions[column_letter].width = column_widths[col_name]
-    
-    # הוספת מסגרת לטבלה
-    thin_border = Border(
-        left=Side(style='thin', color="BFBFBF"),
-        right=Side(style='thin', color="BFBFBF"),
-        top=Side(style='thin', color="BFBFBF"),
-        bottom=Side(style='thin', color="BFBFBF")
-    )
-    
-    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-        for cell in row:
-            cell.border = thin_border
-    
-    # הקפאת שורת הכותרת
-    ws.freeze_panes = 'A2'
-    
-    # שמירת השינויים
-    wb.save(filename)
+# קובץ התוצאות: סדר העמודות, רוחבן וסגנונות הכותרת והשורות (שורות זוגיות צבועות באפור)
+RESULT_COLUMNS = ['שם', 'טלפון', 'מייל', 'כתובת']
+RESULT_COLUMN_WIDTHS = [25, 15, 30, 20]
+RESULT_HEADER_FORMAT = {
+    'font_name': 'Arial', 'font_size': 12, 'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#4472C4',
+    'align': 'center', 'valign': 'vcenter', 'text_wrap': True, 'border': 1, 'border_color': '#BFBFBF'
+}
+RESULT_CELL_FORMAT = {
+    'font_name': 'Arial', 'font_size': 11, 'align': 'right', 'valign': 'vcenter', 'text_wrap': True,
+    'border': 1, 'border_color': '#BFBFBF'
+}
+RESULT_ALTERNATE_FORMAT = dict(RESULT_CELL_FORMAT, bg_color='#F2F2F2')
+
+def write_results(df, filename, export_format='xlsx'):
+    """כותב את קובץ התוצאות במעבר אחד: השורות נכתבות בסדר העמודות הסופי, וב-xlsx גם עם הסגנון שלהן"""
+    options = {}
+    if export_format == 'xlsx':
+        options = dict(sheet_name='Sheet1', header_format=RESULT_HEADER_FORMAT, cell_format=RESULT_CELL_FORMAT,
+                       alternate_format=RESULT_ALTERNATE_FORMAT, column_widths=RESULT_COLUMN_WIDTHS,
+                       freeze_header=True)
+    with open_writer(export_format, filename, [(column, column) for column in RESULT_COLUMNS], **options) as writer:
+        # מעבר על העמודות עצמן, בלי להעתיק את הטבלה
+        for row in zip(*(df[column] for column in RESULT_COLUMNS)):
+            # תא ריק (NaN) נכתב כתא ריק מעוצב
+            writer.write_row([None if pd.isna(value) or value == '' else value for value in row])
+    return writer.rows
 
 def compare_with_original(df, examples_dir):
     print("\nComparing with original files:")
@@ -541,7 +472,7 @@ def get_context(text, search_term, context_size=50):
         return f"...{context}..."
     return ""
 
-def main():
+def main(export_format='xlsx'):
     examples_dir = "../מתווכים"
     all_contacts = []
     
@@ -581,18 +512,31 @@ def main():
         'הערות': lambda x: ';'.join(set(x.fillna('')))
     })
     
+    # איחוד רשומות שנבדלות רק בכתיב השם (תארים, ראשי תיבות, סדר מילים) - רק בתוך בלוקים
+    engine = NearDuplicateEngine()
+    records = [(name, phones.split(';') if phones else [], emails.split(';') if emails else [])
+               for name, phones, emails in zip(df['שם'], df['טלפון'], df['מייל'])]
+    group_of = {index: group_id for group_id, group in enumerate(engine.groups(records)) for index in group}
+    df['קבוצה'] = [group_of[index] for index in range(len(df))]
+    df = df.groupby('קבוצה', as_index=False).agg({
+        'שם': lambda x: max(x, key=len),
+        'טלפון': lambda x: ';'.join(filter(None, set(x.str.split(';').explode()))),
+        'מייל': lambda x: ';'.join(filter(None, set(x.str.split(';').explode()))),
+        'כתובת': lambda x: ';'.join(filter(None, set(x.str.split(';').explode()))),
+        'הערות': lambda x: ';'.join(filter(None, set(x.str.split(';').explode())))
+    })
+    print(f"\nNear duplicates: {engine.stats['pairs_compared']} pairs compared, {engine.stats['matches']} matched "
+          f"({engine.stats['pairs_per_second']:.0f} pairs/s)")
+    
     # מיון לפי שם
     df = df.sort_values('שם')
     
     # סידור סדר העמודות
-    df = df[['שם', 'טלפון', 'מייל', 'כתובת']]
-    
-    # שמירה לקובץ Excel
-    output_file = 'contact_results.xlsx'
-    df.to_excel(output_file, index=False)
+    df = df[RESULT_COLUMNS]
     
-    # עיצוב הקובץ
-    format_excel(output_file)
+    # שמירה לקובץ התוצאות - Excel מעוצב, או csv / jsonl / parquet לפי הפרמטר
+    output_file = f'contact_results.{export_format}'
+    write_results(df, output_file, export_format)
     
     print(f"\nSaved {len(df)} contacts to {output_file}")
     
@@ -600,4 +544,4 @@ def main():
     compare_with_original(df, examples_dir)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main(sys.argv[1] if len(sys.argv) > 1 else 'xlsx') 
\ No newline at end of file
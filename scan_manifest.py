@@ -0,0 +1,90 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Iterable, Optional
+
+# גודל הקטע שנקרא מהקובץ בכל פעם בחישוב הגיבוב
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+MANIFEST_VERSION = 1
+
+
+def file_digest(file_path: str) -> str:
+    """מחשב גיבוב SHA-256 של תוכן הקובץ בקריאה בקטעים"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ScanManifest:
+    """רשימת הקבצים שכבר חולצו: נתיב, גודל, זמן שינוי וגיבוב תוכן לכל קובץ"""
+
+    def __init__(self, manifest_path: str):
+        self.logger = logging.getLogger(__name__)
+        self.manifest_path = manifest_path
+        self.files: Dict[str, Dict] = {}
+        self.load()
+
+    def load(self) -> None:
+        """טוען את הרשימה מהדיסק, רשימה חסרה או פגומה מתחילה ריקה"""
+        if not os.path.exists(self.manifest_path):
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('version') == MANIFEST_VERSION:
+                self.files = data.get('files', {})
+            else:
+                self.logger.warning(f"גרסת רשימת הקבצים {self.manifest_path} אינה נתמכת, מתחיל מחדש")
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"שגיאה בטעינת רשימת הקבצים {self.manifest_path}: {str(e)}")
+
+    def save(self) -> None:
+        """שומר את הרשימה לדיסק דרך קובץ זמני, כך שקריסה לא משאירה רשימה חצויה"""
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.files}, file, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.manifest_path)
+
+    def is_unchanged(self, file_path: str) -> bool:
+        """בודק אם הקובץ זהה לזה שנרשם.
+        גודל וזמן שינוי זהים מספיקים; אם רק זמן השינוי השתנה, מכריע גיבוב התוכן"""
+        entry = self.files.get(os.path.abspath(file_path))
+        if entry is None:
+            return False
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        if stat.st_size != entry['size']:
+            return False
+        if stat.st_mtime_ns == entry['mtime']:
+            return True
+
+        # הקובץ הועתק או נשמר מחדש בלי שינוי תוכן - מעדכנים את זמן השינוי בלבד
+        if file_digest(file_path) == entry['hash']:
+            entry['mtime'] = stat.st_mtime_ns
+            return True
+        return False
+
+    def record(self, file_path: str, digest: Optional[str] = None) -> None:
+        """רושם את המצב הנוכחי של קובץ שחולץ בהצלחה"""
+        stat = os.stat(file_path)
+        self.files[os.path.abspath(file_path)] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'hash': digest or file_digest(file_path),
+        }
+
+    def prune(self, directory_path: str, file_paths: Iterable[str]) -> int:
+        """מסיר מהרשימה קבצים מהתיקייה שכבר לא קיימים בה, ומחזיר כמה הוסרו"""
+        prefix = os.path.join(os.path.abspath(directory_path), '')
+        keep = {os.path.abspath(file_path) for file_path in file_paths}
+        removed = [path for path in self.files if path.startswith(prefix) and path not in keep]
+        for path in removed:
+            del self.files[path]
+        return len(removed)
@@ -0,0 +1,172 @@
+// העלאת קבצים, מעקב אחר עבודת החילוץ בזרם אירועים והצגת התוצאה
+
+const dropZone = document.getElementById('dropZone');
+const fileInput = document.getElementById('fileInput');
+const selectedFiles = document.querySelector('.selected-files');
+const extractBtn = document.getElementById('extractBtn');
+const loadingSpinner = document.querySelector('.loading-spinner');
+const jobProgress = document.getElementById('jobProgress');
+const previewTable = document.querySelector('.preview-table');
+const errorAlert = document.getElementById('errorAlert');
+
+const UNIT_NAMES = { sheet: 'גליון', page: 'עמוד' };
+
+let files = [];
+let downloadUrl = null;
+
+function fileIcon(name) {
+    const extension = name.split('.').pop().toLowerCase();
+    if (extension === 'pdf') return 'bi-file-earmark-pdf text-danger';
+    if (extension === 'doc' || extension === 'docx') return 'bi-file-earmark-word text-primary';
+    return 'bi-file-earmark-excel text-success';
+}
+
+function renderFiles() {
+    selectedFiles.innerHTML = '';
+    const list = document.createElement('ul');
+    list.className = 'list-group';
+    files.forEach((file, index) => {
+        const item = document.createElement('li');
+        item.className = 'list-group-item';
+        const label = document.createElement('span');
+        label.innerHTML = `<i class="bi ${fileIcon(file.name)} file-type-icon"></i>`;
+        label.appendChild(document.createTextNode(file.name));
+        const remove = document.createElement('i');
+        remove.className = 'bi bi-x-circle remove-file';
+        remove.addEventListener('click', () => {
+            files.splice(index, 1);
+            renderFiles();
+        });
+        item.append(label, remove);
+        list.appendChild(item);
+    });
+    selectedFiles.appendChild(list);
+    extractBtn.disabled = files.length === 0;
+}
+
+function addFiles(fileList) {
+    files = files.concat(Array.from(fileList));
+    renderFiles();
+}
+
+function showError(message) {
+    errorAlert.textContent = message;
+    errorAlert.style.display = 'block';
+}
+
+function formatSeconds(seconds) {
+    if (seconds === null || seconds === undefined) return '-';
+    const total = Math.round(seconds);
+    const minutes = Math.floor(total / 60);
+    return minutes ? `${minutes}:${String(total % 60).padStart(2, '0')} דק'` : `${total} שנ'`;
+}
+
+function renderProgress(progress) {
+    if (progress.status === 'queued') {
+        document.getElementById('progressFile').textContent = 'ממתין בתור...';
+        return;
+    }
+    const filesTotal = progress.files_total || 0;
+    const current = progress.units_total ? progress.units_done / progress.units_total : 0;
+    const percent = filesTotal ? Math.min(100, Math.round(100 * (progress.files_done + current) / filesTotal)) : 0;
+
+    const bar = document.getElementById('progressBar');
+    bar.style.width = `${percent}%`;
+    bar.textContent = `${percent}%`;
+    document.getElementById('progressFile').textContent = progress.file ? `מעבד: ${progress.file}` : 'מתחיל...';
+    document.getElementById('progressUnit').textContent = progress.unit
+        ? `${UNIT_NAMES[progress.unit] || progress.unit} ${progress.unit_name} (${progress.units_done + 1}/${progress.units_total})`
+        : '';
+    document.getElementById('progressContacts').textContent = (progress.contacts || 0).toLocaleString();
+    document.getElementById('progressFiles').textContent = `${progress.files_done || 0}/${filesTotal}`;
+    document.getElementById('progressEta').textContent = formatSeconds(progress.eta);
+}
+
+function renderResult(result) {
+    if (!result.success) {
+        showError(result.error);
+        return;
+    }
+    document.getElementById('totalContacts').textContent = result.total;
+    const body = document.getElementById('previewTableBody');
+    body.innerHTML = '';
+    result.contacts.forEach((contact) => {
+        const row = document.createElement('tr');
+        ['name', 'phone', 'email', 'address', 'source'].forEach((field) => {
+            const cell = document.createElement('td');
+            cell.textContent = contact[field] || '';
+            row.appendChild(cell);
+        });
+        body.appendChild(row);
+    });
+    downloadUrl = result.download_url;
+    previewTable.style.display = 'block';
+}
+
+function finish() {
+    jobProgress.style.display = 'none';
+    extractBtn.disabled = files.length === 0;
+}
+
+function watchJob(jobId) {
+    // הדפדפן מתחבר מחדש לבד אם החיבור נקטע; השרת שולח את המצב העדכני בכל חיבור
+    const events = new EventSource(`/jobs/${jobId}/events`);
+    events.addEventListener('progress', (event) => renderProgress(JSON.parse(event.data)));
+    events.addEventListener('done', (event) => {
+        events.close();
+        finish();
+        renderResult(JSON.parse(event.data));
+    });
+    events.addEventListener('failed', (event) => {
+        events.close();
+        finish();
+        showError(JSON.parse(event.data).error || 'העבודה נכשלה');
+    });
+}
+
+async function extract() {
+    errorAlert.style.display = 'none';
+    previewTable.style.display = 'none';
+    extractBtn.disabled = true;
+    loadingSpinner.style.display = 'block';
+
+    const formData = new FormData();
+    files.forEach((file) => formData.append('files', file));
+    formData.append('format', document.getElementById('exportFormat').value);
+    try {
+        const response = await fetch('/extract', { method: 'POST', body: formData });
+        const data = await response.json();
+        loadingSpinner.style.display = 'none';
+        if (!data.success) {
+            finish();
+            showError(data.error);
+            return;
+        }
+        renderProgress({ status: 'queued' });
+        jobProgress.style.display = 'block';
+        watchJob(data.job_id);
+    } catch (error) {
+        loadingSpinner.style.display = 'none';
+        finish();
+        showError(`שגיאה בשליחת הקבצים: ${error.message}`);
+    }
+}
+
+dropZone.addEventListener('dragover', (event) => {
+    event.preventDefault();
+    dropZone.classList.add('dragover');
+});
+dropZone.addEventListener('dragleave', () => dropZone.classList.remove('dragover'));
+dropZone.addEventListener('drop', (event) => {
+    event.preventDefault();
+    dropZone.classList.remove('dragover');
+    addFiles(event.dataTransfer.files);
+});
+fileInput.addEventListener('change', () => {
+    addFiles(fileInput.files);
+    fileInput.value = '';
+});
+extractBtn.addEventListener('click', extract);
+document.getElementById('downloadBtn').addEventListener('click', () => {
+    if (downloadUrl) window.location.href = downloadUrl;
+});
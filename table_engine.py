@@ -0,0 +1,72 @@
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Sequence
+
+import pandas as pd
+
+from text_engine import (
+    EMAIL_CANDIDATE_PATTERN, NORMALIZE_TABLE, PHONE_SCANNER_PATTERN, PHONE_SEPARATORS_TABLE, EmailEngine, PhoneScanner,
+)
+
+
+class ColumnarEngine:
+    """מחלץ טלפונים ומיילים מעמודה שלמה של טבלה במקום תא אחר תא"""
+
+    def __init__(self, phone_scanner: PhoneScanner, email_engine: EmailEngine, table=NORMALIZE_TABLE):
+        self.phone_scanner = phone_scanner
+        self.email_engine = email_engine
+        self.table = table
+
+    def normalize_column(self, cells: Sequence[str]) -> pd.Series:
+        """מנרמל עמודה שלמה - אותה תוצאה כמו TextNormalizer לכל תא"""
+        series = cells if isinstance(cells, pd.Series) else pd.Series(cells, dtype=object)
+        return series.fillna('').str.translate(self.table).str.split().str.join(' ')
+
+    def phone_column(self, cells: Sequence[str]) -> List[List[str]]:
+        """מחזיר לכל תא רשימה ממוינת של טלפונים, כמו PhoneScanner.scan על התא המנורמל.
+        תא שכולו מספר אחד מנורמל על כל העמודה בבת אחת, ורק שאר התאים נסרקים אחד אחד"""
+        normalized = self.normalize_column(cells)
+        results: List[List[str]] = [[] for _ in range(len(normalized))]
+        if not len(normalized):
+            return results
+
+        # תא שמתאים כולו לתבנית הסורק מכיל בדיוק מספר אחד (כל החלופות מסתיימות בספרה)
+        single = normalized.str.fullmatch(PHONE_SCANNER_PATTERN).fillna(False).astype(bool)
+        digits = normalized[single].str.translate(PHONE_SEPARATORS_TABLE)
+
+        # קידומת מקומית (0) מוחלפת בספרה אחת, בינלאומית (972) בשלוש
+        local = digits.str.startswith('0')
+        phones = '+972' + digits.str.slice(3).where(~local, digits.str.slice(1))
+        for pos, phone in zip(phones.index, phones):
+            results[pos] = [phone]
+
+        # תאים שלא נפתרו: כמה מספרים בתא, טקסט חופשי או מספר לא תקין
+        unresolved = normalized[normalized.astype(bool) & ~single]
+        for pos, text in zip(unresolved.index, unresolved):
+            results[pos] = self.phone_scanner.scan(text)
+
+        return results
+
+    def email_column(self, cells: Sequence[str]) -> List[List[str]]:
+        """מחזיר לכל תא רשימה ממוינת של כתובות מייל, בסריקה אחת על כל העמודה"""
+        series = pd.Series(cells, dtype=object).fillna('')
+        results: List[List[str]] = [[] for _ in range(len(series))]
+
+        # רק תאים עם @ יכולים להכיל כתובת
+        candidates = self.normalize_column(series[series.str.contains('@', regex=False)])
+        if candidates.empty:
+            return results
+
+        # התאים מחוברים בשורה חדשה - תבנית המועמדים לא חוצה אותה, ולכן אין התאמות בין תאים
+        positions = candidates.index.tolist()
+        ends = list(accumulate(len(text) + 1 for text in candidates))
+        found = {}
+        is_valid = self.email_engine.is_valid
+        for match in EMAIL_CANDIDATE_PATTERN.finditer('\n'.join(candidates)):
+            email = match.group().lower()
+            if is_valid(email):
+                found.setdefault(positions[bisect_right(ends, match.start())], set()).add(email)
+
+        for pos, emails in found.items():
+            results[pos] = sorted(emails)
+        return results
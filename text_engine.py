@@ -0,0 +1,272 @@
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+# טבלת המרה אחת לכל החלפות התווים של _clean_text
+NORMALIZE_TABLE = str.maketrans({
+    # גרשיים שונים
+    '\'': '"', '״': '"', '׳': '"',
+    # מקפים שונים
+    '–': '-', '—': '-',
+    # פסיקים, נקודות ונקודותיים
+    '،': ',', '٫': '.', '׃': ':',
+    # סוגריים
+    ')': '(', ']': '[', '}': '{',
+})
+
+# גודל מקסימלי לזיכרון הנרמול לפני ניקוי, למקרה שלא קראו ל-reset
+NORMALIZE_MEMO_SIZE = 100000
+
+
+class TextNormalizer:
+    """מנרמל טקסט בטבלת translate אחת, עם זיכרון לכל מסמך"""
+
+    def __init__(self, table=NORMALIZE_TABLE, memo_size: int = NORMALIZE_MEMO_SIZE):
+        self.table = table
+        self.memo_size = memo_size
+        self.memo: Dict[str, str] = {}
+
+    def reset(self) -> None:
+        """מנקה את הזיכרון - נקרא בתחילת כל מסמך"""
+        self.memo.clear()
+
+    def normalize(self, text: str) -> str:
+        """מחזיר את הטקסט המנורמל, כל מחרוזת שונה מחושבת פעם אחת"""
+        cached = self.memo.get(text)
+        if cached is not None:
+            return cached
+
+        # החלפת תווים ואיחוד רווחים (כולל הסרה בתחילת ובסוף הטקסט)
+        normalized = ' '.join(text.translate(self.table).split())
+
+        if len(self.memo) >= self.memo_size:
+            self.memo.clear()
+        self.memo[text] = normalized
+        return normalized
+
+# תבנית אחת לכל פורמטי הטלפון הישראליים - נסרקת פעם אחת משמאל לימין
+# הקבוצה intl: +972 / 972 (עם או בלי מקפים), הקבוצה local: מספר שמתחיל ב-0
+# בסוגריים מתקבל גם '(' בסוף הקידומת כי _clean_text ממיר ')' ל-'('
+PHONE_SCANNER_PATTERN = re.compile(
+    r'(?P<intl>\+972-?5\d-?\d{7}'           # פורמט בינלאומי נייד
+    r'|\+?972[23489]\d{8}'                   # פורמט בינלאומי קווי, עם או בלי פלוס
+    r'|9725\d{8})'                           # פורמט בינלאומי נייד ללא פלוס
+    r'|(?P<local>0(?:[23489]|[57]\d)'        # קווי / נייד / מיוחד
+    r'(?:-\d{7}'                             # עם מקף
+    r'|\(\d{3}[()]\d{4}'                     # עם סוגריים
+    r'|\s*\d{3}\s*\d{4}))'                   # עם רווחים או ללא מפריד
+)
+
+# טבלת קידומות: כמה ספרות להסיר מתחילת המספר ומה לשים במקומן
+PHONE_PREFIX_TABLE: Dict[str, Tuple[int, str]] = {
+    'intl': (3, '+972'),
+    'local': (1, '+972'),
+}
+
+# תווים שנמחקים מהמספר לפני הנרמול
+PHONE_SEPARATORS_TABLE = str.maketrans('', '', ' -()+\t')
+
+
+class PhoneScanner:
+    """סורק מספרי טלפון ישראליים במעבר יחיד על הטקסט"""
+
+    def __init__(self, pattern=PHONE_SCANNER_PATTERN, prefix_table=PHONE_PREFIX_TABLE):
+        self.pattern = pattern
+        self.prefix_table = prefix_table
+
+    def scan(self, text: str) -> List[str]:
+        """מחזיר רשימה ממוינת של מספרים מנורמלים בפורמט +972"""
+        if not text:
+            return []
+
+        phones = set()
+        prefix_table = self.prefix_table
+        for match in self.pattern.finditer(text):
+            strip, prefix = prefix_table[match.lastgroup]
+            digits = match.group().translate(PHONE_SEPARATORS_TABLE)
+            phones.add(prefix + digits[strip:])
+
+        return sorted(phones)
+
+
+# מעבר אחד שמסמן רצפי ספרות, תווי @ ומילים בעברית
+ANALYSIS_PATTERN = re.compile(r'(?P<digits>\d+)|(?P<at>@)|(?P<hebrew>[\u0590-\u05FF]+)')
+
+
+class AnalyzedText:
+    """תוצאת ניתוח של טקסט בודד, משותפת לכל מחלצי השדות"""
+
+    __slots__ = ('raw', 'text', 'digit_runs', 'digit_count', 'at_positions', 'hebrew_words', 'street_hits')
+
+    def __init__(self, raw: str, text: str, street_pattern=None):
+        self.raw = raw
+        self.text = text
+        self.digit_runs: List[Tuple[int, int]] = []
+        self.at_positions: List[int] = []
+        self.hebrew_words: List[Tuple[int, int]] = []
+        self.digit_count = 0
+
+        for match in ANALYSIS_PATTERN.finditer(text):
+            kind = match.lastgroup
+            if kind == 'digits':
+                self.digit_runs.append(match.span())
+                self.digit_count += match.end() - match.start()
+            elif kind == 'at':
+                self.at_positions.append(match.start())
+            else:
+                self.hebrew_words.append(match.span())
+
+        self.street_hits: List[Tuple[int, int]] = (
+            [match.span() for match in street_pattern.finditer(text)] if street_pattern else []
+        )
+
+    @property
+    def has_digits(self) -> bool:
+        return bool(self.digit_runs)
+
+    @property
+    def has_at(self) -> bool:
+        return bool(self.at_positions)
+
+
+class TextAnalyzer:
+    """מנתח כל טקסט פעם אחת לכל מסמך: נרמול, ספרות, @, מילים בעברית ורמזי כתובת"""
+
+    def __init__(self, normalizer: TextNormalizer, street_pattern=None):
+        self.normalizer = normalizer
+        self.street_pattern = street_pattern
+        self.memo: Dict[str, AnalyzedText] = {}
+
+    def reset(self) -> None:
+        """מנקה את הזיכרון - נקרא בתחילת כל מסמך"""
+        self.memo.clear()
+        self.normalizer.reset()
+
+    def analyze(self, text: str) -> AnalyzedText:
+        """מחזיר את ניתוח הטקסט, מהזיכרון אם כבר נותח"""
+        analyzed = self.memo.get(text)
+        if analyzed is not None:
+            return analyzed
+
+        analyzed = AnalyzedText(text, self.normalizer.normalize(text), self.street_pattern)
+        if len(self.memo) >= self.normalizer.memo_size:
+            self.memo.clear()
+        self.memo[text] = analyzed
+        return analyzed
+
+
+# מועמדים לכתובת מייל - סריקה אחת מכסה גם תתי-דומיינים (b.co.il) בזכות ה-backtracking
+EMAIL_CANDIDATE_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+EMAIL_BASIC_PATTERN = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+
+# סיומות שאסור שיופיעו באמצע הדומיין (למשל ".com.")
+EMAIL_INNER_TLDS = [
+    'com', 'net', 'org', 'edu', 'gov', 'mil', 'int', 'biz', 'info', 'name', 'pro',
+    'aero', 'coop', 'museum', 'jobs', 'mobi', 'tel', 'travel', 'cat', 'asia', 'post', 'xxx'
+]
+
+# כל כללי הדחייה בתבנית אחת
+EMAIL_REJECT_PATTERN = re.compile(
+    r'(?:example|test|domain)\.com$'      # דומיינים לדוגמה
+    r'|@.*@'                               # יותר מ-@ אחד
+    r'|\.\.'                               # נקודות כפולות
+    r'|^[0-9]+@'                           # חלק מקומי מספרי בלבד
+    r'|\.$|\.@|@\.'                        # נקודה בקצוות
+    r'|\.(?:' + '|'.join(EMAIL_INNER_TLDS) + r')\.'
+)
+
+EMAIL_CACHE_SIZE = 4096
+
+
+class EmailEngine:
+    """מחלץ ומאמת כתובות מייל, עם זיכרון מטמון לתוצאות האימות"""
+
+    def __init__(self, cache_size: int = EMAIL_CACHE_SIZE):
+        # כתובות של רשימות תפוצה חוזרות אלפי פעמים - שומרים את ההכרעה
+        self.is_valid = lru_cache(maxsize=cache_size)(self._validate)
+
+    @staticmethod
+    def _validate(email: str) -> bool:
+        """בודק תקינות כתובת מייל"""
+        # התבנית הבסיסית מאפשרת ASCII בלבד, ולכן אין צורך בבדיקת תווים מיוחדים נפרדת
+        if not EMAIL_BASIC_PATTERN.match(email):
+            return False
+        if EMAIL_REJECT_PATTERN.search(email):
+            return False
+        return 5 <= len(email) <= 254
+
+    def extract(self, text: str) -> List[str]:
+        """מחזיר רשימה ממוינת של כתובות מייל תקינות מהטקסט"""
+        if not text or '@' not in text:
+            return []
+
+        emails = set()
+        is_valid = self.is_valid
+        for match in EMAIL_CANDIDATE_PATTERN.finditer(text):
+            email = match.group().lower()
+            if is_valid(email):
+                emails.add(email)
+
+        return sorted(emails)
+
+
+class KeywordMatcher:
+    """אוטומט Aho-Corasick: מוצא את כל קבוצות מילות המפתח שמופיעות בטקסט במעבר אחד"""
+
+    def __init__(self, vocabularies: Dict[str, Iterable[str]]):
+        # קבוצות מילים מגובבות לבדיקת שייכות של מילה שלמה
+        self.vocabularies: Dict[str, FrozenSet[str]] = {
+            label: frozenset(words) for label, words in vocabularies.items()
+        }
+
+        # בניית עץ המילים (goto) ותוויות הפלט של כל מצב
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[FrozenSet[str]] = [frozenset()]
+        for label, words in self.vocabularies.items():
+            for word in words:
+                state = 0
+                for ch in word:
+                    next_state = self._goto[state].get(ch)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto.append({})
+                        self._output.append(frozenset())
+                        self._goto[state][ch] = next_state
+                    state = next_state
+                self._output[state] = self._output[state] | {label}
+
+        # קישורי כישלון ב-BFS, כולל איחוד הפלט של המצב אליו נופלים
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                self._output[next_state] = self._output[next_state] | self._output[self._fail[next_state]]
+
+    def labels(self, text: str) -> FrozenSet[str]:
+        """מחזיר את כל התוויות שאחת ממילותיהן מופיעה בטקסט כתת-מחרוזת"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = frozenset()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found = found | output[state]
+        return found
+
+    def first(self, text: str, order: Sequence[str]) -> Optional[str]:
+        """מחזיר את התווית הראשונה לפי סדר העדיפות שמופיעה בטקסט"""
+        found = self.labels(text)
+        for label in order:
+            if label in found:
+                return label
+        return None
@@ -0,0 +1,5 @@
+from app import app, warm_up
+
+# נקודת הכניסה לשרת הייצור (gunicorn -c gunicorn.conf.py wsgi:app).
+# הקובץ נטען פעם אחת בתהליך הראשי לפני הפיצול, כך שכל תהליכי השרת מתחילים עם מפענחים ותבניות טעונים
+warm_up()